@@ -8,218 +8,34 @@ tool functions under ``src.tools``.
 from __future__ import annotations
 
 import asyncio
-import inspect
-from typing import Any, Callable, Dict, List
-
-from fastmcp.tools import FunctionTool
-from src.tools.terminology import explain_foundry_term
-from src.tools.design_rules import design_rule_qa
-from src.tools.tapeout import tapeout_checklist
-from src.tools.process import compare_process_nodes
-from src.tools.pdk import pdk_document_guide
-from src.tools.communication import foundry_communication_template
-from src.tools.methodology import design_methodology_guide
-from src.tools.drc_debug import drc_error_guide
-from src.tools.timing_debug import timing_violation_debug
-from src.tools.acronym import acronym_decoder
-
-# Tool registry
-TOOLS: Dict[str, Callable[..., Any]] = {
-    "explain_foundry_term": explain_foundry_term,
-    "design_rule_qa": design_rule_qa,
-    "tapeout_checklist": tapeout_checklist,
-    "compare_process_nodes": compare_process_nodes,
-    "pdk_document_guide": pdk_document_guide,
-    "foundry_communication_template": foundry_communication_template,
-    "design_methodology_guide": design_methodology_guide,
-    "drc_error_guide": drc_error_guide,
-    "timing_violation_debug": timing_violation_debug,
-    "acronym_decoder": acronym_decoder,
-}
-
-# Tool definitions for tools/list
-TOOL_DEFINITIONS: List[Dict[str, Any]] = [
-    {
-        "name": "explain_foundry_term",
-        "description": "반도체 파운드리 관련 전문 용어를 설명합니다.",
-        "inputSchema": {
-            "type": "object",
-            "properties": {
-                "term": {"type": "string", "description": "설명이 필요한 용어"},
-                "foundry": {
-                    "type": "string",
-                    "description": "파운드리 이름 (예: TSMC/Samsung/general)",
-                    "default": "general",
-                },
-                "context": {
-                    "type": "string",
-                    "description": "추가 맥락",
-                    "default": "",
-                },
-            },
-            "required": ["term"],
-        },
-    },
-    {
-        "name": "design_rule_qa",
-        "description": "공정 노드/카테고리별 디자인 룰 Q&A.",
-        "inputSchema": {
-            "type": "object",
-            "properties": {
-                "process_node": {"type": "string"},
-                "rule_category": {"type": "string"},
-                "question": {"type": "string"},
-                "foundry": {"type": "string", "default": "general"},
-            },
-            "required": ["process_node", "rule_category", "question"],
-        },
-    },
-    {
-        "name": "tapeout_checklist",
-        "description": "Tape-out 전 점검 체크리스트를 생성합니다.",
-        "inputSchema": {
-            "type": "object",
-            "properties": {
-                "design_type": {"type": "string"},
-                "process_node": {"type": "string"},
-                "checklist_category": {"type": "string", "default": "all"},
-            },
-            "required": ["design_type", "process_node"],
-        },
-    },
-    {
-        "name": "compare_process_nodes",
-        "description": "두 공정 노드를 주요 관점에서 비교합니다.",
-        "inputSchema": {
-            "type": "object",
-            "properties": {
-                "node1": {"type": "string"},
-                "node2": {"type": "string"},
-                "comparison_aspects": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "default": ["performance", "power", "area", "cost"],
-                },
-            },
-            "required": ["node1", "node2"],
-        },
-    },
-    {
-        "name": "pdk_document_guide",
-        "description": "PDK 문서 타입별 구조와 활용 팁을 안내합니다.",
-        "inputSchema": {
-            "type": "object",
-            "properties": {
-                "document_type": {"type": "string"},
-                "specific_topic": {"type": "string", "default": ""},
-            },
-            "required": ["document_type"],
-        },
-    },
-    {
-        "name": "foundry_communication_template",
-        "description": "FAE 커뮤니케이션 템플릿을 생성합니다.",
-        "inputSchema": {
-            "type": "object",
-            "properties": {
-                "communication_type": {"type": "string"},
-                "context": {"type": "object"},
-            },
-            "required": ["communication_type", "context"],
-        },
-    },
-    {
-        "name": "design_methodology_guide",
-        "description": "공정 분류와 주제별 설계 방법론 가이드를 제공합니다.",
-        "inputSchema": {
-            "type": "object",
-            "properties": {
-                "methodology_topic": {"type": "string"},
-                "process_node": {"type": "string", "default": "advanced"},
-            },
-            "required": ["methodology_topic"],
-        },
-    },
-    {
-        "name": "drc_error_guide",
-        "description": "DRC(Design Rule Check) 에러 유형별 원인 분석과 해결 방법을 제공합니다. spacing, width, enclosure, density, antenna 등의 violation 해결을 안내합니다.",
-        "inputSchema": {
-            "type": "object",
-            "properties": {
-                "error_type": {
-                    "type": "string",
-                    "description": "DRC 에러 유형: spacing, width, enclosure, density, antenna, overlap, extension",
-                    "enum": ["spacing", "width", "enclosure", "density", "antenna", "overlap", "extension"],
-                },
-                "layer": {
-                    "type": "string",
-                    "description": "관련 레이어 (예: M1, VIA1, POLY)",
-                    "default": "general",
-                },
-                "error_description": {
-                    "type": "string",
-                    "description": "추가적인 에러 상황 설명",
-                    "default": "",
-                },
-            },
-            "required": ["error_type"],
-        },
-    },
-    {
-        "name": "timing_violation_debug",
-        "description": "Timing violation 유형별 디버깅 방법과 해결 전략을 제공합니다. setup, hold, max_transition, max_capacitance 등의 violation 해결을 안내합니다.",
-        "inputSchema": {
-            "type": "object",
-            "properties": {
-                "violation_type": {
-                    "type": "string",
-                    "description": "Timing violation 유형: setup, hold, max_transition, max_capacitance, max_fanout, clock_skew, recovery, removal",
-                    "enum": ["setup", "hold", "max_transition", "max_capacitance", "max_fanout", "clock_skew", "recovery", "removal"],
-                },
-                "severity": {
-                    "type": "string",
-                    "description": "심각도: critical, medium, minor",
-                    "enum": ["critical", "medium", "minor"],
-                    "default": "medium",
-                },
-                "context": {
-                    "type": "string",
-                    "description": "추가 상황 설명",
-                    "default": "",
-                },
-            },
-            "required": ["violation_type"],
-        },
-    },
-    {
-        "name": "acronym_decoder",
-        "description": "반도체 업계 약어와 축약어를 해석합니다. 같은 약어도 맥락에 따라 다른 의미를 가질 수 있어 context를 고려하여 설명합니다.",
-        "inputSchema": {
-            "type": "object",
-            "properties": {
-                "acronym": {
-                    "type": "string",
-                    "description": "해석이 필요한 약어 (예: DRC, LVS, OPC, CMP)",
-                },
-                "context": {
-                    "type": "string",
-                    "description": "약어가 사용된 맥락: general, design, foundry, test, package, business",
-                    "enum": ["general", "design", "foundry", "test", "package", "business"],
-                    "default": "general",
-                },
-            },
-            "required": ["acronym"],
-        },
-    },
-]
+import json
+import time
+from typing import Any, AsyncIterator, Callable, Dict, List, Mapping, Optional, Union
+
+from src import metrics, registry
+from src.registry import TOOL_DEFINITIONS, ToolArgumentError  # noqa: F401
+
+# Tool registry (name -> unwrapped callable), derived from src.registry.
+# Tool modules are imported on first access.
+TOOLS: Mapping[str, Callable[..., Any]] = registry.TOOL_FUNCTIONS
+
+# Oldest first; an unsupported requested version is answered with the newest.
+SUPPORTED_PROTOCOL_VERSIONS = ("2024-11-05", "2025-03-26", "2025-06-18")
 
 
 def handle_initialize(request: Dict[str, Any]) -> Dict[str, Any]:
+    requested = (request.get("params") or {}).get("protocolVersion")
+    if requested is None:
+        version = SUPPORTED_PROTOCOL_VERSIONS[0]
+    elif requested in SUPPORTED_PROTOCOL_VERSIONS:
+        version = requested
+    else:
+        version = SUPPORTED_PROTOCOL_VERSIONS[-1]
     return {
         "jsonrpc": "2.0",
         "id": request.get("id"),
         "result": {
-            "protocolVersion": "2024-11-05",
+            "protocolVersion": version,
             "serverInfo": {"name": "design-foundry-mcp", "version": "1.0.0"},
             "capabilities": {"tools": {}},
         },
@@ -227,48 +43,39 @@ def handle_initialize(request: Dict[str, Any]) -> Dict[str, Any]:
 
 
 def handle_tools_list(request: Dict[str, Any]) -> Dict[str, Any]:
+    # The result object is shared so encode_response can splice in its
+    # pre-serialized bytes.
     return {
         "jsonrpc": "2.0",
         "id": request.get("id"),
-        "result": {"tools": TOOL_DEFINITIONS},
+        "result": registry.TOOLS_LIST_RESULT,
     }
 
 
 def _error_response(request_id: Any, code: int, message: str) -> Dict[str, Any]:
+    metrics.ERRORS.labels(str(code)).inc()
     return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
 
 
 async def _call_tool_async(name: str, arguments: Dict[str, Any]) -> Any:
-    tool = TOOLS.get(name)
-    if not tool:
-        raise ValueError(f"Unknown tool: {name}")
-
-    # Extract underlying callable if FastMCP FunctionTool or similar wrapper is provided
-    if isinstance(tool, FunctionTool) and hasattr(tool, "fn"):
-        tool = tool.fn  # type: ignore[assignment]
-    elif hasattr(tool, "fn"):
-        tool = tool.fn  # type: ignore[assignment]
-    elif hasattr(tool, "func"):
-        tool = tool.func  # type: ignore[assignment]
-    elif hasattr(tool, "function"):
-        tool = tool.function  # type: ignore[assignment]
-
-    # Run sync or async functions accordingly.
-    if inspect.iscoroutinefunction(tool):
-        return await tool(**arguments)
-    result = tool(**arguments)
-    if inspect.iscoroutine(result):
-        return await result
-    return result
+    return await registry.call_tool(name, arguments)
 
 
 async def handle_tools_call_async(request: Dict[str, Any]) -> Dict[str, Any]:
     params = request.get("params", {})
+    if not isinstance(params, dict):
+        return _error_response(request.get("id"), -32602, "Invalid params: params must be an object")
     tool_name = params.get("name")
-    arguments = params.get("arguments", {}) or {}
+    arguments = params.get("arguments")
+    if arguments is None:
+        arguments = {}
 
     if not tool_name:
         return _error_response(request.get("id"), -32602, "Missing tool name")
+    if not isinstance(tool_name, str) or tool_name not in registry.REGISTRY:
+        return _error_response(request.get("id"), -32602, f"Invalid params: unknown tool {tool_name!r}")
+    if not isinstance(arguments, dict):
+        return _error_response(request.get("id"), -32602, "Invalid params: arguments must be an object")
 
     try:
         result = await _call_tool_async(tool_name, arguments)
@@ -277,9 +84,12 @@ async def handle_tools_call_async(request: Dict[str, Any]) -> Dict[str, Any]:
             "id": request.get("id"),
             "result": {"content": [{"type": "text", "text": result}]},
         }
+    except ToolArgumentError as exc:
+        return _error_response(request.get("id"), -32602, f"Invalid params: {exc}")
     except Exception as exc:  # noqa: BLE001
         # Log and return user-friendly text instead of failing the call
         print(f"tool execution error for {tool_name}: {exc}")
+        metrics.ERRORS.labels("tool_error").inc()
         return {
             "jsonrpc": "2.0",
             "id": request.get("id"),
@@ -297,13 +107,116 @@ async def handle_tools_call_async(request: Dict[str, Any]) -> Dict[str, Any]:
 
 async def dispatch_async(request: Dict[str, Any]) -> Dict[str, Any]:
     method = request.get("method", "")
-    if method == "initialize":
-        return handle_initialize(request)
-    if method == "tools/list":
-        return handle_tools_list(request)
-    if method == "tools/call":
-        return await handle_tools_call_async(request)
-    return _error_response(request.get("id"), -32601, "Method not found")
+    start = time.perf_counter()
+    try:
+        if method == "initialize":
+            return handle_initialize(request)
+        if method == "ping":
+            return {"jsonrpc": "2.0", "id": request.get("id"), "result": {}}
+        if method == "tools/list":
+            return handle_tools_list(request)
+        if method == "tools/call":
+            return await handle_tools_call_async(request)
+        return _error_response(request.get("id"), -32601, "Method not found")
+    finally:
+        metrics.request_series(method).observe(time.perf_counter() - start)
+
+
+def _is_request(item: Any) -> bool:
+    """Whether ``item`` needs a response (not a notification or a client reply)."""
+    if not isinstance(item, dict):
+        return True  # answered with Invalid Request
+    if "id" not in item:
+        return False
+    # A client's reply to a server request carries result/error but no method.
+    return "method" in item or not ("result" in item or "error" in item)
+
+
+def expects_response(payload: Any) -> bool:
+    """Whether dispatching ``payload`` produces any response body."""
+    if isinstance(payload, list):
+        return not payload or any(_is_request(item) for item in payload)
+    return _is_request(payload)
+
+
+async def _dispatch_batch_item(item: Any) -> Optional[Dict[str, Any]]:
+    """Dispatch one batch element with its own error boundary.
+
+    Returns ``None`` for notifications (elements without an ``id``) and for
+    client responses, which must not produce a response entry per JSON-RPC 2.0.
+    """
+    if not isinstance(item, dict):
+        return _error_response(None, -32600, "Invalid Request")
+    is_notification = not _is_request(item)
+    try:
+        response = await dispatch_async(item)
+    except Exception as exc:  # noqa: BLE001
+        print(f"batch item error for {item.get('method')}: {exc}")
+        response = _error_response(item.get("id"), -32603, str(exc))
+    return None if is_notification else response
+
+
+async def dispatch_batch_async(requests: List[Any]) -> Optional[List[Dict[str, Any]]]:
+    """Dispatch a JSON-RPC 2.0 batch, running every element concurrently.
+
+    Returns ``None`` when the batch contained only notifications so the
+    transport can reply without a body.
+    """
+    results = await asyncio.gather(*(_dispatch_batch_item(item) for item in requests))
+    responses = [r for r in results if r is not None]
+    return responses or None
+
+
+async def dispatch_payload_async(
+    payload: Any,
+) -> Union[Dict[str, Any], List[Dict[str, Any]], None]:
+    """Dispatch a decoded JSON-RPC body: a single request object or a batch array."""
+    if isinstance(payload, list):
+        if not payload:
+            return _error_response(None, -32600, "Invalid Request: empty batch")
+        return await dispatch_batch_async(payload)
+    if not isinstance(payload, dict):
+        return _error_response(None, -32600, "Invalid Request")
+    response = await dispatch_async(payload)
+    return response if _is_request(payload) else None
+
+
+async def iter_payload_async(payload: Any) -> AsyncIterator[Union[Dict[str, Any], List[Dict[str, Any]]]]:
+    """Yield responses for ``payload`` as they complete.
+
+    Batch elements are yielded individually in completion order, so a
+    streaming transport can flush fast answers before slow ones.
+    """
+    if isinstance(payload, list) and payload:
+        for next_done in asyncio.as_completed([_dispatch_batch_item(item) for item in payload]):
+            response = await next_done
+            if response is not None:
+                yield response
+        return
+    response = await dispatch_payload_async(payload)
+    if response is not None:
+        yield response
+
+
+def _encode_one(response: Dict[str, Any]) -> bytes:
+    if response.get("result") is registry.TOOLS_LIST_RESULT:
+        head = json.dumps(
+            {"jsonrpc": "2.0", "id": response.get("id")}, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+        return head[:-1] + b',"result":' + registry.TOOLS_LIST_RESULT_JSON + b"}"
+    return json.dumps(response, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def encode_response(response: Union[Dict[str, Any], List[Dict[str, Any]]]) -> bytes:
+    """Serialize a dispatch result to JSON bytes, reusing pre-serialized tools/list."""
+    start = time.perf_counter()
+    if isinstance(response, list):
+        body = b"[" + b",".join(_encode_one(r) for r in response) + b"]"
+    else:
+        body = _encode_one(response)
+    metrics.SERIALIZE_SECONDS.observe(time.perf_counter() - start)
+    metrics.RESPONSE_BYTES.observe(len(body))
+    return body
 
 
 def dispatch(request: Dict[str, Any]) -> Dict[str, Any]:
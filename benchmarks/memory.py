@@ -0,0 +1,135 @@
+"""Per-worker RSS of the knowledge bases: plain dicts vs compact records.
+
+Each mode runs in a fresh interpreter, like a worker process. The bases in
+``COMPACT_BASES`` are scaled ``--scale`` times (default 10). Every entry is
+copied under ``--scale`` keys through a JSON round trip, the way an external
+knowledge file is parsed. Free text gets a per-copy suffix so that only
+genuinely repeated strings (categories, layer names, step keys) stay
+shared. The report shows the growth from holding the data, in plain dicts
+and after :func:`src.data.compact.compact_base`. It gives RSS (what the
+host pays, in pages) and the live heap traced by ``tracemalloc`` (exact,
+but measured in a second pass because tracing costs memory itself).
+
+    python -m benchmarks.memory --scale 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, List, Tuple
+
+MODES = ("dict", "compact")
+# Strings up to this length are treated as categorical and shared across copies.
+_SHARED_MAX = 16
+
+
+def _rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm") as fh:
+            return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        import resource
+
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _vary(value: Any, copy: int) -> Any:
+    if isinstance(value, str):
+        return value if len(value) <= _SHARED_MAX else f"{value} #{copy}"
+    if isinstance(value, dict):
+        return {key: _vary(item, copy) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_vary(item, copy) for item in value]
+    return value
+
+
+def _scaled(base: Dict[str, Any], scale: int) -> str:
+    """JSON text of ``base`` with every entry repeated ``scale`` times."""
+    return json.dumps(
+        {f"{key}#{copy}" if copy else key: _vary(entry, copy) for copy in range(scale) for key, entry in base.items()},
+        ensure_ascii=False,
+    )
+
+
+def _load(mode: str, texts: Dict[str, str]) -> Dict[str, Any]:
+    from src.data.compact import compact_base
+
+    held: Dict[str, Any] = {}
+    for name, text in texts.items():
+        base = json.loads(text)
+        held[name] = compact_base(name, base) if mode == "compact" else base
+        del base
+    gc.collect()
+    return held
+
+
+def _measure(mode: str, scale: int) -> Dict[str, float]:
+    from src.data.compact import COMPACT_BASES
+    from src.data.knowledge import builtin_knowledge
+
+    texts = {name: _scaled(builtin_knowledge(name), scale) for name in COMPACT_BASES}
+    gc.collect()
+    before = _rss_bytes()
+    start = time.perf_counter()
+    held = _load(mode, texts)
+    elapsed = time.perf_counter() - start
+    rss = _rss_bytes() - before
+    entries = sum(len(base) for base in held.values())
+    # RSS moves in pages and keeps freed arenas; the traced live heap is exact.
+    del held
+    tracemalloc.start()
+    held = _load(mode, texts)
+    heap = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return {"entries": entries, "rss_mb": rss / 2**20, "heap_mb": heap / 2**20, "load_ms": elapsed * 1000}
+
+
+def _run(mode: str, scale: int) -> Dict[str, float]:
+    env = {**os.environ, "MCP_KNOWLEDGE_SNAPSHOT": "off", "MCP_KNOWLEDGE_COMPACT": "off"}
+    proc = subprocess.run(
+        [sys.executable, "-m", "benchmarks.memory", "--child", mode, "--scale", str(scale)],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(proc.stdout)
+
+
+def _format(results: List[Tuple[str, Dict[str, float]]], scale: int) -> str:
+    reference = results[0][1]
+    lines = [
+        f"knowledge bases x{scale}, memory growth per worker",
+        f"{'mode':<10}{'entries':>9}{'RSS MB':>9}{'vs dict':>9}{'heap MB':>9}{'vs dict':>9}{'load ms':>9}",
+    ]
+    for mode, r in results:
+        rss = r["rss_mb"] / reference["rss_mb"] if reference["rss_mb"] > 0 else float("nan")
+        heap = r["heap_mb"] / reference["heap_mb"]
+        lines.append(
+            f"{mode:<10}{r['entries']:>9.0f}{r['rss_mb']:>9.2f}{rss:>9.0%}"
+            f"{r['heap_mb']:>9.2f}{heap:>9.0%}{r['load_ms']:>9.0f}"
+        )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=int, default=10)
+    parser.add_argument("--child", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(_measure(args.child, args.scale)))
+        return
+    print(_format([(mode, _run(mode, args.scale)) for mode in MODES], args.scale))
+
+
+if __name__ == "__main__":
+    main()
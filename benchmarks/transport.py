@@ -0,0 +1,138 @@
+"""Compare the legacy SSE transport with stateless Streamable HTTP.
+
+Starts the ASGI app under uvicorn on a free local port and drives it with
+``--clients`` concurrent MCP client sessions, each issuing ``--calls``
+``tools/call`` requests. For each transport it reports the peak number of
+open TCP connections on the server, and p50/p99 latency per call.
+
+    python -m benchmarks.transport --clients 50 --calls 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import threading
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Tuple
+
+from mcp import ClientSession
+from mcp.client.sse import sse_client
+from mcp.client.streamable_http import streamablehttp_client
+
+ARGUMENTS = [
+    ("acronym_decoder", {"acronym": "DRC"}),
+    ("drc_error_guide", {"error_type": "spacing"}),
+    ("design_rule_qa", {"process_node": "5nm", "rule_category": "metal", "question": "min spacing?"}),
+]
+
+
+class _Server:
+    """uvicorn running ``src.server:app`` in a background thread."""
+
+    def __init__(self) -> None:
+        import uvicorn
+
+        from src.server import app
+
+        self.server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=0, log_level="warning"))
+        self.thread = threading.Thread(target=self.server.run, daemon=True)
+        self.peak_connections = 0
+
+    def __enter__(self) -> "_Server":
+        self.thread.start()
+        while not self.server.started:
+            time.sleep(0.01)
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.server.should_exit = True
+        self.thread.join()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.servers[0].sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    def sample(self) -> None:
+        self.peak_connections = max(self.peak_connections, len(self.server.server_state.connections))
+
+
+@asynccontextmanager
+async def _session(transport: str, url: str) -> AsyncIterator[ClientSession]:
+    if transport == "sse":
+        client = sse_client(f"{url}/sse")
+    else:
+        client = streamablehttp_client(f"{url}/mcp")
+    async with client as streams:
+        async with ClientSession(streams[0], streams[1]) as session:
+            await session.initialize()
+            yield session
+
+
+async def _client(transport: str, url: str, calls: int, ready: asyncio.Barrier, latencies: List[float]) -> None:
+    async with _session(transport, url) as session:
+        await ready.wait()
+        for i in range(calls):
+            name, arguments = ARGUMENTS[i % len(ARGUMENTS)]
+            start = time.perf_counter()
+            await session.call_tool(name, arguments)
+            latencies.append(time.perf_counter() - start)
+        await ready.wait()
+
+
+async def _run(transport: str, server: _Server, clients: int, calls: int) -> Dict[str, float]:
+    server.peak_connections = 0
+    latencies: List[float] = []
+    ready = asyncio.Barrier(clients + 1)
+    tasks = [asyncio.create_task(_client(transport, server.url, calls, ready, latencies)) for _ in range(clients)]
+
+    async def sampler() -> None:
+        while True:
+            server.sample()
+            await asyncio.sleep(0.005)
+
+    sampling = asyncio.create_task(sampler())
+    await ready.wait()
+    start = time.perf_counter()
+    await ready.wait()
+    elapsed = time.perf_counter() - start
+    sampling.cancel()
+    await asyncio.gather(*tasks)
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {
+        "peak_connections": server.peak_connections,
+        "calls_per_s": len(latencies) / elapsed,
+        "p50_ms": quantiles[49] * 1000,
+        "p99_ms": quantiles[98] * 1000,
+    }
+
+
+def _format(results: List[Tuple[str, Dict[str, float]]]) -> str:
+    lines = [f"{'transport':<12}{'peak conns':>12}{'calls/s':>10}{'p50 ms':>10}{'p99 ms':>10}"]
+    for name, r in results:
+        lines.append(
+            f"{name:<12}{r['peak_connections']:>12.0f}{r['calls_per_s']:>10.0f}{r['p50_ms']:>10.2f}{r['p99_ms']:>10.2f}"
+        )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=20)
+    parser.add_argument("--calls", type=int, default=20)
+    args = parser.parse_args()
+
+    with _Server() as server:
+        results = [
+            (transport, asyncio.run(_run(transport, server, args.clients, args.calls)))
+            for transport in ("sse", "streamable")
+        ]
+    print(_format(results))
+
+
+if __name__ == "__main__":
+    main()
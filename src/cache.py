@@ -0,0 +1,201 @@
+"""Shared tool result cache.
+
+Every built-in tool is a pure function of its arguments over static
+knowledge bases, so identical ``tools/call`` requests can be answered from
+memory. The cache is shared by the JSON-RPC fallback (``api.mcp_handler``)
+and the FastMCP SSE transport, bounded by entry count and total UTF-8 bytes,
+and evicts in LRU order. Concurrent identical calls are coalesced so only
+one of them executes the tool.
+
+Keys are the tool name plus a SHA-256 of the canonical arguments, so a
+large argument (``extract_foundry_terms`` text, an inline report) is not
+held in memory by its key. Calls whose canonical arguments exceed
+``MCP_CACHE_MAX_ARG_BYTES`` (default 64 KiB) bypass the cache: such inputs
+rarely repeat, and hashing them on every call buys little.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Iterable, Mapping
+
+from . import metrics
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+def _canonical(arguments: Mapping[str, Any]) -> bytes:
+    return json.dumps(
+        arguments,
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=str,
+    ).encode("utf-8")
+
+
+class ResultCache:
+    """Bounded LRU cache of rendered tool responses with single-flight."""
+
+    def __init__(
+        self, max_entries: int = 512, max_bytes: int = 8 * 1024 * 1024, max_arg_bytes: int = 64 * 1024
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_arg_bytes = max_arg_bytes
+        self._entries: "OrderedDict[str, tuple[str, int]]" = OrderedDict()
+        self._bytes = 0
+        self._inflight: Dict[str, "asyncio.Future[str]"] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self.bypassed = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.max_bytes > 0
+
+    @staticmethod
+    def make_key(name: str, arguments: Mapping[str, Any]) -> str:
+        """Canonical key: ``<tool>:<sha256 of the arguments with sorted keys>``."""
+        return ResultCache._key(name, _canonical(arguments))
+
+    @staticmethod
+    def _key(name: str, payload: bytes) -> str:
+        return f"{name}:{hashlib.sha256(payload).hexdigest()}"
+
+    def get(self, key: str) -> str | None:
+        item = self._entries.get(key)
+        if item is None:
+            return None
+        self._entries.move_to_end(key)
+        return item[0]
+
+    def put(self, key: str, value: str) -> None:
+        size = len(value.encode("utf-8")) + len(key)
+        if size > self.max_bytes:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= old[1]
+        self._entries[key] = (value, size)
+        self._bytes += size
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._bytes -= evicted
+            self.evictions += 1
+
+    async def get_or_compute(
+        self,
+        name: str,
+        arguments: Mapping[str, Any],
+        compute: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Return the cached result for ``name(**arguments)`` or compute it once.
+
+        Only string results are stored; exceptions propagate to every caller
+        waiting on the same in-flight computation and are never cached. If
+        the computing caller is cancelled (client disconnect, timeout), its
+        waiters are not: one of them computes the result instead.
+        """
+        if not self.enabled:
+            return await compute()
+        payload = _canonical(arguments)
+        if len(payload) > self.max_arg_bytes:
+            self.bypassed += 1
+            return await compute()
+
+        key = self._key(name, payload)
+        cached = self.get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        pending = self._inflight.get(key)
+        while pending is not None:
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                task = asyncio.current_task()
+                if not pending.cancelled() or (task is not None and task.cancelling()):
+                    raise
+            # The computing caller was cancelled, not us: retry, taking over
+            # the computation unless another waiter already did.
+            pending = self._inflight.get(key)
+
+        self.misses += 1
+        future: "asyncio.Future[str]" = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await compute()
+        except asyncio.CancelledError:
+            # Drop the key before waking the waiters so one of them recomputes.
+            self._inflight.pop(key, None)
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            # Mark retrieved so an exception with no coalesced waiter is not logged.
+            future.exception()
+            raise
+        else:
+            if isinstance(result, str):
+                self.put(key, result)
+            future.set_result(result)
+            return result
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def discard(self, tools: Iterable[str]) -> int:
+        """Drop the entries of ``tools``; returns how many were removed."""
+        prefixes = tuple(f"{name}:" for name in tools)
+        if not prefixes:
+            return 0
+        stale = [key for key in self._entries if key.startswith(prefixes)]
+        for key in stale:
+            self._bytes -= self._entries.pop(key)[1]
+        return len(stale)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+            "bypassed": self.bypassed,
+        }
+
+
+# Process-wide cache shared by both transports. Set MCP_CACHE_MAX_ENTRIES=0
+# to disable caching.
+RESULT_CACHE = ResultCache(
+    max_entries=_env_int("MCP_CACHE_MAX_ENTRIES", 512),
+    max_bytes=_env_int("MCP_CACHE_MAX_BYTES", 8 * 1024 * 1024),
+    max_arg_bytes=_env_int("MCP_CACHE_MAX_ARG_BYTES", 64 * 1024),
+)
+
+# Exported on /metrics; values are read from stats() at scrape time.
+for _key in ("hits", "misses", "coalesced", "evictions", "bypassed"):
+    metrics.Counter(f"mcp_cache_{_key}_total", f"Result cache {_key}.", fn=lambda key=_key: RESULT_CACHE.stats()[key])
+for _key in ("entries", "bytes"):
+    metrics.Gauge(f"mcp_cache_{_key}", f"Result cache {_key}.", fn=lambda key=_key: RESULT_CACHE.stats()[key])
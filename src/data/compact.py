@@ -0,0 +1,192 @@
+"""Compact in-memory form of the entry-heavy knowledge bases.
+
+The ``*_db`` literals are dicts of dicts and lists. Each entry carries a
+hash table per level, and every repeated category, layer name or step key
+is its own string object. :func:`compact_base` rebuilds the bases in
+:data:`COMPACT_BASES` as follows:
+
+- Entries become frozen ``__slots__`` records, one class per base, with the
+  union of the base's fields.
+- Nested maps become :class:`Table` (parallel key/value tuples). Step maps
+  (``step1``...``stepN``) become :class:`Steps`, already in step order, so
+  formatters do not sort them per call.
+- Lists become tuples.
+- Keys are interned. Equal values share one string object per base.
+
+Records and tables are read-only ``Mapping`` types, so tools keep using
+``entry.get(...)`` and ``entry[...]`` unchanged. :func:`plain` converts
+back to dicts and lists for JSON and for comparisons. ``python -m
+benchmarks.memory`` reports the per-worker RSS saving.
+"""
+
+from __future__ import annotations
+
+import re
+import sys
+from typing import Any, Dict, Iterator, Mapping, Sequence, Tuple, Type
+
+# Base name -> record class name.
+COMPACT_BASES: Dict[str, str] = {
+    "FOUNDRY_TERMINOLOGY": "TermRecord",
+    "SEMICONDUCTOR_ACRONYMS": "AcronymRecord",
+    "DRC_ERRORS_KNOWLEDGE": "DrcErrorRecord",
+    "TIMING_VIOLATIONS_KNOWLEDGE": "TimingViolationRecord",
+}
+STEP_KEY = re.compile(r"step(\d+)")
+
+
+def step_order(key: str) -> Tuple[int, int, str]:
+    """Sort key putting ``step2`` before ``step10``; other keys follow by name."""
+    match = STEP_KEY.fullmatch(key)
+    return (0, int(match.group(1)), "") if match else (1, 0, key)
+
+
+def ordered_steps(steps: Mapping[str, Any]) -> Sequence[Any]:
+    """Values of a step map in step order; free for :class:`Steps`."""
+    if isinstance(steps, Steps):
+        return steps._values
+    return [steps[key] for key in sorted(steps, key=step_order)]
+
+
+def plain(value: Any) -> Any:
+    """Deep copy of ``value`` with records/tables as dicts and tuples as lists."""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, Mapping):
+        return {key: plain(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [plain(item) for item in value]
+    return value
+
+
+class Table(Mapping[str, Any]):
+    """Small frozen map stored as two parallel tuples (linear lookup)."""
+
+    __slots__ = ("_keys", "_values")
+
+    def __init__(self, keys: Tuple[str, ...], values: Tuple[Any, ...]) -> None:
+        object.__setattr__(self, "_keys", keys)
+        object.__setattr__(self, "_values", values)
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._values[self._keys.index(key)]
+        except ValueError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._values[self._keys.index(key)] if key in self._keys else default
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._keys
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Mapping) and plain(self) == plain(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(zip(self._keys, self._values))!r})"
+
+
+class Steps(Table):
+    """A ``stepN`` map whose keys are already in step order."""
+
+    __slots__ = ()
+
+
+class Record(Mapping[str, Any]):
+    """Frozen knowledge entry; subclasses set ``__slots__`` to the base's fields.
+
+    Fields missing from an entry stay unset and read as absent, like the
+    missing dict key they replace.
+    """
+
+    __slots__ = ()
+    _fields: Tuple[str, ...] = ()
+    _names: frozenset = frozenset()
+
+    def __init__(self, entry: Mapping[str, Any]) -> None:
+        for field, value in entry.items():
+            object.__setattr__(self, field, value)
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._names:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                pass
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default) if key in self._names else default
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._names and hasattr(self, key)  # type: ignore[arg-type]
+
+    def __iter__(self) -> Iterator[str]:
+        return (field for field in self._fields if hasattr(self, field))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Mapping) and plain(self) == plain(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self.items())!r})"
+
+
+def record_type(name: str, fields: Tuple[str, ...]) -> Type[Record]:
+    """A :class:`Record` subclass with one slot per field."""
+    fields = tuple(sys.intern(field) for field in fields)
+    namespace = {"__slots__": fields, "__module__": __name__, "_fields": fields, "_names": frozenset(fields)}
+    return type(name, (Record,), namespace)
+
+
+class _Compactor:
+    def __init__(self) -> None:
+        self._strings: Dict[str, str] = {}
+
+    def text(self, value: str) -> str:
+        return self._strings.setdefault(value, value)
+
+    def value(self, value: Any) -> Any:
+        if isinstance(value, str):
+            return self.text(value)
+        if isinstance(value, Mapping):
+            keys = tuple(sys.intern(str(key)) for key in value)
+            if keys and all(STEP_KEY.fullmatch(key) for key in keys):
+                keys = tuple(sorted(keys, key=step_order))
+                return Steps(keys, tuple(self.value(value[key]) for key in keys))
+            return Table(keys, tuple(self.value(item) for item in value.values()))
+        if isinstance(value, (list, tuple)):
+            return tuple(self.value(item) for item in value)
+        return value
+
+
+def compact_base(name: str, base: Mapping[str, Any]) -> Dict[str, Any]:
+    """``base`` with every entry converted to a record of a per-base class."""
+    fields: Dict[str, None] = {}
+    for entry in base.values():
+        fields.update(dict.fromkeys(entry))
+    record = record_type(COMPACT_BASES.get(name, "Record"), tuple(fields))
+    compactor = _Compactor()
+    return {
+        sys.intern(key): record({field: compactor.value(value) for field, value in entry.items()})
+        for key, entry in base.items()
+    }
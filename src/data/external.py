@@ -0,0 +1,230 @@
+"""External knowledge base files.
+
+A directory (``MCP_KNOWLEDGE_DIR``) may hold one file per knowledge base,
+named after it: ``FOUNDRY_TERMINOLOGY.json``, ``TEMPLATES.yaml``, ... A file
+replaces the built-in base of that name as a whole. YAML needs PyYAML,
+which is optional; JSON always works.
+
+Files are checked before they are used. Bases declared with a type in
+their ``*_db`` module (``Dict[str, TermEntry]``,
+``Dict[str, NodeRules]``, ...) are validated against that annotation,
+TypedDicts included. Unannotated bases are checked against the shape of
+the shipped data: the same container types, and per field the type the
+shipped entries use. Unknown fields are rejected either way, since a
+misspelt key would otherwise silently drop out of every answer.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import json
+import typing
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Tuple
+
+from .snapshot import KNOWLEDGE_SOURCES
+
+SUFFIXES = (".json", ".yaml", ".yml")
+_MAX_ERRORS = 20
+
+
+class KnowledgeFileError(ValueError):
+    """Raised when a knowledge file cannot be read or does not match its base."""
+
+    def __init__(self, errors: List[str]) -> None:
+        super().__init__("; ".join(errors[:_MAX_ERRORS]))
+        self.errors = errors
+
+
+def knowledge_files(directory: Path) -> Dict[str, Path]:
+    """``{base name: file}`` for the recognised files in ``directory`` (none if it is missing)."""
+    if not directory.is_dir():
+        return {}
+    names = {name.upper(): name for name in KNOWLEDGE_SOURCES}
+    found: Dict[str, Path] = {}
+    errors: List[str] = []
+    for path in sorted(directory.iterdir()):
+        if path.suffix.lower() not in SUFFIXES or not path.is_file():
+            continue
+        name = names.get(path.stem.upper())
+        if name is None:
+            continue  # unrelated file (README, backups, ...)
+        if name in found:
+            errors.append(f"{name}: both {found[name].name} and {path.name}")
+        found[name] = path
+    if errors:
+        raise KnowledgeFileError(errors)
+    return found
+
+
+def fingerprint(directory: Path) -> Tuple[Tuple[str, int, int], ...]:
+    """Cheap change detector: name, mtime and size of every candidate file."""
+    if not directory.is_dir():
+        return ()
+    entries = []
+    for path in directory.iterdir():
+        if path.suffix.lower() in SUFFIXES:
+            stat = path.stat()
+            entries.append((path.name, stat.st_mtime_ns, stat.st_size))
+    return tuple(sorted(entries))
+
+
+def read_file(path: Path) -> Any:
+    text = path.read_text(encoding="utf-8")
+    if path.suffix.lower() == ".json":
+        try:
+            return json.loads(text)
+        except ValueError as exc:
+            raise KnowledgeFileError([f"{path.name}: invalid JSON: {exc}"]) from None
+    try:
+        import yaml  # optional, and slow to import: only when a YAML file is present
+    except ImportError:
+        raise KnowledgeFileError([f"{path.name}: PyYAML is not installed; use JSON"]) from None
+    try:
+        return yaml.safe_load(text)
+    except yaml.YAMLError as exc:
+        raise KnowledgeFileError([f"{path.name}: invalid YAML: {exc}"]) from None
+
+
+def content_hash(data: Any) -> str:
+    """SHA-256 of the canonical JSON form; formatting and key order do not count."""
+    blob = json.dumps(data, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+# -- validation -------------------------------------------------------------
+
+def _declared_type(name: str) -> Any:
+    module = importlib.import_module(KNOWLEDGE_SOURCES[name])
+    return typing.get_type_hints(module).get(name)
+
+
+def _check(value: Any, tp: Any, path: str, errors: List[str]) -> None:
+    if tp is Any:
+        return
+    origin = typing.get_origin(tp)
+    if typing.is_typeddict(tp):
+        if not isinstance(value, dict):
+            errors.append(f"{path}: expected object, got {type(value).__name__}")
+            return
+        hints = typing.get_type_hints(tp)
+        for key, item in value.items():
+            if key not in hints:
+                errors.append(f"{path}: unknown field `{key}` (allowed: {', '.join(hints)})")
+            else:
+                _check(item, hints[key], f"{path}.{key}", errors)
+        for key in getattr(tp, "__required_keys__", ()):
+            if key not in value:
+                errors.append(f"{path}: missing field `{key}`")
+    elif origin in (dict, Mapping) or tp is dict:
+        if not isinstance(value, dict):
+            errors.append(f"{path}: expected object, got {type(value).__name__}")
+            return
+        _, item_type = typing.get_args(tp) or (str, Any)
+        for key, item in value.items():
+            _check(item, item_type, f"{path}.{key}", errors)
+    elif origin in (list, List) or tp is list:
+        if not isinstance(value, list):
+            errors.append(f"{path}: expected list, got {type(value).__name__}")
+            return
+        (item_type,) = typing.get_args(tp) or (Any,)
+        for i, item in enumerate(value):
+            _check(item, item_type, f"{path}[{i}]", errors)
+    elif origin is typing.Union:
+        for option in typing.get_args(tp):
+            attempt: List[str] = []
+            _check(value, option, path, attempt)
+            if not attempt:
+                return
+        errors.append(f"{path}: matches none of {tp}")
+    elif isinstance(tp, type) and (not isinstance(value, tp) or (tp is int and isinstance(value, bool))):
+        errors.append(f"{path}: expected {tp.__name__}, got {type(value).__name__}")
+
+
+def _field_type(value: Any) -> type:
+    if isinstance(value, Mapping):
+        return dict
+    return list if isinstance(value, (list, tuple)) else type(value)
+
+
+def _fields(entries: typing.Iterable[Any]) -> Dict[str, type]:
+    """Field name -> JSON type, merged over the shipped entries."""
+    fields: Dict[str, type] = {}
+    for entry in entries:
+        if isinstance(entry, Mapping):
+            for key, item in entry.items():
+                fields.setdefault(key, _field_type(item))
+    return fields
+
+
+def _check_like(value: Any, shipped: Any, path: str, errors: List[str]) -> None:
+    """``value`` against the shape of ``shipped``: per-entry container type and field types."""
+    if isinstance(shipped, Mapping):
+        if not isinstance(value, dict):
+            errors.append(f"{path}: expected object, got {type(value).__name__}")
+            return
+        sample = next(iter(shipped.values()), None)
+        fields = _fields(shipped.values()) if isinstance(sample, Mapping) else {}
+        for key, item in value.items():
+            where = f"{path}.{key}"
+            if sample is None:
+                continue
+            if isinstance(sample, Mapping):
+                if not isinstance(item, dict):
+                    errors.append(f"{where}: expected object, got {type(item).__name__}")
+                    continue
+                for field, field_value in item.items():
+                    expected = fields.get(field)
+                    if expected is None:
+                        errors.append(f"{where}: unknown field `{field}` (allowed: {', '.join(fields)})")
+                    elif not isinstance(field_value, expected):
+                        errors.append(f"{where}.{field}: expected {expected.__name__}, got {type(field_value).__name__}")
+                    elif expected is list and not all(isinstance(x, str) for x in field_value):
+                        errors.append(f"{where}.{field}: expected a list of strings")
+            elif isinstance(sample, (list, tuple)):
+                if not isinstance(item, list) or not all(isinstance(x, str) for x in item):
+                    errors.append(f"{where}: expected a list of strings")
+            elif not isinstance(item, type(sample)):
+                errors.append(f"{where}: expected {type(sample).__name__}, got {type(item).__name__}")
+
+
+def validate(name: str, data: Any, shipped: Mapping[str, Any]) -> List[str]:
+    """Problems with ``data`` as a replacement for knowledge base ``name``."""
+    errors: List[str] = []
+    if not isinstance(data, dict) or not data:
+        return [f"{name}: expected a non-empty object at the top level"]
+    declared = _declared_type(name)
+    if declared is not None:
+        _check(data, declared, name, errors)
+    else:
+        _check_like(data, shipped, name, errors)
+    return errors
+
+
+def load_directory(directory: Path, shipped: typing.Callable[[str], Mapping[str, Any]]) -> Dict[str, Tuple[str, Any]]:
+    """``{base name: (content hash, data)}`` for every file in ``directory``.
+
+    All files are read and validated before anything is returned, so a
+    single bad file rejects the whole set. ``shipped(name)`` gives the
+    built-in base used as the reference shape for unannotated bases.
+    """
+    loaded: Dict[str, Tuple[str, Any]] = {}
+    errors: List[str] = []
+    for name, path in knowledge_files(directory).items():
+        try:
+            data = read_file(path)
+        except (OSError, UnicodeDecodeError) as exc:
+            errors.append(f"{path.name}: {exc}")
+            continue
+        except KnowledgeFileError as exc:
+            errors.extend(exc.errors)
+            continue
+        problems = validate(name, data, shipped(name))
+        if problems:
+            errors.extend(f"{path.name}: {problem}" for problem in problems)
+            continue
+        loaded[name] = (content_hash(data), data)
+    if errors:
+        raise KnowledgeFileError(errors)
+    return loaded
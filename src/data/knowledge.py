@@ -0,0 +1,224 @@
+"""Knowledge base accessor used by the tools.
+
+Tools look bases up by name through :func:`get_knowledge` instead of
+importing the ``*_db`` dictionaries directly. When a compiled snapshot
+(see :mod:`src.data.snapshot`) is present and was built from the current
+sources, lookups are served from the memory-mapped file; otherwise the
+Python literals are imported as before.
+
+``MCP_KNOWLEDGE_SNAPSHOT`` overrides the snapshot path; set it to ``off``
+to always use the Python modules.
+
+Without a snapshot, the entry-heavy bases are converted once to the
+compact records of :mod:`src.data.compact`, which replace the module's
+dict literal so the two forms are not both kept. ``MCP_KNOWLEDGE_COMPACT=off``
+keeps the plain dicts. External overrides are compacted the same way.
+
+``MCP_KNOWLEDGE_STORE`` picks the storage backend of the large catalogs.
+``dict`` (the default) keeps them in process as above.
+``sqlite:<path>`` serves the bases that the database holds from a
+:class:`src.data.store.SqliteStore`; the other bases stay as above.
+
+External files (see :mod:`src.data.external`) can replace individual
+bases at runtime through :func:`apply_overrides`. The swap is two
+reference assignments, so a lookup sees either the old or the new version
+of a base, never a mix. :func:`knowledge_version` hashes whatever is active.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import os
+import sys
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Tuple
+
+from .snapshot import DEFAULT_PATH, KNOWLEDGE_SOURCES, KnowledgeSnapshot, SnapshotError, source_fingerprint
+
+if TYPE_CHECKING:
+    from .store import SqliteStore
+
+_ACTIVE: Dict[str, Mapping[str, Any]] = {}
+# Base name -> (content hash, data) of the external files in use.
+_OVERRIDES: Dict[str, Tuple[str, Mapping[str, Any]]] = {}
+_VERSION: str | None = None
+_SNAPSHOT: KnowledgeSnapshot | None = None
+_SNAPSHOT_CHECKED = False
+_STORE: SqliteStore | None = None
+_STORE_CHECKED = False
+# Bases whose module literal was replaced by its compact form.
+_COMPACTED: set = set()
+
+
+def _snapshot() -> KnowledgeSnapshot | None:
+    global _SNAPSHOT, _SNAPSHOT_CHECKED
+    if _SNAPSHOT_CHECKED:
+        return _SNAPSHOT
+    _SNAPSHOT_CHECKED = True
+    setting = os.getenv("MCP_KNOWLEDGE_SNAPSHOT", "")
+    if setting.lower() == "off":
+        return None
+    path = setting or DEFAULT_PATH
+    if not os.path.exists(path):
+        return None
+    # Notices go to stderr: under MCP_TRANSPORT=stdio, stdout is the JSON-RPC channel.
+    try:
+        snap = KnowledgeSnapshot(path)
+    except SnapshotError as exc:
+        print(f"knowledge snapshot ignored: {exc}", file=sys.stderr)
+        return None
+    if not snap.is_current():
+        print(f"knowledge snapshot {path} is stale; rebuild with `python -m src.data.snapshot`", file=sys.stderr)
+        return None
+    _SNAPSHOT = snap
+    return snap
+
+
+def _store() -> SqliteStore | None:
+    global _STORE, _STORE_CHECKED
+    if _STORE_CHECKED:
+        return _STORE
+    _STORE_CHECKED = True
+    setting = os.getenv("MCP_KNOWLEDGE_STORE", "").strip()
+    if setting.lower() in ("", "dict"):
+        return None
+    kind, _, path = setting.partition(":")
+    if kind.lower() != "sqlite" or not path:
+        print(f"unknown knowledge store {setting!r} (use `dict` or `sqlite:<path>`); using dict", file=sys.stderr)
+        return None
+    from .store import SqliteStore, StoreError  # sqlite3 only when configured
+
+    try:
+        _STORE = SqliteStore(path)
+    except StoreError as exc:
+        print(f"knowledge store ignored: {exc}", file=sys.stderr)
+    return _STORE
+
+
+def store_backed(name: str) -> bool:
+    """Whether the SQLite store serves ``name`` (lookups go through ``candidates``)."""
+    return hasattr(get_knowledge(name), "candidates")
+
+
+def get_knowledge(name: str) -> Mapping[str, Any]:
+    """Return the knowledge base ``name`` (e.g. ``"FOUNDRY_TERMINOLOGY"``)."""
+    base = _ACTIVE.get(name)
+    if base is None:
+        store = _store()
+        snap = _snapshot()
+        if name in _OVERRIDES:
+            base = _OVERRIDES[name][1]
+        elif store is not None and name in store.names():
+            base = store.base(name)
+        elif snap is not None and name in snap.names():
+            base = snap.base(name)
+        else:
+            base = _module_base(name)
+        _ACTIVE[name] = base
+    return base
+
+
+def compacting() -> bool:
+    return os.getenv("MCP_KNOWLEDGE_COMPACT", "").strip().lower() != "off"
+
+
+def compacted(name: str, base: Mapping[str, Any]) -> Mapping[str, Any]:
+    """``base`` in compact form when ``name`` is one of the compacted bases."""
+    from .compact import COMPACT_BASES, compact_base
+
+    return compact_base(name, base) if compacting() and name in COMPACT_BASES else base
+
+
+def _module_base(name: str) -> Mapping[str, Any]:
+    module = importlib.import_module(KNOWLEDGE_SOURCES[name])
+    base = getattr(module, name)
+    if name in _COMPACTED or not compacting():
+        return base
+    from .compact import COMPACT_BASES, compact_base
+
+    if name in COMPACT_BASES:
+        base = compact_base(name, base)
+        setattr(module, name, base)  # drop the literal's dicts; readers share the records
+        _COMPACTED.add(name)
+    return base
+
+
+def builtin_knowledge(name: str) -> Mapping[str, Any]:
+    """The shipped base ``name`` as plain dicts and lists, ignoring external overrides."""
+    snap = _snapshot()
+    if snap is not None and name in snap.names():
+        return snap.base(name)
+    base = getattr(importlib.import_module(KNOWLEDGE_SOURCES[name]), name)
+    if name in _COMPACTED:
+        from .compact import plain
+
+        return plain(base)
+    return base
+
+
+def apply_overrides(overrides: Mapping[str, Tuple[str, Mapping[str, Any]]]) -> List[str]:
+    """Make ``{name: (content hash, data)}`` the active external bases.
+
+    Bases not in ``overrides`` go back to the built-in data. Returns the
+    names whose content changed.
+    """
+    global _ACTIVE, _OVERRIDES, _VERSION
+    names = set(_OVERRIDES) | set(overrides)
+    changed = sorted(
+        name for name in names if _OVERRIDES.get(name, ("",))[0] != overrides.get(name, ("",))[0]
+    )
+    active = {name: base for name, base in _ACTIVE.items() if name not in changed}
+    # Overrides first: a lookup between the two assignments misses the old
+    # _ACTIVE entry of a changed base and falls through to the new override.
+    _OVERRIDES = dict(overrides)
+    _ACTIVE = active
+    _VERSION = None
+    return changed
+
+
+def knowledge_version() -> str:
+    """Content hash of the active knowledge: built-in data, store and external overrides."""
+    global _VERSION
+    if _VERSION is None:
+        snap = _snapshot()
+        store = _store()
+        digest = hashlib.sha256(bytes.fromhex(snap.version) if snap is not None else source_fingerprint())
+        if store is not None:
+            digest.update(bytes.fromhex(store.version))
+        for name, content in active_overrides().items():
+            digest.update(f"\0{name}\0{content}".encode("utf-8"))
+        _VERSION = digest.hexdigest()
+    return _VERSION
+
+
+def active_overrides() -> Dict[str, str]:
+    """``{base name: content hash}`` of the external bases in use."""
+    return {name: digest for name, (digest, _) in sorted(_OVERRIDES.items())}
+
+
+def use_snapshot(snapshot: KnowledgeSnapshot | None) -> None:
+    """Switch every base to ``snapshot`` (or back to the Python modules)."""
+    global _SNAPSHOT, _SNAPSHOT_CHECKED, _VERSION
+    _SNAPSHOT = snapshot
+    _SNAPSHOT_CHECKED = True
+    _VERSION = None
+    _ACTIVE.clear()
+
+
+def use_store(store: SqliteStore | None) -> None:
+    """Serve the bases in ``store`` from it (or go back to the dict backend).
+
+    Indexes the tools built from the previous backend are not cleared here;
+    see :func:`src.reload.invalidate`.
+    """
+    global _STORE, _STORE_CHECKED, _VERSION
+    _STORE = store
+    _STORE_CHECKED = True
+    _VERSION = None
+    _ACTIVE.clear()
+
+
+def snapshot_version() -> str | None:
+    """Content hash of the active snapshot, or ``None`` when serving modules."""
+    snap = _snapshot()
+    return snap.version if snap is not None else None
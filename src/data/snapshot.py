@@ -0,0 +1,325 @@
+"""Compiled, memory-mapped knowledge snapshot.
+
+``python -m src.data.snapshot [output]`` compiles every knowledge base in
+:data:`KNOWLEDGE_SOURCES` into one versioned binary file. Workers open it
+with ``mmap`` so all processes on a host share a single physical copy, and
+entries are decoded only when looked up; no Python source is parsed.
+
+Layout (little endian, all offsets absolute)::
+
+    header       magic "DFKS", format u16, reserved u16, n_strings u32,
+                 n_bases u32, source sha256 (32B), content sha256 (32B)
+    strings      (n_strings + 1) x u32 offsets, then the UTF-8 blob.
+                 Every key and value string is stored once (interned).
+    bases        n_bases x (name sid u32, n_entries u32, entries offset u32)
+    entries      per base: n_entries x (key sid u32, value offset u32) in
+                 source order, then n_entries x u32 positions sorted by key
+                 bytes for binary search
+    values       tagged tree: str(sid) / list / dict / int / float / bool / null
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import mmap
+import os
+import struct
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, Tuple
+
+MAGIC = b"DFKS"
+FORMAT_VERSION = 1
+
+# Knowledge base name -> defining module under src/data.
+KNOWLEDGE_SOURCES: Dict[str, str] = {
+    "FOUNDRY_TERMINOLOGY": "src.data.terminology_db",
+    "DESIGN_RULES_KNOWLEDGE": "src.data.design_rules_db",
+    "SEMICONDUCTOR_ACRONYMS": "src.data.acronyms_db",
+    "DRC_ERRORS_KNOWLEDGE": "src.data.drc_errors_db",
+    "TIMING_VIOLATIONS_KNOWLEDGE": "src.data.timing_violations_db",
+    "CHECKLIST_ITEMS": "src.data.checklist_db",
+    "CATEGORY_ALIASES": "src.data.checklist_db",
+    "TEMPLATES": "src.data.templates_db",
+}
+
+DEFAULT_PATH = Path(__file__).with_name("knowledge.snapshot")
+
+_HEADER = struct.Struct("<4sHHII32s32s")
+_U32 = struct.Struct("<I")
+_PAIR = struct.Struct("<II")
+_TRIPLE = struct.Struct("<III")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+
+_T_STR, _T_LIST, _T_DICT, _T_INT, _T_FLOAT, _T_TRUE, _T_FALSE, _T_NULL = range(8)
+
+
+class SnapshotError(ValueError):
+    """Raised when a snapshot file is missing, corrupt, or of another format."""
+
+
+def source_fingerprint() -> bytes:
+    """SHA-256 over the raw bytes of the source modules (read, not parsed)."""
+    digest = hashlib.sha256()
+    for module in sorted(set(KNOWLEDGE_SOURCES.values())):
+        path = Path(__file__).parent / (module.rsplit(".", 1)[1] + ".py")
+        try:
+            digest.update(path.read_bytes())
+        except OSError:
+            return b"\0" * 32
+    return digest.digest()
+
+
+def _load_sources() -> Dict[str, Mapping[str, Any]]:
+    return {
+        name: getattr(importlib.import_module(module), name)
+        for name, module in KNOWLEDGE_SOURCES.items()
+    }
+
+
+class _Builder:
+    def __init__(self) -> None:
+        self.strings: Dict[str, int] = {}
+        self.values = bytearray()
+
+    def sid(self, text: str) -> int:
+        sid = self.strings.get(text)
+        if sid is None:
+            sid = self.strings[text] = len(self.strings)
+        return sid
+
+    def encode(self, value: Any) -> None:
+        out = self.values
+        if isinstance(value, str):
+            out.append(_T_STR)
+            out += _U32.pack(self.sid(value))
+        elif isinstance(value, Mapping):
+            out.append(_T_DICT)
+            out += _U32.pack(len(value))
+            for key, item in value.items():
+                out += _U32.pack(self.sid(str(key)))
+                self.encode(item)
+        elif isinstance(value, (list, tuple)):
+            out.append(_T_LIST)
+            out += _U32.pack(len(value))
+            for item in value:
+                self.encode(item)
+        elif value is True:
+            out.append(_T_TRUE)
+        elif value is False:
+            out.append(_T_FALSE)
+        elif value is None:
+            out.append(_T_NULL)
+        elif isinstance(value, int):
+            out.append(_T_INT)
+            out += _I64.pack(value)
+        elif isinstance(value, float):
+            out.append(_T_FLOAT)
+            out += _F64.pack(value)
+        else:
+            raise TypeError(f"unsupported snapshot value: {type(value).__name__}")
+
+
+def build_snapshot(bases: Mapping[str, Mapping[str, Any]] | None = None) -> bytes:
+    """Compile knowledge bases (default: every :data:`KNOWLEDGE_SOURCES` entry)."""
+    bases = _load_sources() if bases is None else bases
+    builder = _Builder()
+    directory: List[Tuple[int, List[Tuple[int, str, int]]]] = []
+    for name, base in bases.items():
+        entries = []
+        for key, value in base.items():
+            rel = len(builder.values)
+            builder.encode(value)
+            entries.append((builder.sid(key), key, rel))
+        directory.append((builder.sid(name), entries))
+
+    strings = list(builder.strings)
+    blobs = [s.encode("utf-8") for s in strings]
+    strings_at = _HEADER.size
+    blob_at = strings_at + _U32.size * (len(blobs) + 1)
+    bases_at = blob_at + sum(len(b) for b in blobs)
+    entries_at = bases_at + _TRIPLE.size * len(directory)
+    values_at = entries_at + sum((_PAIR.size + _U32.size) * len(e) for _, e in directory)
+
+    body = bytearray()
+    offset = 0
+    for blob in blobs:
+        body += _U32.pack(offset)
+        offset += len(blob)
+    body += _U32.pack(offset)
+    for blob in blobs:
+        body += blob
+
+    cursor = entries_at
+    for name_sid, entries in directory:
+        body += _TRIPLE.pack(name_sid, len(entries), cursor)
+        cursor += (_PAIR.size + _U32.size) * len(entries)
+    for _, entries in directory:
+        for key_sid, _key, rel in entries:
+            body += _PAIR.pack(key_sid, values_at + rel)
+        order = sorted(range(len(entries)), key=lambda i: entries[i][1].encode("utf-8"))
+        for position in order:
+            body += _U32.pack(position)
+    body += builder.values
+
+    header = _HEADER.pack(
+        MAGIC,
+        FORMAT_VERSION,
+        0,
+        len(strings),
+        len(directory),
+        source_fingerprint(),
+        hashlib.sha256(body).digest(),
+    )
+    return header + bytes(body)
+
+
+def write_snapshot(path: Path | str = DEFAULT_PATH) -> Path:
+    path = Path(path)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(build_snapshot())
+    os.replace(tmp, path)
+    return path
+
+
+class KnowledgeSnapshot:
+    """Read-only view over a memory-mapped snapshot file."""
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        try:
+            with open(self.path, "rb") as fh:
+                self._mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as exc:
+            raise SnapshotError(f"cannot map snapshot {self.path}: {exc}") from exc
+        if len(self._mm) < _HEADER.size:
+            raise SnapshotError(f"truncated snapshot: {self.path}")
+        magic, version, _, n_strings, n_bases, source_sha, content_sha = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise SnapshotError(f"unsupported snapshot format in {self.path}")
+        self.source_sha256 = source_sha
+        self.version = content_sha.hex()
+        self._blob_at = _HEADER.size + _U32.size * (n_strings + 1)
+        bases_at = self._blob_at + _U32.unpack_from(self._mm, _HEADER.size + _U32.size * n_strings)[0]
+        self._bases: Dict[str, SnapshotMapping] = {}
+        for i in range(n_bases):
+            name_sid, count, entries_at = _TRIPLE.unpack_from(self._mm, bases_at + _TRIPLE.size * i)
+            name = self.string(name_sid)
+            self._bases[name] = SnapshotMapping(self, name, count, entries_at)
+
+    def is_current(self) -> bool:
+        """True when the snapshot was built from the source modules on disk."""
+        return self.source_sha256 == source_fingerprint()
+
+    def names(self) -> List[str]:
+        return list(self._bases)
+
+    def base(self, name: str) -> "SnapshotMapping":
+        return self._bases[name]
+
+    def string_bytes(self, sid: int) -> bytes:
+        start, end = _PAIR.unpack_from(self._mm, _HEADER.size + _U32.size * sid)
+        return self._mm[self._blob_at + start:self._blob_at + end]
+
+    def string(self, sid: int) -> str:
+        return self.string_bytes(sid).decode("utf-8")
+
+    def decode(self, offset: int) -> Any:
+        return self._decode(offset)[0]
+
+    def _decode(self, offset: int) -> Tuple[Any, int]:
+        mm = self._mm
+        tag = mm[offset]
+        offset += 1
+        if tag == _T_STR:
+            return self.string(_U32.unpack_from(mm, offset)[0]), offset + 4
+        if tag == _T_DICT:
+            count = _U32.unpack_from(mm, offset)[0]
+            offset += 4
+            result: Dict[str, Any] = {}
+            for _ in range(count):
+                key = self.string(_U32.unpack_from(mm, offset)[0])
+                result[key], offset = self._decode(offset + 4)
+            return result, offset
+        if tag == _T_LIST:
+            count = _U32.unpack_from(mm, offset)[0]
+            offset += 4
+            items = []
+            for _ in range(count):
+                item, offset = self._decode(offset)
+                items.append(item)
+            return items, offset
+        if tag == _T_INT:
+            return _I64.unpack_from(mm, offset)[0], offset + 8
+        if tag == _T_FLOAT:
+            return _F64.unpack_from(mm, offset)[0], offset + 8
+        if tag == _T_TRUE:
+            return True, offset
+        if tag == _T_FALSE:
+            return False, offset
+        if tag == _T_NULL:
+            return None, offset
+        raise SnapshotError(f"corrupt value tag {tag} at {offset - 1}")
+
+
+class SnapshotMapping(Mapping[str, Any]):
+    """One knowledge base inside a snapshot, with dict-like lookups.
+
+    Keys are found by binary search over the sorted position table, and the
+    value tree is decoded from the mapped pages on each lookup.
+    """
+
+    def __init__(self, snapshot: KnowledgeSnapshot, name: str, count: int, entries_at: int) -> None:
+        self._snap = snapshot
+        self.name = name
+        self._count = count
+        self._entries_at = entries_at
+        self._order_at = entries_at + _PAIR.size * count
+
+    def _entry(self, position: int) -> Tuple[int, int]:
+        return _PAIR.unpack_from(self._snap._mm, self._entries_at + _PAIR.size * position)
+
+    def _find(self, key: str) -> int:
+        target = key.encode("utf-8")
+        lo, hi = 0, self._count
+        mm = self._snap._mm
+        while lo < hi:
+            mid = (lo + hi) // 2
+            position = _U32.unpack_from(mm, self._order_at + _U32.size * mid)[0]
+            probe = self._snap.string_bytes(self._entry(position)[0])
+            if probe < target:
+                lo = mid + 1
+            elif probe > target:
+                hi = mid
+            else:
+                return position
+        return -1
+
+    def __getitem__(self, key: str) -> Any:
+        position = self._find(key) if isinstance(key, str) else -1
+        if position < 0:
+            raise KeyError(key)
+        return self._snap.decode(self._entry(position)[1])
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._find(key) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        for position in range(self._count):
+            yield self._snap.string(self._entry(position)[0])
+
+    def __len__(self) -> int:
+        return self._count
+
+
+def main(argv: List[str] | None = None) -> None:
+    args = sys.argv[1:] if argv is None else argv
+    path = write_snapshot(args[0] if args else DEFAULT_PATH)
+    snap = KnowledgeSnapshot(path)
+    print(f"wrote {path} ({path.stat().st_size} bytes, version {snap.version[:12]})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+"""SQLite storage backend for the large knowledge bases.
+
+The default backend keeps every base in process (the snapshot or the
+Python modules, see :mod:`src.data.knowledge`). That is right for the
+shipped data. A full glossary with tens of thousands of terms costs
+hundreds of MB per worker that way, so
+``MCP_KNOWLEDGE_STORE=sqlite:<path>`` serves the bases in
+:data:`STORE_BASES` from a local database instead::
+
+    python -m src.data.store glossary.db [knowledge_dir]
+
+The command compiles the shipped bases into ``glossary.db``. Files in
+``knowledge_dir`` replace the bases of the same name first; they use the
+format and validation of :mod:`src.data.external`.
+
+A store has the same interface as a snapshot: ``names()``, ``base(name)``
+and ``version``. Each base is a read-only ``Mapping``. Its lookups use the
+primary key, and its values are JSON decoded on demand, with a small LRU
+of recent entries. Bases listed in :data:`SEARCH_FIELDS` also get
+``candidates(query)``. It returns the alias and hint texts that
+``FuzzyIndex`` would consider for ``query``. These come from an exact
+lookup on normalized aliases plus an FTS5 trigram query ranked by bm25,
+so the tools re-rank a few dozen rows instead of holding a near-miss
+index over the whole catalog.
+
+Every query is one of the SQL constants below. ``sqlite3`` caches
+prepared statements per connection keyed by SQL text, so each statement
+is compiled once per thread. Connections are read-only and per thread,
+because the event loop and the ``to_thread`` warm-ups both read.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Tuple
+
+from ..search.fuzzy import normalize
+
+FORMAT_VERSION = 1
+# Bases worth moving out of process: the catalogs that grow with the glossary.
+STORE_BASES = ("FOUNDRY_TERMINOLOGY", "SEMICONDUCTOR_ACRONYMS", "DESIGN_RULES_KNOWLEDGE")
+# Base -> (alias fields, hint fields) indexed for near-miss search, as in the
+# tools' in-memory FuzzyIndex: the key and aliases may resolve exactly, hints only rank.
+SEARCH_FIELDS: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {
+    "FOUNDRY_TERMINOLOGY": (("full_name",), ("related_terms",)),
+    "SEMICONDUCTOR_ACRONYMS": (("full_name",), ()),
+}
+# Rows handed to FuzzyIndex per query (its own candidate limit is 48).
+CANDIDATES = 48
+VALUE_CACHE = 512
+_ALIAS, _HINT = 0, 1
+
+_SCHEMA = """
+CREATE TABLE meta (name TEXT PRIMARY KEY, value TEXT NOT NULL) WITHOUT ROWID;
+CREATE TABLE bases (name TEXT PRIMARY KEY, count INTEGER NOT NULL) WITHOUT ROWID;
+CREATE TABLE entries (
+    base TEXT NOT NULL, key TEXT NOT NULL, pos INTEGER NOT NULL, value TEXT NOT NULL,
+    PRIMARY KEY (base, key)
+) WITHOUT ROWID;
+CREATE UNIQUE INDEX entries_order ON entries (base, pos);
+CREATE TABLE aliases (
+    base TEXT NOT NULL, norm TEXT NOT NULL, text TEXT NOT NULL, key TEXT NOT NULL,
+    PRIMARY KEY (base, norm, key)
+) WITHOUT ROWID;
+CREATE VIRTUAL TABLE search USING fts5(
+    norm, text UNINDEXED, base UNINDEXED, key UNINDEXED, kind UNINDEXED, tokenize = 'trigram'
+);
+"""
+_GET = "SELECT value FROM entries WHERE base = ? AND key = ?"
+_HAS = "SELECT 1 FROM entries WHERE base = ? AND key = ?"
+_KEYS = "SELECT key FROM entries WHERE base = ? ORDER BY pos"
+_EXACT = "SELECT text, key FROM aliases WHERE base = ? AND norm = ?"
+_MATCH = "SELECT text, key, kind FROM search WHERE search MATCH ? AND base = ? ORDER BY rank LIMIT ?"
+_STATEMENTS = (_GET, _HAS, _KEYS, _EXACT, _MATCH)
+
+
+class StoreError(ValueError):
+    """Raised when a store database is missing, unreadable, or of another format."""
+
+
+def _texts(entry: Any, fields: Iterable[str]) -> Iterator[str]:
+    for field in fields:
+        value = entry.get(field) if isinstance(entry, Mapping) else None
+        if isinstance(value, str):
+            yield value
+        elif isinstance(value, list):
+            yield from (item for item in value if isinstance(item, str))
+
+
+def _padded(norm: str) -> str:
+    """``norm`` padded like FuzzyIndex trigrams, so short texts and word starts match too."""
+    return f"  {norm} "
+
+
+def _match_queries(norm: str) -> Iterator[str]:
+    """FTS5 queries OR-ing the trigrams of ``norm`` (quoted, so none is an operator).
+
+    Inner trigrams come first. The padded edge trigrams (``"  d"``, ``"dr "``)
+    match a large share of any catalog and make the bm25 ranking costly, so
+    they are only tried when the inner ones find nothing or there are none.
+    """
+    padded = _padded(norm)
+    grams = list(dict.fromkeys(padded[i:i + 3] for i in range(len(padded) - 2)))
+    inner = [gram for gram in grams if " " not in gram]
+    for group in (inner, grams) if inner else (grams,):
+        yield " OR ".join(f'"{gram}"' for gram in group)
+
+
+def content_version(bases: Mapping[str, Mapping[str, Any]]) -> str:
+    """SHA-256 over the bases' canonical JSON, independent of file layout."""
+    digest = hashlib.sha256()
+    for name in sorted(bases):
+        blob = json.dumps(bases[name], sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+        digest.update(f"\0{name}\0".encode("utf-8"))
+        digest.update(hashlib.sha256(blob.encode("utf-8")).digest())
+    return digest.hexdigest()
+
+
+def build_store(path: Path | str, bases: Mapping[str, Mapping[str, Any]]) -> Path:
+    """Write ``bases`` to a new SQLite store at ``path`` (replacing it atomically)."""
+    path = Path(path)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.unlink(missing_ok=True)
+    conn = sqlite3.connect(tmp)
+    try:
+        try:
+            conn.executescript(_SCHEMA)
+        except sqlite3.OperationalError as exc:
+            raise StoreError(f"SQLite {sqlite3.sqlite_version} lacks FTS5 trigram support: {exc}") from exc
+        with conn:
+            conn.execute("INSERT INTO meta VALUES ('format', ?)", (str(FORMAT_VERSION),))
+            conn.execute("INSERT INTO meta VALUES ('version', ?)", (content_version(bases),))
+            for name, base in bases.items():
+                conn.execute("INSERT INTO bases VALUES (?, ?)", (name, len(base)))
+                conn.executemany(
+                    "INSERT INTO entries VALUES (?, ?, ?, ?)",
+                    (
+                        (name, key, pos, json.dumps(value, ensure_ascii=False, separators=(",", ":")))
+                        for pos, (key, value) in enumerate(base.items())
+                    ),
+                )
+                if name in SEARCH_FIELDS:
+                    _index(conn, name, base, *SEARCH_FIELDS[name])
+        conn.execute("VACUUM")
+    finally:
+        conn.close()
+    os.replace(tmp, path)
+    return path
+
+
+def _index(
+    conn: sqlite3.Connection,
+    name: str,
+    base: Mapping[str, Any],
+    aliases: Tuple[str, ...],
+    hints: Tuple[str, ...],
+) -> None:
+    alias_rows = set()
+    search_rows = set()
+    for key, entry in base.items():
+        for kind, texts in ((_ALIAS, [key, *_texts(entry, aliases)]), (_HINT, _texts(entry, hints))):
+            for text in texts:
+                norm = normalize(text)
+                if not norm:
+                    continue
+                if kind == _ALIAS:
+                    alias_rows.add((name, norm, text, key))
+                search_rows.add((_padded(norm), text, name, key, kind))
+    conn.executemany("INSERT OR IGNORE INTO aliases VALUES (?, ?, ?, ?)", sorted(alias_rows))
+    conn.executemany("INSERT INTO search VALUES (?, ?, ?, ?, ?)", sorted(search_rows))
+
+
+class SqliteStore:
+    """Read-only knowledge bases served from a store database."""
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        if not self.path.is_file():
+            raise StoreError(f"no knowledge store at {self.path}")
+        self._local = threading.local()
+        try:
+            meta = dict(self._conn().execute("SELECT name, value FROM meta"))
+            counts = dict(self._conn().execute("SELECT name, count FROM bases"))
+        except sqlite3.DatabaseError as exc:
+            raise StoreError(f"cannot read knowledge store {self.path}: {exc}") from exc
+        if meta.get("format") != str(FORMAT_VERSION):
+            raise StoreError(f"unsupported knowledge store format in {self.path}")
+        self.version: str = meta["version"]
+        self._bases = {name: StoreMapping(self, name, count) for name, count in counts.items()}
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                f"{self.path.resolve().as_uri()}?mode=ro",
+                uri=True,
+                cached_statements=2 * len(_STATEMENTS),
+            )
+            self._local.conn = conn
+        return conn
+
+    def execute(self, sql: str, params: Tuple[Any, ...]) -> sqlite3.Cursor:
+        return self._conn().execute(sql, params)
+
+    def names(self) -> List[str]:
+        return list(self._bases)
+
+    def base(self, name: str) -> "StoreMapping":
+        return self._bases[name]
+
+
+class StoreMapping(Mapping[str, Any]):
+    """One knowledge base inside a store, with dict-like lookups."""
+
+    def __init__(self, store: SqliteStore, name: str, count: int) -> None:
+        self._store = store
+        self.name = name
+        self._count = count
+        self._get = lru_cache(maxsize=VALUE_CACHE)(self._load)
+
+    def _load(self, key: str) -> Any:
+        row = self._store.execute(_GET, (self.name, key)).fetchone()
+        if row is None:
+            raise KeyError(key)
+        return json.loads(row[0])
+
+    def __getitem__(self, key: str) -> Any:
+        if not isinstance(key, str):
+            raise KeyError(key)
+        return self._get(key)
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._store.execute(_HAS, (self.name, key)).fetchone() is not None
+
+    def __iter__(self) -> Iterator[str]:
+        for (key,) in self._store.execute(_KEYS, (self.name,)):
+            yield key
+
+    def __len__(self) -> int:
+        return self._count
+
+    def candidates(self, query: str) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+        """``(aliases, hints)`` as ``(text, key)`` pairs worth ranking for ``query``."""
+        norm = normalize(query)
+        aliases: List[Tuple[str, str]] = []
+        hints: List[Tuple[str, str]] = []
+        if not norm:
+            return aliases, hints
+        aliases.extend(self._store.execute(_EXACT, (self.name, norm)))
+        if aliases:
+            return aliases, hints  # FuzzyIndex resolves exact alias hits without ranking
+        for query in _match_queries(norm):
+            for text, key, kind in self._store.execute(_MATCH, (query, self.name, CANDIDATES)):
+                (aliases if kind == _ALIAS else hints).append((text, key))
+            if aliases or hints:
+                break
+        return aliases, hints
+
+
+def main(argv: List[str] | None = None) -> None:
+    from . import external
+    from .knowledge import builtin_knowledge
+
+    args = sys.argv[1:] if argv is None else argv
+    if not args:
+        raise SystemExit("usage: python -m src.data.store OUTPUT.db [KNOWLEDGE_DIR]")
+    bases: Dict[str, Mapping[str, Any]] = {name: builtin_knowledge(name) for name in STORE_BASES}
+    if len(args) > 1:
+        try:
+            loaded = external.load_directory(Path(args[1]), builtin_knowledge)
+        except external.KnowledgeFileError as exc:
+            raise SystemExit("\n".join(exc.errors)) from None
+        bases.update((name, data) for name, (_, data) in loaded.items() if name in STORE_BASES)
+    path = build_store(args[0], bases)
+    store = SqliteStore(path)
+    counts = ", ".join(f"{name} {len(store.base(name))}" for name in store.names())
+    print(f"wrote {path} ({path.stat().st_size} bytes, {counts}, version {store.version[:12]})")
+
+
+if __name__ == "__main__":
+    main()
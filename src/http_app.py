@@ -0,0 +1,229 @@
+"""HTTP side of the server: FastMCP, SSE and the Starlette app.
+
+Imported only by the HTTP transports (``python -m src.server`` with the
+default ``MCP_TRANSPORT=sse``, ``uvicorn src.server:app`` and
+``api/index.py``); the stdio transport uses :mod:`src.stdio` instead.
+"""
+
+from __future__ import annotations
+
+import warnings
+from typing import Any, Iterable
+
+from fastmcp import FastMCP, settings as mcp_settings
+from fastmcp.tools import Tool
+from fastmcp.tools.tool import ToolResult
+from mcp.server.sse import SseServerTransport
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Mount, Route
+from starlette.requests import Request
+from starlette.responses import Response, StreamingResponse
+
+from . import metrics, profiling, registry, reload, startup
+from .cache import RESULT_CACHE
+
+# Suppress noisy deprecation warnings from vendored websockets in uvicorn
+warnings.filterwarnings(
+    "ignore",
+    category=DeprecationWarning,
+    module=r"_vendor\.websockets\.legacy.*",
+)
+warnings.filterwarnings(
+    "ignore",
+    category=DeprecationWarning,
+    module=r"_vendor\.uvicorn\.protocols\.websockets\.websockets_impl",
+)
+# Also suppress upstream module paths (non-vendored) that Vercel might use
+warnings.filterwarnings(
+    "ignore",
+    category=DeprecationWarning,
+    module=r"websockets\.legacy.*",
+)
+warnings.filterwarnings(
+    "ignore",
+    category=DeprecationWarning,
+    module=r"uvicorn\.protocols\.websockets\.websockets_impl",
+)
+
+class RegistryTool(Tool):
+    """FastMCP tool that dispatches through :mod:`src.registry`.
+
+    Arguments are validated by the registry's precompiled validator and the
+    result goes through the shared cache, exactly as on the JSON-RPC path.
+    """
+
+    async def run(self, arguments: dict[str, Any]) -> ToolResult:
+        return ToolResult(content=await registry.call_tool(self.name, arguments))
+
+
+def create_server(extra_tools: Iterable[Any] | None = None) -> FastMCP:
+    """Create and configure the MCP server instance.
+
+    Parameters
+    ----------
+    extra_tools:
+        Optional iterable of callables decorated with ``@server.tool`` that
+        should be registered in addition to the built-in tool set. Useful for
+        testing or extensions.
+    """
+
+    server = FastMCP(name="design-foundry-mcp")
+
+    for tool in registry.REGISTRY.values():
+        server.add_tool(
+            RegistryTool(name=tool.name, description=tool.description, parameters=tool.input_schema)
+        )
+
+    if extra_tools:
+        for tool in extra_tools:
+            server.add_tool(tool)
+
+    return server
+
+
+def create_app(server: FastMCP | None = None) -> Starlette:
+    """Create Starlette app that bridges FastMCP over SSE and JSON RPC.
+
+    ``server`` backs the ``/sse`` transport; a new one from
+    :func:`create_server` is used when omitted.
+
+    Provides:
+    - GET /          : status JSON (result cache, active knowledge version)
+    - POST /         : JSON-RPC (initialize/tools.list/tools.call) via mcp_handler,
+                       single request object or JSON-RPC 2.0 batch array
+    - POST /mcp      : MCP Streamable HTTP (stateless, no session id); replies
+                       as an SSE-framed chunked stream when the client accepts
+                       ``text/event-stream``, otherwise as JSON
+    - GET /health    : health check
+    - GET /metrics   : Prometheus metrics (see src/metrics.py)
+    - GET /debug/profiles: per-request profiles, only with MCP_PROFILE_DIR
+                       set (see src/profiling.py)
+    - GET /sse       : MCP SSE stream
+    - POST /messages/: MCP SSE message endpoint
+    """
+
+    if server is None:
+        server = create_server()
+    sse = SseServerTransport("/messages/")
+
+    async def handle_sse(request: Request):
+        metrics.SSE_SESSIONS.inc()
+        try:
+            async with sse.connect_sse(
+                request.scope, request.receive, request._send
+            ) as streams:
+                await server._mcp_server.run(  # type: ignore[attr-defined]
+                    streams[0],
+                    streams[1],
+                    server._mcp_server.create_initialization_options(),  # type: ignore[attr-defined]
+                )
+        finally:
+            metrics.SSE_SESSIONS.dec()
+        # The stream already sent the response; Starlette still expects one back.
+        return Response()
+
+    def _parse_error(exc: Exception) -> JSONResponse:
+        metrics.ERRORS.labels("-32700").inc()
+        return JSONResponse(
+            {"jsonrpc": "2.0", "id": None, "error": {"code": -32700, "message": f"Parse error: {exc}"}},
+            status_code=400,
+        )
+
+    def _internal_error(payload: Any, exc: Exception) -> dict[str, Any]:
+        # log and return structured error
+        print("mcp-http error", exc)
+        metrics.ERRORS.labels("-32603").inc()
+        return {
+            "jsonrpc": "2.0",
+            "id": payload.get("id") if isinstance(payload, dict) else None,
+            "error": {"code": -32603, "message": str(exc)},
+        }
+
+    async def streamable_http_handler(request: Request):
+        if request.method != "POST":
+            # Stateless: no server-initiated stream (GET) and no session to end (DELETE).
+            return Response(status_code=405, headers={"Allow": "POST"})
+        try:
+            payload = await request.json()
+        except Exception as exc:  # noqa: BLE001
+            return _parse_error(exc)
+        from api import mcp_handler
+
+        try:
+            if not mcp_handler.expects_response(payload):
+                await mcp_handler.dispatch_payload_async(payload)
+                return Response(status_code=202)
+
+            if "text/event-stream" in request.headers.get("accept", ""):
+
+                async def events():
+                    try:
+                        async for response in mcp_handler.iter_payload_async(payload):
+                            yield b"event: message\ndata: " + mcp_handler.encode_response(response) + b"\n\n"
+                    except Exception as exc:  # noqa: BLE001
+                        # Headers are already sent; report the failure as a final event.
+                        error = mcp_handler.encode_response(_internal_error(payload, exc))
+                        yield b"event: message\ndata: " + error + b"\n\n"
+
+                return StreamingResponse(
+                    events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"}
+                )
+
+            response = await mcp_handler.dispatch_payload_async(payload)
+            return Response(mcp_handler.encode_response(response), media_type="application/json")
+        except Exception as exc:  # noqa: BLE001
+            return JSONResponse(_internal_error(payload, exc), status_code=500)
+
+    async def root_handler(request: Request):
+        if request.method == "GET":
+            return JSONResponse(
+                {
+                    "name": "design-foundry-mcp",
+                    "version": "1.0.0",
+                    "status": "running",
+                    "cache": RESULT_CACHE.stats(),
+                    "knowledge": reload.status(),
+                    "startup": startup.summary(),
+                }
+            )
+        # POST -> JSON-RPC fallback (non-SSE HTTP)
+        try:
+            payload = await request.json()
+        except Exception as exc:  # noqa: BLE001
+            return _parse_error(exc)
+        # Lazy import to avoid circular dependency on startup
+        from api import mcp_handler
+
+        try:
+            response = await mcp_handler.dispatch_payload_async(payload)
+            if response is None:
+                # Batch consisting solely of notifications: nothing to return.
+                return Response(status_code=202)
+            return Response(mcp_handler.encode_response(response), media_type="application/json")
+        except Exception as exc:  # noqa: BLE001
+            return JSONResponse(_internal_error(payload, exc), status_code=500)
+
+    async def health_handler(request: Request):
+        return JSONResponse({"status": "ok"})
+
+    async def metrics_handler(request: Request):
+        return Response(metrics.render(), media_type=metrics.CONTENT_TYPE)
+
+    app = Starlette(
+        debug=mcp_settings.debug,
+        routes=[
+            Route("/", endpoint=root_handler, methods=["GET", "POST"]),
+            Route("/mcp", endpoint=streamable_http_handler, methods=["GET", "POST", "DELETE"]),
+            Route("/health", endpoint=health_handler, methods=["GET"]),
+            Route("/metrics", endpoint=metrics_handler, methods=["GET"]),
+            Route("/sse", endpoint=handle_sse, methods=["GET"]),
+            # Raw ASGI app: handle_post_message sends its own 202 response.
+            Mount("/messages", app=sse.handle_post_message),
+            Route("/favicon.ico", endpoint=lambda request: Response(status_code=204)),
+            Route("/favicon.png", endpoint=lambda request: Response(status_code=204)),
+        ],
+    )
+    profiling.install(app)
+    reload.install(app)
+    return app
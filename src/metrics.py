@@ -0,0 +1,204 @@
+"""In-process metrics rendered in the Prometheus text exposition format.
+
+Counters, gauges and histograms are plain Python numbers updated from the
+event loop thread, so recording a sample is a dict lookup plus an addition:
+no locks, no background threads. Labelled children are created on first
+use and cached by label values. ``GET /metrics`` renders every metric
+registered in :data:`REGISTRY`.
+
+With pre-forked workers (``MCP_WORKERS``) each worker keeps its own values,
+so scrape every worker or aggregate in Prometheus.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Latency buckets in seconds: tools run in microseconds, HTTP round trips in
+# milliseconds.
+LATENCY_BUCKETS = (
+    0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5,
+)
+BYTES_BUCKETS = (256, 1024, 4096, 8192, 16384, 24576, 65536, 262144)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+class _CounterValue:
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def samples(self, name: str, names: Sequence[str], labels: Sequence[str]) -> Iterator[str]:
+        yield f"{name}{_format_labels(names, labels)} {_format_value(self.value)}"
+
+
+class _HistogramValue:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Tuple[float, ...]) -> None:
+        self.buckets = buckets
+        # Per-bucket (non-cumulative) counts plus a final +Inf slot.
+        self.counts: List[int] = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def samples(self, name: str, names: Sequence[str], labels: Sequence[str]) -> Iterator[str]:
+        cumulative = 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            cumulative += count
+            le = f'le="{_format_value(bound)}"'
+            yield f"{name}_bucket{_format_labels(names, labels, le)} {cumulative}"
+        yield f"{name}_sum{_format_labels(names, labels)} {_format_value(self.sum)}"
+        yield f"{name}_count{_format_labels(names, labels)} {self.count}"
+
+
+class _Metric(ABC):
+    """A named metric family; ``labels(...)`` returns the series to update."""
+
+    kind = ""
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.label_names = tuple(labels)
+        self._children: Dict[Tuple[str, ...], Any] = {}
+        REGISTRY.append(self)
+
+    @abstractmethod
+    def _new_child(self) -> Any:
+        """A fresh series for one combination of label values."""
+
+    def labels(self, *values: str) -> Any:
+        child = self._children.get(values)
+        if child is None:
+            child = self._children[values] = self._new_child()
+        return child
+
+    def render(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} {self.kind}"
+        for labels, child in self._children.items():
+            yield from child.samples(self.name, self.label_names, labels)
+
+
+class Counter(_Metric):
+    """Counter; ``fn`` makes an unlabelled metric report a callback at render time."""
+
+    kind = "counter"
+
+    def __init__(
+        self, name: str, help: str, labels: Sequence[str] = (), fn: Optional[Callable[[], float]] = None
+    ) -> None:
+        super().__init__(name, help, labels)
+        self._fn = fn
+        if not self.label_names:
+            self._value: _CounterValue = self.labels()
+
+    def _new_child(self) -> _CounterValue:
+        return _CounterValue()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._value.value += amount
+
+    def render(self) -> Iterator[str]:
+        if self._fn is not None:
+            self._value.value = self._fn()
+        return super().render()
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._value.value -= amount
+
+    def set(self, value: float) -> None:
+        self._value.value = value
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self, name: str, help: str, labels: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS
+    ) -> None:
+        self.buckets = tuple(buckets)
+        super().__init__(name, help, labels)
+        if not self.label_names:
+            self._value: _HistogramValue = self.labels()
+
+    def _new_child(self) -> _HistogramValue:
+        return _HistogramValue(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self._value.observe(value)
+
+
+REGISTRY: List[_Metric] = []
+
+
+def render() -> str:
+    """All registered metrics in the Prometheus text format (version 0.0.4)."""
+    return "\n".join(line for metric in REGISTRY for line in metric.render()) + "\n"
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Request and call counts are the histograms' ``_count`` series.
+REQUEST_SECONDS = Histogram("mcp_request_duration_seconds", "JSON-RPC dispatch latency by method.", ["method"])
+TOOL_SECONDS = Histogram("mcp_tool_duration_seconds", "Tool call latency, including cache hits.", ["tool"])
+TOOL_ERRORS = Counter("mcp_tool_errors_total", "Tool calls that raised (invalid arguments included).", ["tool"])
+TOOL_IN_FLIGHT = Gauge("mcp_tool_calls_in_flight", "Tool calls currently executing.")
+SERIALIZE_SECONDS = Histogram("mcp_serialization_duration_seconds", "JSON-RPC response encoding time.")
+RESPONSE_BYTES = Histogram("mcp_response_bytes", "Encoded JSON-RPC response size.", buckets=BYTES_BUCKETS)
+SSE_SESSIONS = Gauge("mcp_sse_sessions_active", "Open legacy SSE sessions.")
+ERRORS = Counter("mcp_errors_total", "Errors by JSON-RPC error code (tool_error for failed tools).", ["code"])
+KNOWLEDGE_RELOADS = Counter(
+    "mcp_knowledge_reloads_total", "External knowledge directory reloads by result (applied/rejected).", ["result"]
+)
+
+
+# Series bound up front so the dispatch path does a single dict lookup.
+# Methods outside this set share one series to bound cardinality.
+_METHOD_SERIES = {
+    method: REQUEST_SECONDS.labels(method) for method in ("initialize", "ping", "tools/list", "tools/call")
+}
+_OTHER_METHOD_SERIES = REQUEST_SECONDS.labels("other")
+
+
+def request_series(method: Any) -> _HistogramValue:
+    # ``method`` comes straight from the request and may be any JSON value.
+    return _METHOD_SERIES.get(method, _OTHER_METHOD_SERIES) if isinstance(method, str) else _OTHER_METHOD_SERIES
@@ -0,0 +1,306 @@
+"""Opt-in per-request CPU and allocation profiling.
+
+Set ``MCP_PROFILE_DIR`` to a writable directory to enable it, then send a
+request with the ``X-MCP-Profile: 1`` header:
+
+    curl -H 'X-MCP-Profile: 1' -d '{"jsonrpc":"2.0","id":1,"method":"tools/call",...}' :8000/
+
+That request runs under ``cProfile`` and ``tracemalloc``. The server then
+writes ``<id>.prof`` (a ``pstats`` dump, for snakeviz and similar tools)
+and ``<id>.txt`` (top functions, top allocation sites and result cache
+hit/miss deltas) to the directory, and returns ``<id>`` in the
+``X-MCP-Profile-Id`` response header. Only the newest ``MCP_PROFILE_KEEP``
+profiles (default 20) are kept. ``GET /debug/profiles`` lists them and
+``GET /debug/profiles/<file>`` downloads one.
+
+The ``/debug/profiles`` routes answer only requests that carry the same
+opt-in header, and return 404 to everything else. Set
+``MCP_PROFILE_TOKEN`` to require that the header value equal the token,
+both to profile a request and to read profiles:
+
+    curl -H 'X-MCP-Profile: <token>' :8000/debug/profiles
+
+Summaries are rendered and written in a worker thread after the request
+completes. A failed save is reported on stderr and never replaces the
+request's own result or exception.
+
+When ``MCP_PROFILE_DIR`` is unset, neither the middleware nor the routes
+are installed and the profilers are never imported, so unprofiled
+deployments pay nothing. Profiled requests
+run one at a time. cProfile sees the whole event loop, though, so
+unprofiled requests running concurrently in the same worker also show up.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hmac
+import io
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+from .cache import RESULT_CACHE, _env_int
+
+if TYPE_CHECKING:
+    import cProfile
+    import tracemalloc
+
+    from starlette.routing import Route
+
+HEADER = "x-mcp-profile"
+ID_HEADER = "X-MCP-Profile-Id"
+DEFAULT_KEEP = 20
+
+# Request body bytes kept to label the profile (method and tool name).
+_LABEL_BODY_BYTES = 4096
+_TOP_FUNCTIONS = 40
+_TOP_ALLOCATIONS = 25
+_PROFILE_FILE = re.compile(r"[\w.-]+\.(prof|txt)")
+# Reading profiles carries the opt-in header too, but is never profiled itself.
+_ROUTES_PREFIX = "/debug/profiles"
+
+
+def profile_dir() -> Optional[Path]:
+    """The ``MCP_PROFILE_DIR`` directory, or ``None`` when profiling is off."""
+    value = os.getenv("MCP_PROFILE_DIR", "").strip()
+    return Path(value) if value else None
+
+
+def profile_token() -> Optional[str]:
+    """``MCP_PROFILE_TOKEN``: when set, the ``X-MCP-Profile`` value that opts in."""
+    return os.getenv("MCP_PROFILE_TOKEN", "").strip() or None
+
+
+def opted_in(headers: Any, token: Optional[str]) -> bool:
+    """Whether raw ASGI ``headers`` carry the profiling opt-in (and ``token``, if set)."""
+    for key, value in headers:
+        if key == HEADER.encode():
+            if token is not None:
+                return hmac.compare_digest(value, token.encode())
+            return value not in (b"", b"0")
+    return False
+
+
+def _label(method: str, path: str, body: bytes) -> str:
+    """``POST / tools/call design_rule_qa`` style description of a request."""
+    parts = [method, path]
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        payload = None
+    items = payload if isinstance(payload, list) else [payload]
+    for item in items[:3]:
+        if isinstance(item, dict) and isinstance(item.get("method"), str):
+            parts.append(item["method"])
+            name = (item.get("params") or {}).get("name")
+            if isinstance(name, str):
+                parts.append(name)
+    return " ".join(parts)
+
+
+class ProfileStore:
+    """Bounded on-disk ring of profiles, shared by every worker."""
+
+    def __init__(self, directory: Path, keep: int = DEFAULT_KEEP) -> None:
+        self.directory = directory
+        self.keep = max(1, keep)
+        self._seq = 0
+
+    def new_id(self) -> str:
+        self._seq += 1
+        return f"{time.strftime('%Y%m%dT%H%M%S')}-{os.getpid()}-{self._seq:04d}"
+
+    def save(self, profile_id: str, profiler: cProfile.Profile, summary: str) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(str(self.directory / f"{profile_id}.prof"))
+        (self.directory / f"{profile_id}.txt").write_text(summary, encoding="utf-8")
+        self._trim()
+
+    def _trim(self) -> None:
+        for stale in self.list()[self.keep:]:
+            for name in stale["files"]:
+                (self.directory / name).unlink(missing_ok=True)
+
+    def list(self) -> List[Dict[str, Any]]:
+        """Profiles, newest first, with the label line from each summary."""
+        entries = []
+        for summary in self.directory.glob("*.txt"):
+            try:
+                stat = summary.stat()
+                with summary.open(encoding="utf-8") as fh:
+                    label = fh.readline().strip()
+            except OSError:
+                continue  # trimmed by another worker
+            profile_id = summary.stem
+            entries.append(
+                {
+                    "id": profile_id,
+                    "label": label,
+                    "created": stat.st_mtime,
+                    "files": [f"{profile_id}.prof", f"{profile_id}.txt"],
+                }
+            )
+        entries.sort(key=lambda entry: (entry["created"], entry["id"]), reverse=True)
+        return entries
+
+    def path(self, name: str) -> Optional[Path]:
+        if not _PROFILE_FILE.fullmatch(name):
+            return None
+        path = self.directory / name
+        return path if path.is_file() else None
+
+
+def _summary(
+    label: str,
+    elapsed: float,
+    profiler: cProfile.Profile,
+    snapshot: tracemalloc.Snapshot,
+    peak: int,
+    cache_before: Dict[str, int],
+    cache_after: Dict[str, int],
+) -> str:
+    import pstats
+
+    out = io.StringIO()
+    out.write(f"{label}\n")
+    out.write(f"wall time: {elapsed * 1000:.3f} ms\n")
+    out.write(f"peak traced memory: {peak} B\n")
+    deltas = ", ".join(f"{key} +{cache_after[key] - cache_before[key]}" for key in ("hits", "misses", "coalesced"))
+    out.write(f"result cache: {deltas}\n\n")
+
+    out.write(f"== top {_TOP_FUNCTIONS} functions by cumulative time ==\n")
+    pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(_TOP_FUNCTIONS)
+
+    out.write(f"== top {_TOP_ALLOCATIONS} allocation sites ==\n")
+    for stat in snapshot.statistics("lineno")[:_TOP_ALLOCATIONS]:
+        out.write(f"{stat}\n")
+    return out.getvalue()
+
+
+class ProfilingMiddleware:
+    """ASGI middleware profiling requests that carry the ``X-MCP-Profile`` header."""
+
+    def __init__(self, app: Any, store: ProfileStore, token: Optional[str] = None) -> None:
+        self.app = app
+        self.store = store
+        self.token = token
+        # cProfile and tracemalloc are process-wide: one profiled request at a time.
+        self._lock = asyncio.Lock()
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["path"].startswith(_ROUTES_PREFIX)
+            or not opted_in(scope["headers"], self.token)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        import cProfile
+        import tracemalloc
+
+        profile_id = self.store.new_id()
+        body = bytearray()
+
+        async def recording_receive() -> Dict[str, Any]:
+            message = await receive()
+            if message["type"] == "http.request" and len(body) < _LABEL_BODY_BYTES:
+                body.extend(message.get("body", b"")[: _LABEL_BODY_BYTES - len(body)])
+            return message
+
+        async def tagged_send(message: Dict[str, Any]) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((ID_HEADER.lower().encode(), profile_id.encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        async with self._lock:
+            cache_before = RESULT_CACHE.stats()
+            tracing = tracemalloc.is_tracing()
+            if not tracing:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            profiler = cProfile.Profile()
+            start = time.perf_counter()
+            profiler.enable()
+            try:
+                await self.app(scope, recording_receive, tagged_send)
+            finally:
+                profiler.disable()
+                elapsed = time.perf_counter() - start
+                snapshot = tracemalloc.take_snapshot()
+                peak = tracemalloc.get_traced_memory()[1]
+                if not tracing:
+                    tracemalloc.stop()
+                label = _label(scope["method"], scope["path"], bytes(body))
+                cache_after = RESULT_CACHE.stats()
+                await self._save(
+                    profile_id,
+                    lambda: _summary(label, elapsed, profiler, snapshot, peak, cache_before, cache_after),
+                    profiler,
+                )
+
+    async def _save(self, profile_id: str, summarize: Callable[[], str], profiler: cProfile.Profile) -> None:
+        # pstats rendering and disk writes stay off the event loop; a failure
+        # here must not mask the request's own exception.
+        try:
+            await asyncio.to_thread(lambda: self.store.save(profile_id, profiler, summarize()))
+        except Exception as exc:  # noqa: BLE001
+            print(f"profile {profile_id} not saved: {exc!r}", file=sys.stderr)
+
+
+def routes(store: ProfileStore, token: Optional[str] = None) -> List[Route]:
+    """``GET /debug/profiles`` (JSON listing) and ``GET /debug/profiles/<file>``.
+
+    Both answer 404 unless the request carries the profiling opt-in header.
+    """
+    from starlette.requests import Request
+    from starlette.responses import FileResponse, JSONResponse, Response
+    from starlette.routing import Route
+
+    def hidden(request: Request) -> Optional[Response]:
+        if opted_in(request.scope["headers"], token):
+            return None
+        return JSONResponse({"error": "not found"}, status_code=404)
+
+    async def list_profiles(request: Request) -> Response:
+        denied = hidden(request)
+        if denied is not None:
+            return denied
+        base = str(request.url_for("debug_profile_file", name="_")).rstrip("_")
+        profiles = store.list() if store.directory.is_dir() else []
+        for entry in profiles:
+            entry["files"] = {name.rsplit(".", 1)[1]: base + name for name in entry["files"]}
+        return JSONResponse({"directory": str(store.directory), "keep": store.keep, "profiles": profiles})
+
+    async def profile_file(request: Request) -> Response:
+        denied = hidden(request)
+        if denied is not None:
+            return denied
+        path = store.path(request.path_params["name"])
+        if path is None:
+            return JSONResponse({"error": "profile not found"}, status_code=404)
+        media_type = "text/plain; charset=utf-8" if path.suffix == ".txt" else "application/octet-stream"
+        return FileResponse(path, media_type=media_type, filename=path.name)
+
+    return [
+        Route(_ROUTES_PREFIX, endpoint=list_profiles, methods=["GET"]),
+        Route(_ROUTES_PREFIX + "/{name}", endpoint=profile_file, methods=["GET"], name="debug_profile_file"),
+    ]
+
+
+def install(app: Any) -> None:
+    """Add the profiling middleware and routes to ``app`` if ``MCP_PROFILE_DIR`` is set."""
+    directory = profile_dir()
+    if directory is None:
+        return
+    store = ProfileStore(directory, _env_int("MCP_PROFILE_KEEP", DEFAULT_KEEP))
+    token = profile_token()
+    app.router.routes.extend(routes(store, token))
+    app.add_middleware(ProfilingMiddleware, store=store, token=token)
@@ -0,0 +1,627 @@
+"""Single tool registry shared by every transport.
+
+``TOOL_SPECS`` is the only place tool metadata is declared. At import time
+each spec is compiled once into a :class:`CompiledTool` holding its
+metadata and an argument validator derived from ``inputSchema``; the
+unwrapped callable and an async runner chosen by its sync/async kind are
+bound on first use (see :meth:`CompiledTool.load`). The ``tools/list``
+result is serialized once into :data:`TOOLS_LIST_RESULT_JSON`.
+
+Both the JSON-RPC fallback (``api.mcp_handler``) and the FastMCP SSE
+transport (``src.http_app``) dispatch through :func:`call_tool`, so no
+per-call introspection happens on the request path.
+"""
+
+from __future__ import annotations
+
+import importlib
+import inspect
+import json
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Mapping, NotRequired, Tuple, TypedDict
+
+from . import metrics
+from .cache import RESULT_CACHE
+
+
+class ToolSpec(TypedDict):
+    name: str
+    target: str  # "package.module:function"
+    description: str
+    inputSchema: Dict[str, Any]
+    # Argument naming a file under MCP_REPORT_DIR; its mtime and size join the cache key.
+    file_argument: NotRequired[str]
+
+
+class ToolArgumentError(ValueError):
+    """Raised when ``tools/call`` arguments do not match the tool's inputSchema."""
+
+
+TOOL_SPECS: List[ToolSpec] = [
+    {
+        "name": "explain_foundry_term",
+        "target": "src.tools.terminology:explain_foundry_term",
+        "description": (
+            "파운드리/PDK 전문 용어를 설명하고 실무 팁을 제공하는 도구. "
+            "term은 필수, foundry는 'TSMC', 'Samsung', 'GlobalFoundries', "
+            "또는 'general'을 권장. 응답은 Markdown 텍스트로 제공."
+        ),
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "term": {"type": "string", "description": "설명이 필요한 용어"},
+                "foundry": {
+                    "type": "string",
+                    "description": "파운드리 이름 (예: TSMC/Samsung/general)",
+                    "default": "general",
+                },
+                "context": {
+                    "type": "string",
+                    "description": "추가 맥락",
+                    "default": "",
+                },
+            },
+            "required": ["term"],
+        },
+    },
+    {
+        "name": "explain_foundry_term_batch",
+        "target": "src.tools.terminology:explain_foundry_term_batch",
+        "description": (
+            "여러 파운드리/PDK 용어를 한 번의 호출로 설명. 중복/동일 용어로 해석되는 입력은 "
+            "한 번만 설명하고, 24KB를 넘으면 cursor로 이어서 조회. 응답은 Markdown 텍스트."
+        ),
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "terms": {"type": "array", "items": {"type": "string"}, "description": "설명이 필요한 용어 목록"},
+                "foundry": {"type": "string", "default": "general"},
+                "context": {"type": "string", "default": ""},
+                "cursor": {
+                    "type": "string",
+                    "description": "이전 응답이 24KB를 넘어 잘렸을 때 안내된 cursor (같은 목록과 함께 전달)",
+                    "default": "",
+                },
+            },
+            "required": ["terms"],
+        },
+    },
+    {
+        "name": "design_rule_qa",
+        "target": "src.tools.design_rules:design_rule_qa",
+        "description": (
+            "공정 노드/카테고리별 디자인 룰 질의응답. "
+            "process_node 예: '5nm','7nm','28nm','65nm'. "
+            "rule_category 예: metal/via/poly/well/antenna/density/esd/general. "
+            "Notes/Tips는 question과의 관련도 순으로 정렬되며, include_related=true이면 "
+            "같은 노드의 다른 카테고리에서 관련 항목을 함께 제공. 응답은 Markdown 텍스트."
+        ),
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "process_node": {"type": "string"},
+                "rule_category": {"type": "string"},
+                "question": {"type": "string"},
+                "foundry": {"type": "string", "default": "general"},
+                "include_related": {"type": "boolean", "default": False},
+            },
+            "required": ["process_node", "rule_category", "question"],
+        },
+    },
+    {
+        "name": "tapeout_checklist",
+        "target": "src.tools.tapeout:tapeout_checklist",
+        "description": (
+            "Tape-out 전 체크리스트를 Markdown 체크박스 형태로 생성. "
+            "design_type: digital/analog/mixed_signal/memory/io. "
+            "checklist_category: all/drc_lvs/timing/power/signal_integrity/documentation."
+        ),
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "design_type": {"type": "string"},
+                "process_node": {"type": "string"},
+                "checklist_category": {"type": "string", "default": "all"},
+            },
+            "required": ["design_type", "process_node"],
+        },
+    },
+    {
+        "name": "compare_process_nodes",
+        "target": "src.tools.process:compare_process_nodes",
+        "description": (
+            "두 공정 노드를 성능/전력/면적/비용/성숙도/가용성 관점에서 비교. "
+            "응답은 Markdown 테이블과 간단한 메모."
+        ),
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "node1": {"type": "string"},
+                "node2": {"type": "string"},
+                "comparison_aspects": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "default": ["performance", "power", "area", "cost"],
+                },
+            },
+            "required": ["node1", "node2"],
+        },
+    },
+    {
+        "name": "pdk_document_guide",
+        "target": "src.tools.pdk:pdk_document_guide",
+        "description": (
+            "PDK 문서 타입별 구조/주요 내용/활용 팁을 Markdown으로 안내. "
+            "document_type: tech_file/drc_deck/lvs_deck/spice_model/cell_library/"
+            "io_library/memory_compiler/design_guide."
+        ),
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "document_type": {"type": "string"},
+                "specific_topic": {"type": "string", "default": ""},
+            },
+            "required": ["document_type"],
+        },
+    },
+    {
+        "name": "foundry_communication_template",
+        "target": "src.tools.communication:foundry_communication_template",
+        "description": (
+            "파운드리 FAE와의 커뮤니케이션 템플릿 생성. "
+            "communication_type: technical_inquiry/drc_waiver_request/"
+            "tapeout_schedule/yield_issue_report/respin_request."
+        ),
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "communication_type": {"type": "string"},
+                "context": {"type": "object"},
+            },
+            "required": ["communication_type", "context"],
+        },
+    },
+    {
+        "name": "foundry_communication_template_batch",
+        "target": "src.tools.communication:foundry_communication_template_batch",
+        "description": (
+            "같은 커뮤니케이션 템플릿을 컨텍스트 목록(contexts) 또는 CSV(contexts_csv, 첫 줄은 필드명)로 "
+            "여러 건 한 번에 렌더링 (예: rule ID/위치별 drc_waiver_request). defaults는 모든 항목에 공통인 "
+            "필드. 템플릿에 없는 필드와 기본값으로 채운 필드는 배치당 한 번 보고하고, 24KB를 넘으면 cursor로 이어서 조회."
+        ),
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "communication_type": {"type": "string"},
+                "contexts": {"type": "array", "items": {"type": "object"}, "default": []},
+                "contexts_csv": {"type": "string", "default": ""},
+                "defaults": {"type": "object", "default": {}},
+                "cursor": {
+                    "type": "string",
+                    "description": "이전 응답이 24KB를 넘어 잘렸을 때 안내된 cursor (같은 목록과 함께 전달)",
+                    "default": "",
+                },
+            },
+            "required": ["communication_type"],
+        },
+    },
+    {
+        "name": "design_methodology_guide",
+        "target": "src.tools.methodology:design_methodology_guide",
+        "description": (
+            "공정 분류(advanced/mature)와 주제별 설계 방법론 가이드 제공. "
+            "methodology_topic: floorplan/power_grid/clock_tree/placement/"
+            "routing/timing_closure/low_power/multi_voltage."
+        ),
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "methodology_topic": {"type": "string"},
+                "process_node": {"type": "string", "default": "advanced"},
+            },
+            "required": ["methodology_topic"],
+        },
+    },
+    {
+        "name": "drc_error_guide",
+        "target": "src.tools.drc_debug:drc_error_guide",
+        "description": "DRC(Design Rule Check) 에러 유형별 원인 분석과 해결 방법을 제공합니다. spacing, width, enclosure, density, antenna 등의 violation 해결을 안내합니다.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "error_type": {
+                    "type": "string",
+                    "description": "DRC 에러 유형: spacing, width, enclosure, density, antenna, overlap, extension",
+                    "enum": ["spacing", "width", "enclosure", "density", "antenna", "overlap", "extension"],
+                },
+                "layer": {
+                    "type": "string",
+                    "description": "관련 레이어 (예: M1, VIA1, POLY)",
+                    "default": "general",
+                },
+                "error_description": {
+                    "type": "string",
+                    "description": "추가적인 에러 상황 설명",
+                    "default": "",
+                },
+            },
+            "required": ["error_type"],
+        },
+    },
+    {
+        "name": "drc_error_guide_batch",
+        "target": "src.tools.drc_debug:drc_error_guide_batch",
+        "description": "여러 DRC 에러 유형의 원인/해결 방법을 한 번의 호출로 제공합니다. 중복 유형은 한 번만 설명하고, 24KB를 넘으면 cursor로 이어서 조회합니다.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "error_types": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "DRC 에러 유형 목록: spacing, width, enclosure, density, antenna, overlap, extension",
+                },
+                "layer": {"type": "string", "description": "관련 레이어 (예: M1, VIA1, POLY)", "default": "general"},
+                "cursor": {
+                    "type": "string",
+                    "description": "이전 응답이 24KB를 넘어 잘렸을 때 안내된 cursor (같은 목록과 함께 전달)",
+                    "default": "",
+                },
+            },
+            "required": ["error_types"],
+        },
+    },
+    {
+        "name": "drc_report_summary",
+        "target": "src.tools.drc_report:drc_report_summary",
+        "file_argument": "report_path",
+        "description": (
+            "Calibre/ICV DRC 결과 리포트(Calibre ASCII results DB, Calibre summary, ICV summary)를 "
+            "스트리밍으로 파싱해 rule check별 위반 수를 DRC 에러 유형/레이어별로 집계하고, 위반이 많은 "
+            "유형부터 drc_error_guide 해결 가이드를 함께 제공. 큰 파일은 서버의 MCP_REPORT_DIR 아래 "
+            "경로(report_path, .gz 지원)로, 작은 리포트는 report_text로 전달."
+        ),
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "report_text": {"type": "string", "description": "리포트 본문", "default": ""},
+                "report_path": {
+                    "type": "string",
+                    "description": "MCP_REPORT_DIR 기준 리포트 파일 경로 (.gz 가능)",
+                    "default": "",
+                },
+                "top_n": {"type": "integer", "description": "가이드를 붙일 상위 유형 수 (1-7)", "default": 3},
+            },
+            "required": [],
+        },
+    },
+    {
+        "name": "timing_violation_debug",
+        "target": "src.tools.timing_debug:timing_violation_debug",
+        "description": "Timing violation 유형별 디버깅 방법과 해결 전략을 제공합니다. setup, hold, max_transition, max_capacitance 등의 violation 해결을 안내합니다.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "violation_type": {
+                    "type": "string",
+                    "description": "Timing violation 유형: setup, hold, max_transition, max_capacitance, max_fanout, clock_skew, recovery, removal",
+                    "enum": ["setup", "hold", "max_transition", "max_capacitance", "max_fanout", "clock_skew", "recovery", "removal"],
+                },
+                "severity": {
+                    "type": "string",
+                    "description": "심각도: critical, medium, minor",
+                    "enum": ["critical", "medium", "minor"],
+                    "default": "medium",
+                },
+                "context": {
+                    "type": "string",
+                    "description": "추가 상황 설명",
+                    "default": "",
+                },
+            },
+            "required": ["violation_type"],
+        },
+    },
+    {
+        "name": "timing_violation_debug_batch",
+        "target": "src.tools.timing_debug:timing_violation_debug_batch",
+        "description": "여러 timing violation 유형의 디버깅 가이드를 한 번의 호출로 제공합니다. 중복 유형은 한 번만 설명하고, 24KB를 넘으면 cursor로 이어서 조회합니다.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "violation_types": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Timing violation 유형 목록: setup, hold, max_transition, max_capacitance, max_fanout, clock_skew, recovery, removal",
+                },
+                "severity": {
+                    "type": "string",
+                    "description": "심각도: critical, medium, minor",
+                    "enum": ["critical", "medium", "minor"],
+                    "default": "medium",
+                },
+                "cursor": {
+                    "type": "string",
+                    "description": "이전 응답이 24KB를 넘어 잘렸을 때 안내된 cursor (같은 목록과 함께 전달)",
+                    "default": "",
+                },
+            },
+            "required": ["violation_types"],
+        },
+    },
+    {
+        "name": "timing_report_summary",
+        "target": "src.tools.timing_report:timing_report_summary",
+        "file_argument": "report_path",
+        "description": (
+            "PrimeTime/Tempus timing 리포트(report_timing, report_constraint -all_violators)를 스트리밍으로 "
+            "파싱해 check 유형별 WNS/TNS, 위반 endpoint 수, path group별 분포, slack 히스토그램을 계산하고, "
+            "TNS가 큰 유형부터 수치로 도출한 심각도의 timing_violation_debug 가이드를 함께 제공. 큰 파일은 "
+            "서버의 MCP_REPORT_DIR 아래 경로(report_path, .gz 지원)로, 작은 리포트는 report_text로 전달."
+        ),
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "report_text": {"type": "string", "description": "리포트 본문", "default": ""},
+                "report_path": {
+                    "type": "string",
+                    "description": "MCP_REPORT_DIR 기준 리포트 파일 경로 (.gz 가능)",
+                    "default": "",
+                },
+                "top_n": {"type": "integer", "description": "가이드를 붙일 상위 유형 수 (1-5)", "default": 3},
+                "time_unit": {"type": "string", "description": "리포트 시간 단위: ns, ps", "default": "ns"},
+            },
+            "required": [],
+        },
+    },
+    {
+        "name": "acronym_decoder",
+        "target": "src.tools.acronym:acronym_decoder",
+        "description": "반도체 업계 약어와 축약어를 해석합니다. 같은 약어도 맥락에 따라 다른 의미를 가질 수 있어 context를 고려하여 설명합니다.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "acronym": {
+                    "type": "string",
+                    "description": "해석이 필요한 약어 (예: DRC, LVS, OPC, CMP)",
+                },
+                "context": {
+                    "type": "string",
+                    "description": "약어가 사용된 맥락: general, design, foundry, test, package, business",
+                    "enum": ["general", "design", "foundry", "test", "package", "business"],
+                    "default": "general",
+                },
+            },
+            "required": ["acronym"],
+        },
+    },
+    {
+        "name": "acronym_decoder_batch",
+        "target": "src.tools.acronym:acronym_decoder_batch",
+        "description": "여러 반도체 약어를 한 번의 호출로 해석합니다. 문서에서 뽑은 약어 목록을 그대로 넘기면 중복은 한 번만 설명하고, 24KB를 넘으면 cursor로 이어서 조회합니다.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "acronyms": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "해석이 필요한 약어 목록 (예: [\"DRC\", \"LVS\", \"OPC\"])",
+                },
+                "context": {
+                    "type": "string",
+                    "description": "약어가 사용된 맥락: general, design, foundry, test, package, business",
+                    "enum": ["general", "design", "foundry", "test", "package", "business"],
+                    "default": "general",
+                },
+                "cursor": {
+                    "type": "string",
+                    "description": "이전 응답이 24KB를 넘어 잘렸을 때 안내된 cursor (같은 목록과 함께 전달)",
+                    "default": "",
+                },
+            },
+            "required": ["acronyms"],
+        },
+    },
+    {
+        "name": "extract_foundry_terms",
+        "target": "src.tools.extract:extract_foundry_terms",
+        "description": (
+            "붙여 넣은 문서(스펙, DRC 로그, FAE 메일 등)에서 등록된 반도체 약어와 파운드리 용어를 "
+            "한 번에 모두 찾아 카테고리별로 해석하고 등장 횟수를 표시. 단어마다 acronym_decoder를 "
+            "호출하는 대신 사용. 24KB를 넘으면 같은 text와 cursor로 이어서 조회."
+        ),
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "text": {"type": "string", "description": "분석할 문서 본문"},
+                "context": {
+                    "type": "string",
+                    "description": "문서 맥락: general, design, foundry, test, package, business",
+                    "enum": ["general", "design", "foundry", "test", "package", "business"],
+                    "default": "general",
+                },
+                "cursor": {
+                    "type": "string",
+                    "description": "이전 응답이 24KB를 넘어 잘렸을 때 안내된 cursor (같은 text와 함께 전달)",
+                    "default": "",
+                },
+            },
+            "required": ["text"],
+        },
+    },
+    {
+        "name": "search_foundry_knowledge",
+        "target": "src.tools.search:search_foundry_knowledge",
+        "description": (
+            "용어/약어/디자인 룰/DRC/Timing/체크리스트/템플릿/방법론/PDK 문서 전체를 "
+            "BM25로 검색하고, 각 결과에 다음에 호출할 도구와 인자를 안내. "
+            "어느 도구에 답이 있는지 모를 때 먼저 사용."
+        ),
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "query": {"type": "string", "description": "검색어 (한글/영문)"},
+                "top_k": {
+                    "type": "integer",
+                    "description": "반환할 결과 수 (1-20)",
+                    "default": 5,
+                },
+            },
+            "required": ["query"],
+        },
+    },
+]
+
+
+_JSON_TYPES: Dict[str, Tuple[type, ...]] = {
+    "string": (str,),
+    "object": (dict,),
+    "array": (list, tuple),
+    "integer": (int,),
+    "number": (int, float),
+    "boolean": (bool,),
+}
+
+
+def _compile_validator(name: str, schema: Mapping[str, Any]) -> Callable[[Mapping[str, Any]], Dict[str, Any]]:
+    """Build a validator that checks required/unknown/typed arguments and fills defaults.
+
+    Enum values are advisory (tools answer unknown values with a Markdown
+    hint), so they are not enforced here.
+    """
+    props: Mapping[str, Any] = schema.get("properties", {})
+    required = tuple(schema.get("required", ()))
+    allowed = frozenset(props)
+    defaults = {key: prop["default"] for key, prop in props.items() if "default" in prop}
+    typed = tuple(
+        (key, _JSON_TYPES[prop["type"]], prop["type"])
+        for key, prop in props.items()
+        if prop.get("type") in _JSON_TYPES
+    )
+
+    def validate(arguments: Mapping[str, Any]) -> Dict[str, Any]:
+        missing = [key for key in required if key not in arguments]
+        if missing:
+            raise ToolArgumentError(f"{name}: missing required argument(s): {', '.join(missing)}")
+        unknown = arguments.keys() - allowed
+        if unknown:
+            raise ToolArgumentError(f"{name}: unknown argument(s): {', '.join(sorted(unknown))}")
+        for key, types, type_name in typed:
+            value = arguments.get(key)
+            if value is None:
+                continue
+            if not isinstance(value, types) or (isinstance(value, bool) and bool not in types):
+                raise ToolArgumentError(f"{name}: argument `{key}` must be {type_name}")
+        return {**defaults, **arguments}
+
+    return validate
+
+
+class CompiledTool:
+    """A registry entry: resident metadata plus a lazily resolved callable.
+
+    Metadata and the argument validator are built at import time so
+    ``tools/list`` never touches tool modules. The tool module (and the
+    knowledge base it imports) is loaded on the first call, after which
+    ``run`` points straight at the callable.
+    """
+
+    __slots__ = (
+        "name", "target", "description", "input_schema", "file_argument", "validate", "fn", "is_async", "run", "latency"
+    )
+
+    def __init__(self, spec: ToolSpec) -> None:
+        self.name = spec["name"]
+        self.target = spec["target"]
+        self.description = spec["description"]
+        self.input_schema = spec["inputSchema"]
+        self.file_argument = spec.get("file_argument")
+        self.validate = _compile_validator(self.name, self.input_schema)
+        self.fn: Callable[..., Any] | None = None
+        self.is_async: bool | None = None
+        self.run: Callable[..., Awaitable[Any]] = self._load_and_run
+        self.latency = metrics.TOOL_SECONDS.labels(self.name)
+
+    def load(self) -> Callable[..., Any]:
+        """Import the tool module and bind ``run`` by the callable's kind."""
+        if self.fn is None:
+            module_name, _, attr = self.target.partition(":")
+            fn = getattr(importlib.import_module(module_name), attr)
+            self.is_async = inspect.iscoroutinefunction(fn)
+            self.run = fn if self.is_async else self._run_sync
+            self.fn = fn
+        return self.fn
+
+    async def _load_and_run(self, **arguments: Any) -> Any:
+        self.load()
+        return await self.run(**arguments)
+
+    async def _run_sync(self, **arguments: Any) -> Any:
+        return self.fn(**arguments)  # type: ignore[misc]
+
+    def cache_arguments(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        """``args`` as cached: a file argument also carries the file's stamp."""
+        path = args.get(self.file_argument) if self.file_argument else None
+        if not path:
+            return args
+        from .reports import report_stamp
+
+        return {**args, f"{self.file_argument}@stat": report_stamp(path.strip())}
+
+    def definition(self) -> Dict[str, Any]:
+        return {"name": self.name, "description": self.description, "inputSchema": self.input_schema}
+
+
+class _ToolFunctions(Mapping[str, Callable[..., Any]]):
+    """Read-only ``name -> callable`` view that loads tools on access."""
+
+    def __getitem__(self, name: str) -> Callable[..., Any]:
+        return REGISTRY[name].load()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(REGISTRY)
+
+    def __len__(self) -> int:
+        return len(REGISTRY)
+
+
+REGISTRY: Dict[str, CompiledTool] = {spec["name"]: CompiledTool(spec) for spec in TOOL_SPECS}
+TOOL_FUNCTIONS: Mapping[str, Callable[..., Any]] = _ToolFunctions()
+
+# tools/list payload, built and serialized once.
+TOOL_DEFINITIONS: List[Dict[str, Any]] = [tool.definition() for tool in REGISTRY.values()]
+TOOLS_LIST_RESULT: Dict[str, Any] = {"tools": TOOL_DEFINITIONS}
+TOOLS_LIST_RESULT_JSON: bytes = json.dumps(
+    TOOLS_LIST_RESULT, ensure_ascii=False, separators=(",", ":")
+).encode("utf-8")
+
+
+def warm() -> None:
+    """Import every tool module and knowledge base up front."""
+    for tool in REGISTRY.values():
+        tool.load()
+
+
+# Lazy loading keeps serverless cold starts cheap; MCP_LAZY_LOAD=0 loads
+# everything at import time instead.
+LAZY_LOAD = os.getenv("MCP_LAZY_LOAD", "1") != "0"
+if not LAZY_LOAD:
+    warm()
+
+
+async def call_tool(name: str, arguments: Mapping[str, Any]) -> Any:
+    """Validate ``arguments`` and run ``name`` through the shared result cache."""
+    tool = REGISTRY.get(name)
+    if tool is None:
+        raise ValueError(f"Unknown tool: {name}")
+    start = time.perf_counter()
+    metrics.TOOL_IN_FLIGHT.inc()
+    try:
+        args = tool.validate(arguments)
+        return await RESULT_CACHE.get_or_compute(name, tool.cache_arguments(args), lambda: tool.run(**args))
+    except Exception:
+        metrics.TOOL_ERRORS.labels(name).inc()
+        raise
+    finally:
+        metrics.TOOL_IN_FLIGHT.dec()
+        tool.latency.observe(time.perf_counter() - start)
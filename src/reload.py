@@ -0,0 +1,262 @@
+"""Hot reload of knowledge bases from an external directory.
+
+With ``MCP_KNOWLEDGE_DIR`` set, the HTTP app loads the JSON/YAML files
+there (see :mod:`src.data.external`) at startup. It then polls the
+directory every ``MCP_KNOWLEDGE_POLL_S`` seconds (default 2; 0 loads once
+and does not watch). A reload never pauses requests:
+
+1. Reading, parsing and validating the files runs in a worker thread.
+   An invalid file rejects the whole set and the active version stays.
+2. On the event loop, :func:`src.data.knowledge.apply_overrides` swaps the
+   bases in. Then only the caches derived from the changed bases are
+   cleared: the tool indexes listed in :data:`DERIVED_CACHES`, the
+   resolver alias tables and the result cache entries of
+   :data:`DEPENDENT_TOOLS`. Sync tools run on the loop too, so no request
+   can observe a half-applied reload.
+3. The cleared indexes are rebuilt in a worker thread from the new data,
+   so the next request finds them warm.
+
+Each worker process of ``MCP_WORKERS`` watches the directory on its own.
+The active content hash is reported by ``GET /`` under ``knowledge``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from . import metrics
+from .cache import RESULT_CACHE
+
+DEFAULT_POLL_S = 2.0
+
+# Knowledge base -> memoized builders (module:function with cache_clear) that read it.
+DERIVED_CACHES: Dict[str, Tuple[str, ...]] = {
+    "FOUNDRY_TERMINOLOGY": ("src.tools.terminology:_term_index", "src.tools.extract:_matcher", "src.tools.search:_index"),
+    "SEMICONDUCTOR_ACRONYMS": ("src.tools.acronym:_acronym_index", "src.tools.extract:_matcher", "src.tools.search:_index"),
+    "DESIGN_RULES_KNOWLEDGE": (
+        "src.tools.design_rules:_fact_index",
+        "src.tools.design_rules:_node_index",
+        "src.tools.search:_index",
+    ),
+    "DRC_ERRORS_KNOWLEDGE": ("src.tools.drc_debug:_responses", "src.tools.search:_index"),
+    "TIMING_VIOLATIONS_KNOWLEDGE": ("src.tools.timing_debug:_responses", "src.tools.search:_index"),
+    "CHECKLIST_ITEMS": ("src.tools.tapeout:_responses", "src.tools.search:_index"),
+    "CATEGORY_ALIASES": ("src.tools.tapeout:_responses",),
+    "TEMPLATES": ("src.tools.communication:_templates", "src.tools.search:_index"),
+}
+# Bases whose keys are resolver domains (drc_error, design_type, rule_category, ...).
+RESOLVER_BASES = frozenset(
+    {
+        "DESIGN_RULES_KNOWLEDGE",
+        "DRC_ERRORS_KNOWLEDGE",
+        "TIMING_VIOLATIONS_KNOWLEDGE",
+        "CHECKLIST_ITEMS",
+        "CATEGORY_ALIASES",
+        "TEMPLATES",
+    }
+)
+# Knowledge base -> tools whose cached responses depend on it.
+DEPENDENT_TOOLS: Dict[str, Tuple[str, ...]] = {
+    "FOUNDRY_TERMINOLOGY": (
+        "explain_foundry_term",
+        "explain_foundry_term_batch",
+        "extract_foundry_terms",
+        "search_foundry_knowledge",
+    ),
+    "SEMICONDUCTOR_ACRONYMS": (
+        "acronym_decoder",
+        "acronym_decoder_batch",
+        "extract_foundry_terms",
+        "search_foundry_knowledge",
+    ),
+    "DESIGN_RULES_KNOWLEDGE": ("design_rule_qa", "search_foundry_knowledge"),
+    "DRC_ERRORS_KNOWLEDGE": (
+        "drc_error_guide",
+        "drc_error_guide_batch",
+        "drc_report_summary",
+        "search_foundry_knowledge",
+    ),
+    "TIMING_VIOLATIONS_KNOWLEDGE": (
+        "timing_violation_debug",
+        "timing_violation_debug_batch",
+        "timing_report_summary",
+        "search_foundry_knowledge",
+    ),
+    "CHECKLIST_ITEMS": ("tapeout_checklist", "search_foundry_knowledge"),
+    "CATEGORY_ALIASES": ("tapeout_checklist",),
+    "TEMPLATES": (
+        "foundry_communication_template",
+        "foundry_communication_template_batch",
+        "search_foundry_knowledge",
+    ),
+}
+
+
+def knowledge_dir() -> Path | None:
+    value = os.getenv("MCP_KNOWLEDGE_DIR", "").strip()
+    return Path(value).resolve() if value else None
+
+
+def _loaded_builders(targets: List[str]) -> List[Callable[[], Any]]:
+    """Builders among ``targets`` whose module is already imported."""
+    builders = []
+    for target in targets:
+        module_name, _, attr = target.partition(":")
+        module = sys.modules.get(module_name)
+        if module is not None:
+            builders.append(getattr(module, attr))
+    return builders
+
+
+def invalidate(changed: List[str]) -> List[Callable[[], Any]]:
+    """Clear what ``changed`` bases feed; returns the builders to warm again."""
+    targets = sorted({target for name in changed for target in DERIVED_CACHES.get(name, ())})
+    builders = _loaded_builders(targets)
+    for builder in builders:
+        builder.cache_clear()  # type: ignore[attr-defined]
+    if RESOLVER_BASES.intersection(changed):
+        from . import resolver
+
+        resolver.alias_table.cache_clear()
+        resolver.resolve.cache_clear()
+        builders.append(resolver.warm)
+    RESULT_CACHE.discard({tool for name in changed for tool in DEPENDENT_TOOLS.get(name, ())})
+    return builders
+
+
+class KnowledgeReloader:
+    """Polls a directory and swaps its knowledge files in when they change."""
+
+    def __init__(self, directory: Path, interval: float = DEFAULT_POLL_S) -> None:
+        self.directory = directory
+        self.interval = interval
+        self._fingerprint: Optional[Tuple[Tuple[str, int, int], ...]] = None
+        self.loaded_at: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.reloads = 0
+
+    def _read(self) -> Optional[Dict[str, Tuple[str, Any]]]:
+        """New overrides if the directory changed since the last look, else ``None``."""
+        from .data import external, knowledge
+
+        current = external.fingerprint(self.directory)
+        if current == self._fingerprint:
+            return None
+        self._fingerprint = current
+        loaded = external.load_directory(self.directory, knowledge.builtin_knowledge)
+        return {name: (digest, knowledge.compacted(name, data)) for name, (digest, data) in loaded.items()}
+
+    def _apply(self, overrides: Dict[str, Tuple[str, Any]]) -> List[Callable[[], Any]]:
+        from .data import knowledge
+
+        changed = knowledge.apply_overrides(overrides)
+        self.loaded_at = time.time()
+        self.last_error = None
+        if not changed:
+            return []
+        self.reloads += 1
+        metrics.KNOWLEDGE_RELOADS.labels("applied").inc()
+        print(f"knowledge reloaded: {', '.join(changed)} (version {knowledge.knowledge_version()[:12]})")
+        return invalidate(changed)
+
+    def _reject(self, exc: Exception) -> None:
+        from .data import knowledge
+
+        self.last_error = str(exc)
+        metrics.KNOWLEDGE_RELOADS.labels("rejected").inc()
+        print(f"knowledge reload rejected, keeping version {knowledge.knowledge_version()[:12]}: {exc}")
+
+    def load(self) -> bool:
+        """Synchronous load and warm-up, for startup before serving."""
+        try:
+            overrides = self._read()
+        except (OSError, ValueError) as exc:  # KnowledgeFileError is a ValueError
+            self._reject(exc)
+            return False
+        if overrides is None:
+            return False
+        for builder in self._apply(overrides):
+            builder()
+        return True
+
+    async def reload(self) -> bool:
+        """One poll: read off the loop, swap on the loop, warm off the loop."""
+        try:
+            overrides = await asyncio.to_thread(self._read)
+        except (OSError, ValueError) as exc:
+            self._reject(exc)
+            return False
+        if overrides is None:
+            return False
+        builders = self._apply(overrides)
+        if builders:
+            await asyncio.to_thread(lambda: [builder() for builder in builders])
+        return True
+
+    async def run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.reload()
+            except Exception as exc:  # noqa: BLE001 - keep watching after surprises
+                print(f"knowledge reload failed: {exc!r}")
+
+    def status(self) -> Dict[str, Any]:
+        from .data import knowledge
+
+        return {
+            "directory": str(self.directory),
+            "overrides": knowledge.active_overrides(),
+            "loaded_at": self.loaded_at,
+            "reloads": self.reloads,
+            "last_error": self.last_error,
+        }
+
+
+RELOADER: Optional[KnowledgeReloader] = None
+
+
+def status() -> Dict[str, Any]:
+    """``knowledge`` field of ``GET /``."""
+    from .data import knowledge
+
+    info: Dict[str, Any] = {"version": knowledge.knowledge_version()}
+    if RELOADER is not None:
+        info.update(RELOADER.status())
+    return info
+
+
+def install(app: Any) -> None:
+    """Load ``MCP_KNOWLEDGE_DIR`` now and watch it while ``app`` runs, if set."""
+    global RELOADER
+    directory = knowledge_dir()
+    if directory is None:
+        return
+    try:
+        interval = float(os.getenv("MCP_KNOWLEDGE_POLL_S", DEFAULT_POLL_S))
+    except ValueError:
+        interval = DEFAULT_POLL_S
+    RELOADER = KnowledgeReloader(directory, interval)
+    RELOADER.load()
+    if interval <= 0:
+        return
+
+    reloader = RELOADER
+    parent = app.router.lifespan_context
+
+    @asynccontextmanager
+    async def lifespan(app: Any):  # type: ignore[no-untyped-def]
+        task = asyncio.create_task(reloader.run())
+        try:
+            async with parent(app) as state:
+                yield state
+        finally:
+            task.cancel()
+
+    app.router.lifespan_context = lifespan
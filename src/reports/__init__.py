@@ -0,0 +1,72 @@
+"""Streaming parsers for EDA tool reports (DRC results, timing reports).
+
+Reports can be hundreds of MB, so parsers consume an iterable of lines
+and keep only aggregates. :func:`open_report` yields lines from a file
+under ``MCP_REPORT_DIR`` (plain or gzip) without reading it whole.
+"""
+
+from __future__ import annotations
+
+import gzip
+import io
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Optional, TextIO
+
+
+class ReportPathError(ValueError):
+    """Raised when a report path is disabled, outside MCP_REPORT_DIR or missing."""
+
+
+def report_dir() -> Path | None:
+    value = os.getenv("MCP_REPORT_DIR", "").strip()
+    return Path(value).resolve() if value else None
+
+
+def resolve_report_path(path: str) -> Path:
+    """``path`` (absolute or relative to ``MCP_REPORT_DIR``) confined to that directory."""
+    base = report_dir()
+    if base is None:
+        raise ReportPathError("MCP_REPORT_DIR가 설정되지 않아 report_path를 사용할 수 없습니다. report_text로 전달하세요.")
+    resolved = (base / path).resolve()
+    if not resolved.is_relative_to(base):
+        raise ReportPathError(f"report_path는 MCP_REPORT_DIR({base}) 아래에 있어야 합니다: `{path}`")
+    if not resolved.is_file():
+        raise ReportPathError(f"리포트 파일을 찾을 수 없습니다: `{path}`")
+    return resolved
+
+
+def report_stamp(path: str) -> Optional[List[int]]:
+    """``[st_mtime_ns, st_size]`` of a report file, or None if it cannot be resolved.
+
+    Tools that read ``report_path`` add this to their result cache key, so a
+    rewritten report is parsed again instead of served from the cache.
+    """
+    try:
+        stat = resolve_report_path(path).stat()
+    except (ReportPathError, OSError):
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+@contextmanager
+def open_report(path: str) -> Iterator[TextIO]:
+    """Text stream over a report file; ``.gz`` files are decompressed on the fly."""
+    resolved = resolve_report_path(path)
+    if resolved.suffix == ".gz":
+        stream: TextIO = gzip.open(resolved, "rt", encoding="utf-8", errors="replace")
+    else:
+        stream = open(resolved, encoding="utf-8", errors="replace")
+    with stream:
+        yield stream
+
+
+@contextmanager
+def report_lines(report_text: str = "", report_path: str = "") -> Iterator[TextIO]:
+    """Lines of an inline report or a report file, whichever was given."""
+    if report_path:
+        with open_report(report_path) as stream:
+            yield stream
+    else:
+        yield io.StringIO(report_text)
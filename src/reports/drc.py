@@ -0,0 +1,219 @@
+"""Streaming DRC results parser.
+
+Understands three layouts:
+
+- Calibre ASCII results database: a ``<topcell> <precision>`` header,
+  then per rule check its name, a ``<results> <original> <text lines>``
+  count line, the rule text, and the result geometries (``p``/``e``
+  records followed by their vertex lines). Geometries are skipped
+  without being stored.
+- Calibre summary reports: ``RULECHECK <name> ... TOTAL Result Count = <n>``.
+- ICV-style summaries: ``<name>: <description> ... <n> violations found``.
+
+Each rule check is classified into a ``DRC_ERRORS_KNOWLEDGE`` type from
+its name tokens (``M1.S.1`` -> spacing on M1) or, failing that, from the
+words of its description. Memory is bounded by the number of distinct
+rule checks, not by the report size.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ..resolver import resolve
+
+# Rule deck abbreviations (TSMC/Samsung style ``<layer>.<code>.<n>``).
+# ``A`` is deliberately absent: in most decks it is the area rule.
+_RULE_CODES = {
+    "S": "spacing",
+    "SP": "spacing",
+    "SPC": "spacing",
+    "W": "width",
+    "WD": "width",
+    "WID": "width",
+    "EN": "enclosure",
+    "ENC": "enclosure",
+    "DN": "density",
+    "DEN": "density",
+    "ANT": "antenna",
+    "AR": "antenna",
+    "OV": "overlap",
+    "OVL": "overlap",
+    "EX": "extension",
+    "EXT": "extension",
+}
+_DESCRIPTION_WORDS = (
+    (re.compile(r"spac|separat|\bspace\b"), "spacing"),
+    (re.compile(r"width|\bwide\b"), "width"),
+    (re.compile(r"enclos"), "enclosure"),
+    (re.compile(r"densit|coverage"), "density"),
+    (re.compile(r"antenna|\bpar\b|\bcar\b"), "antenna"),
+    (re.compile(r"overlap"), "overlap"),
+    (re.compile(r"exten"), "extension"),
+)
+_TOKEN = re.compile(r"[._\-]+")
+_LAYER = re.compile(r"[A-Za-z]+\d*[A-Za-z]*")
+_UPPER_METAL = re.compile(r"M(?:ETAL)?([2-9]|\d{2,})")
+_DESCRIPTION_CHARS = 160
+
+_CALIBRE_SUMMARY = re.compile(r"RULECHECK\s+(\S+)\s+\.*\s*TOTAL Result Count\s*=\s*(\d+)")
+_ICV_SUMMARY = re.compile(r"^\s*(\S+?)\s*:\s*(.*?)\s*\.*\s+(\d+)\s+violations?\s+found", re.IGNORECASE)
+_DB_HEADER = re.compile(r"\S+\s+\d+")
+_DB_COUNTS = re.compile(r"(\d+)\s+(\d+)\s+(\d+)\b")
+_DB_RESULT = re.compile(r"([pe])\s+\d+\s+(\d+)")
+
+UNCLASSIFIED = "unclassified"
+
+
+@dataclass
+class RuleCheck:
+    name: str
+    error_type: str
+    layer: str
+    count: int = 0
+    description: str = ""
+
+
+@dataclass
+class DrcReport:
+    format: str = "unknown"
+    lines: int = 0
+    rules: Dict[str, RuleCheck] = field(default_factory=dict)
+
+    @property
+    def total(self) -> int:
+        return sum(rule.count for rule in self.rules.values())
+
+    def by_type(self) -> List[Tuple[str, int, Counter]]:
+        """``(error_type, violations, per-layer counts)``, most violations first."""
+        totals: Counter = Counter()
+        layers: Dict[str, Counter] = defaultdict(Counter)
+        for rule in self.rules.values():
+            if rule.count:
+                totals[rule.error_type] += rule.count
+                layers[rule.error_type][rule.layer] += rule.count
+        return [(error_type, count, layers[error_type]) for error_type, count in totals.most_common()]
+
+    def top_rules(self, error_type: Optional[str] = None, limit: int = 5) -> List[RuleCheck]:
+        rules = [r for r in self.rules.values() if r.count and (error_type is None or r.error_type == error_type)]
+        return sorted(rules, key=lambda r: (-r.count, r.name))[:limit]
+
+
+def classify(name: str, description: str = "") -> Tuple[str, str]:
+    """``(error_type, layer)`` for a rule check name such as ``M1.S.1``."""
+    tokens = [t for t in _TOKEN.split(name.upper()) if t]
+    error_type = next((_RULE_CODES[t] for t in tokens if t in _RULE_CODES), None)
+    if error_type is None:
+        error_type = next((resolve("drc_error", t) for t in tokens if resolve("drc_error", t)), None)
+    if error_type is None and description:
+        text = description.lower()
+        error_type = next((kind for pattern, kind in _DESCRIPTION_WORDS if pattern.search(text)), None)
+    candidates = [t for t in tokens if _LAYER.fullmatch(t) and t not in _RULE_CODES and not resolve("drc_error", t)]
+    # Prefer known or numbered layers over prefixes such as ``RULE_M1_...``.
+    layer = next(
+        (t for t in candidates if resolve("layer", t) or any(ch.isdigit() for ch in t)),
+        candidates[0] if candidates else "general",
+    )
+    return error_type or UNCLASSIFIED, layer
+
+
+def guide_layer(layer: str) -> str:
+    """Layer key used by ``drc_error_guide`` notes (``V1`` -> ``VIA1``, ``M5`` -> ``upper_metal``)."""
+    if key := resolve("layer", layer):
+        return key
+    return "upper_metal" if _UPPER_METAL.fullmatch(layer) else layer
+
+
+class _Aggregator:
+    def __init__(self) -> None:
+        self.report = DrcReport()
+
+    def add(self, name: str, count: int, description: str = "") -> None:
+        rule = self.report.rules.get(name)
+        if rule is None:
+            error_type, layer = classify(name, description)
+            rule = self.report.rules[name] = RuleCheck(name, error_type, layer)
+        rule.count += count
+        if description and not rule.description:
+            rule.description = description[:_DESCRIPTION_CHARS]
+
+
+def _parse_db(lines: Iterable[str], agg: _Aggregator) -> None:
+    """Calibre ASCII results database, after the ``<topcell> <precision>`` header."""
+    report = agg.report
+    name: Optional[str] = None
+    # Results still to skip may be fewer than the violations when the run
+    # capped the results per check; the count line carries both.
+    results = violations = text_lines = skip = 0
+    description: List[str] = []
+    expect_counts = False
+    for line in lines:
+        report.lines += 1
+        if skip:
+            skip -= 1
+            continue
+        line = line.strip()
+        if not line:
+            continue
+        if expect_counts:
+            expect_counts = False
+            match = _DB_COUNTS.match(line)
+            if match:
+                results, violations, text_lines = (int(g) for g in match.groups())
+                violations = max(violations, results)
+                description = []
+                if not text_lines:
+                    agg.add(name, violations)  # type: ignore[arg-type]
+                continue
+        if text_lines:
+            description.append(line)
+            text_lines -= 1
+            if not text_lines:
+                agg.add(name, violations, " ".join(description))  # type: ignore[arg-type]
+            continue
+        if results:
+            match = _DB_RESULT.match(line)
+            if match:
+                skip = int(match.group(2))  # vertex/edge lines of this result
+                results -= 1
+            continue  # property lines of the current result
+        name, expect_counts = line.split()[0], True
+
+
+def parse_drc_report(lines: Iterable[str]) -> DrcReport:
+    """Aggregate violation counts per rule check from a DRC results stream."""
+    agg = _Aggregator()
+    iterator = iter(lines)
+    for first in iterator:
+        agg.report.lines += 1
+        if first.strip():
+            break
+    else:
+        return agg.report
+
+    if _DB_HEADER.fullmatch(first.strip()) and not _CALIBRE_SUMMARY.search(first):
+        agg.report.format = "calibre-db"
+        _parse_db(iterator, agg)
+        return agg.report
+
+    for line in _chain(first, iterator, agg.report):
+        match = _CALIBRE_SUMMARY.search(line)
+        if match:
+            agg.report.format = "calibre-summary"
+            agg.add(match.group(1), int(match.group(2)))
+            continue
+        match = _ICV_SUMMARY.match(line)
+        if match:
+            agg.report.format = "icv-summary"
+            agg.add(match.group(1), int(match.group(3)), match.group(2))
+    return agg.report
+
+
+def _chain(first: str, rest: Iterable[str], report: DrcReport) -> Iterable[str]:
+    yield first
+    for line in rest:
+        report.lines += 1
+        yield line
@@ -0,0 +1,254 @@
+"""Canonical argument resolver shared by all tools.
+
+Tools receive free-form enum-like arguments ("N5", "5 NM", "mixed-signal",
+"Max Transition", "tsmc"). Each argument domain has an alias table mapping a
+compact form (case folded, separators dropped) to the canonical key used by
+the knowledge bases, so every tool accepts the same spellings:
+
+    >>> resolve("node", "N5")
+    '5nm'
+    >>> resolve("design_type", "Mixed-Signal")
+    'mixed_signal'
+
+Tables are built on first use from the knowledge bases (plus a few explicit
+abbreviations) and lookups are memoized, so resolution is a dict hit. Process
+nodes are parsed rather than enumerated, since any node name is valid input.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, Optional
+
+_SEPARATORS = re.compile(r"[\s_\-/.]+")
+_NODE = re.compile(r"n?(\d+(?:\.\d+)?)(nm|um|μm)?")
+
+# Nodes below this are FinFET-era "advanced" processes; 28nm and up are mature.
+ADVANCED_NODE_NM = 28
+
+
+def compact(value: str) -> str:
+    """Case-fold and drop separators: ``"Mixed-Signal"`` -> ``"mixedsignal"``."""
+    return _SEPARATORS.sub("", value.casefold())
+
+
+def _knowledge_keys(name: str) -> Callable[[], Iterable[str]]:
+    def keys() -> Iterable[str]:
+        from .data.knowledge import get_knowledge
+
+        return get_knowledge(name).keys()
+
+    return keys
+
+
+def _rule_categories() -> Iterable[str]:
+    from .data.knowledge import get_knowledge
+
+    documented = ["metal", "via", "poly", "well", "antenna", "density", "esd", "general"]
+    found = [c for node in get_knowledge("DESIGN_RULES_KNOWLEDGE").values() for c in node]
+    return documented + found
+
+
+def _checklist_categories() -> Iterable[str]:
+    from .data.knowledge import get_knowledge
+
+    return ["all"] + list(get_knowledge("CATEGORY_ALIASES")["all"])
+
+
+def _methodology_topics() -> Iterable[str]:
+    from .tools.methodology import GUIDES
+
+    return GUIDES.keys()
+
+
+def _document_types() -> Iterable[str]:
+    from .tools.pdk import DOC_GUIDES
+
+    return DOC_GUIDES.keys()
+
+
+def _aspects() -> Iterable[str]:
+    from .tools.process import ALLOWED_ASPECTS
+
+    return ALLOWED_ASPECTS.keys()
+
+
+def _static(*keys: str) -> Callable[[], Iterable[str]]:
+    return lambda: keys
+
+
+# Canonical keys per domain.
+_CANONICAL: Dict[str, Callable[[], Iterable[str]]] = {
+    "foundry": _static("general", "TSMC", "Samsung", "Intel", "GlobalFoundries", "UMC", "SMIC"),
+    "rule_category": _rule_categories,
+    "design_type": _knowledge_keys("CHECKLIST_ITEMS"),
+    "checklist_category": _checklist_categories,
+    "drc_error": _knowledge_keys("DRC_ERRORS_KNOWLEDGE"),
+    "timing_violation": _knowledge_keys("TIMING_VIOLATIONS_KNOWLEDGE"),
+    "severity": _static("critical", "medium", "minor"),
+    "methodology_topic": _methodology_topics,
+    "process_class": _static("advanced", "mature"),
+    "document_type": _document_types,
+    "communication_type": _knowledge_keys("TEMPLATES"),
+    "aspect": _aspects,
+    "layer": _static("M1", "METAL", "upper_metal", "VIA1", "VIA2", "CO", "POLY", "DIFF", "DIFF_POLY", "IMP", "NWELL_PWELL"),
+}
+
+# Abbreviations and synonyms that are not spelling variants of a key.
+_ALIASES: Dict[str, Dict[str, str]] = {
+    "foundry": {
+        "generic": "general",
+        "samsungfoundry": "Samsung",
+        "sf": "Samsung",
+        "ifs": "Intel",
+        "intelfoundry": "Intel",
+        "gf": "GlobalFoundries",
+        "gfs": "GlobalFoundries",
+    },
+    "rule_category": {
+        "metals": "metal",
+        "vias": "via",
+        "cut": "via",
+        "ant": "antenna",
+        "fill": "density",
+        "dummyfill": "density",
+    },
+    "design_type": {
+        "logic": "digital",
+        "ams": "mixed_signal",
+        "analogmixedsignal": "mixed_signal",
+        "sram": "memory",
+        "pad": "io",
+    },
+    "checklist_category": {
+        "drc": "drc_lvs",
+        "lvs": "drc_lvs",
+        "physicalverification": "drc_lvs",
+        "sta": "timing",
+        "si": "signal_integrity",
+        "docs": "documentation",
+    },
+    "drc_error": {
+        "space": "spacing",
+        "enc": "enclosure",
+        "ext": "extension",
+    },
+    "timing_violation": {
+        "maxtran": "max_transition",
+        "slew": "max_transition",
+        "maxcap": "max_capacitance",
+        "fanout": "max_fanout",
+        "skew": "clock_skew",
+    },
+    "severity": {
+        "high": "critical",
+        "med": "medium",
+        "low": "minor",
+    },
+    "methodology_topic": {
+        "cts": "clock_tree",
+        "pdn": "power_grid",
+        "place": "placement",
+        "route": "routing",
+        "timing": "timing_closure",
+        "mv": "multi_voltage",
+    },
+    "process_class": {
+        "adv": "advanced",
+        "leadingedge": "advanced",
+        "finfet": "advanced",
+        "legacy": "mature",
+        "planar": "mature",
+    },
+    "document_type": {
+        "techfile": "tech_file",
+        "techlef": "tech_file",
+        "spice": "spice_model",
+        "liberty": "cell_library",
+        "stdcell": "cell_library",
+        "io": "io_library",
+        "memory": "memory_compiler",
+    },
+    "communication_type": {
+        "inquiry": "technical_inquiry",
+        "waiver": "drc_waiver_request",
+        "schedule": "tapeout_schedule",
+        "yield": "yield_issue_report",
+        "respin": "respin_request",
+    },
+    "aspect": {
+        "perf": "performance",
+        "speed": "performance",
+    },
+    # Layer names as rule decks spell them -> drc_error_guide layer notes.
+    "layer": {
+        "metal1": "M1",
+        "v1": "VIA1",
+        "v2": "VIA2",
+        "ct": "CO",
+        "cont": "CO",
+        "contact": "CO",
+        "po": "POLY",
+        "gate": "POLY",
+        "od": "DIFF",
+        "aa": "DIFF",
+        "active": "DIFF",
+        "diffusion": "DIFF",
+        "nw": "NWELL_PWELL",
+        "pw": "NWELL_PWELL",
+        "nwell": "NWELL_PWELL",
+        "pwell": "NWELL_PWELL",
+        "np": "IMP",
+        "pp": "IMP",
+    },
+}
+
+
+@lru_cache(maxsize=None)
+def alias_table(domain: str) -> Dict[str, str]:
+    """``{compact alias: canonical key}`` for ``domain``."""
+    table: Dict[str, str] = {}
+    for key in _CANONICAL[domain]():
+        table.setdefault(compact(key), key)
+    for alias, key in _ALIASES.get(domain, {}).items():
+        table.setdefault(alias, key)
+    return table
+
+
+def warm() -> None:
+    """Build every alias table up front."""
+    for domain in _CANONICAL:
+        alias_table(domain)
+
+
+def _parse_node(value: str) -> Optional[str]:
+    match = _NODE.fullmatch(re.sub(r"[\s_\-]+", "", value.casefold()))
+    if not match:
+        return None
+    size = float(match.group(1)) * (1 if match.group(2) in (None, "nm") else 1000)
+    return f"{size:g}nm"
+
+
+def node_nm(value: str) -> Optional[float]:
+    """Feature size of a process node in nm (``"N5"`` -> ``5.0``)."""
+    node = resolve("node", value)
+    return float(node[:-2]) if node else None
+
+
+@lru_cache(maxsize=4096)
+def resolve(domain: str, value: str) -> Optional[str]:
+    """Canonical key for ``value`` in ``domain``, or ``None`` if unknown."""
+    if not value:
+        return None
+    if domain == "node":
+        return _parse_node(value)
+    key = alias_table(domain).get(compact(value))
+    if key is None and domain == "process_class" and (size := node_nm(value)) is not None:
+        key = "advanced" if size < ADVANCED_NODE_NM else "mature"
+    return key
+
+
+def canonical(domain: str, value: str) -> str:
+    """Like :func:`resolve`, falling back to the stripped input."""
+    return resolve(domain, value) or value.strip()
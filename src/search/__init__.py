@@ -0,0 +1 @@
+"""Precomputed lookup and search indexes over the knowledge bases."""
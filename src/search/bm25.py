@@ -0,0 +1,119 @@
+"""In-memory BM25 inverted index with Korean/English tokenization.
+
+English (and other Latin/digit) text is split into lowercase alphanumeric
+tokens. Korean words carry attached particles ("간격이", "간격을"), so each
+Hangul run is indexed as overlapping character bigrams, which lets "간격"
+match either form without a morphological analyzer.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import re
+from collections import Counter
+from typing import Any, Dict, Generic, Iterable, List, Mapping, Tuple, TypeVar
+
+T = TypeVar("T")
+
+_TOKEN = re.compile(r"[0-9a-z]+|[가-힣]+")
+_HANGUL_START = "가"
+_STEP_KEY = re.compile(r"step\d+")
+
+
+def tokenize(text: str) -> List[str]:
+    tokens: List[str] = []
+    for match in _TOKEN.finditer(text.lower()):
+        word = match.group()
+        if word[0] >= _HANGUL_START and len(word) > 1:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        else:
+            tokens.append(word)
+    return tokens
+
+
+class BM25Index(Generic[T]):
+    """Okapi BM25 over ``(payload, text)`` documents, built once."""
+
+    def __init__(self, documents: Iterable[Tuple[T, str]], k1: float = 1.5, b: float = 0.75) -> None:
+        self.payloads: List[T] = []
+        self._postings: Dict[str, List[Tuple[int, int]]] = {}
+        lengths: List[int] = []
+        for payload, text in documents:
+            doc = len(self.payloads)
+            self.payloads.append(payload)
+            counts = Counter(tokenize(text))
+            lengths.append(sum(counts.values()))
+            for token, tf in counts.items():
+                self._postings.setdefault(token, []).append((doc, tf))
+
+        n_docs = len(self.payloads)
+        avgdl = (sum(lengths) / n_docs) if n_docs else 0.0
+        # Precompute per-document length normalization and per-token idf.
+        self._norm = [k1 * (1 - b + b * (length / avgdl if avgdl else 0.0)) for length in lengths]
+        self._idf = {
+            token: math.log(1 + (n_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+            for token, postings in self._postings.items()
+        }
+        self._k1 = k1
+        self._b = b
+        self._avgdl = avgdl
+
+    def __len__(self) -> int:
+        return len(self.payloads)
+
+    def search(self, query: str, top_k: int = 5) -> List[Tuple[float, T]]:
+        scores: Dict[int, float] = {}
+        k1 = self._k1
+        norm = self._norm
+        for token in set(tokenize(query)):
+            postings = self._postings.get(token)
+            if not postings:
+                continue
+            idf = self._idf[token]
+            for doc, tf in postings:
+                scores[doc] = scores.get(doc, 0.0) + idf * tf * (k1 + 1) / (tf + norm[doc])
+        best = heapq.nlargest(top_k, scores.items(), key=lambda item: item[1])
+        return [(round(score, 3), self.payloads[doc]) for doc, score in best]
+
+    def score(self, query: str, text: str) -> float:
+        """BM25 score of a document outside the index, using the index's statistics.
+
+        Tokens the index has never seen get the idf of a term no indexed
+        document contains, so outside hits rank on the same scale as
+        :meth:`search` results.
+        """
+        counts = Counter(tokenize(text))
+        length = sum(counts.values())
+        norm = self._k1 * (1 - self._b + self._b * (length / self._avgdl if self._avgdl else 0.0))
+        unseen = math.log(1 + (len(self.payloads) + 0.5) / 0.5)
+        total = 0.0
+        for token in set(tokenize(query)):
+            tf = counts.get(token)
+            if tf:
+                total += self._idf.get(token, unseen) * tf * (self._k1 + 1) / (tf + norm)
+        return round(total, 3)
+
+
+def flatten_text(value: Any) -> str:
+    """Join every string in a nested entry.
+
+    Top-level dict keys are field names and are skipped; keys of nested
+    dicts (layer names, solution categories) are kept, except ``stepN``.
+    """
+    parts: List[str] = []
+
+    def walk(node: Any, depth: int) -> None:
+        if isinstance(node, str):
+            parts.append(node)
+        elif isinstance(node, Mapping):
+            for key, item in node.items():
+                if depth > 0 and not _STEP_KEY.fullmatch(key):
+                    parts.append(key.replace("_", " "))
+                walk(item, depth + 1)
+        elif isinstance(node, (list, tuple)):
+            for item in node:
+                walk(item, depth)
+
+    walk(value, 0)
+    return "\n".join(parts)
@@ -0,0 +1,156 @@
+"""Trigram + edit-distance index for near-miss key lookups.
+
+Used by ``explain_foundry_term`` and ``acronym_decoder`` so that inputs such
+as ``"metal fill"``, ``"C-PODE"`` or ``"antenna ratio"`` resolve to a
+registered key (or a ranked "did you mean" list) in a single call.
+
+Texts are normalized by case folding and dropping everything that is not
+alphanumeric. Exact normalized matches are an O(1) dict lookup. Otherwise
+candidates are gathered from trigram postings, and only the best few are
+re-ranked with Levenshtein distance, so a query stays well under a
+millisecond even with 10k+ indexed texts.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+# Score at or above which a fuzzy match is used without asking.
+AUTO_THRESHOLD = 0.85
+# Minimum score for a candidate to be offered as a suggestion.
+SUGGEST_THRESHOLD = 0.35
+# Hint texts (e.g. related terms) point at an entry but are weaker evidence.
+HINT_WEIGHT = 0.8
+_CANDIDATES = 48
+_RERANK = 8
+# Posting lists longer than this (or 2% of the index) count as "common".
+_COMMON_MIN = 64
+
+
+class Match(NamedTuple):
+    key: str
+    text: str
+    score: float
+
+
+def normalize(text: str) -> str:
+    return "".join(ch for ch in text.casefold() if ch.isalnum())
+
+
+def _trigrams(norm: str) -> List[str]:
+    padded = f"  {norm} "
+    return [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+
+def _levenshtein(a: str, b: str) -> int:
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        previous = current
+    return previous[-1]
+
+
+class FuzzyIndex:
+    """Index of ``(text, key)`` pairs resolving free-form input to keys.
+
+    ``aliases`` (keys, full names) may resolve exactly after normalization;
+    ``hints`` (related terms) only ever surface through fuzzy ranking.
+    """
+
+    def __init__(
+        self,
+        aliases: Iterable[Tuple[str, str]],
+        hints: Iterable[Tuple[str, str]] = (),
+    ) -> None:
+        self._exact: Dict[str, str] = {}
+        self._texts: List[str] = []
+        self._norms: List[str] = []
+        self._keys: List[str] = []
+        self._weights: List[float] = []
+        self._grams: List[frozenset] = []
+        self._postings: Dict[str, List[int]] = {}
+        seen = set()
+        for weight, pairs in ((1.0, aliases), (HINT_WEIGHT, hints)):
+            for text, key in pairs:
+                norm = normalize(text)
+                if not norm or (norm, key) in seen:
+                    continue
+                seen.add((norm, key))
+                if weight == 1.0:
+                    self._exact.setdefault(norm, key)
+                grams = frozenset(_trigrams(norm))
+                doc = len(self._texts)
+                self._texts.append(text)
+                self._norms.append(norm)
+                self._keys.append(key)
+                self._weights.append(weight)
+                self._grams.append(grams)
+                for gram in grams:
+                    self._postings.setdefault(gram, []).append(doc)
+
+        self._common = max(_COMMON_MIN, len(self._texts) // 50)
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def exact(self, query: str) -> Optional[str]:
+        return self._exact.get(normalize(query))
+
+    def search(self, query: str, limit: int = 5) -> List[Match]:
+        """Rank keys by similarity to ``query`` (best match per key)."""
+        norm = normalize(query)
+        if not norm:
+            return []
+        grams = set(_trigrams(norm))
+        # Count candidates from the rarest trigrams first and skip very common
+        # ones once rarer evidence exists; they barely discriminate but
+        # dominate the cost on large indexes.
+        lists = sorted((p for p in map(self._postings.get, grams) if p), key=len)
+        overlap: Counter[int] = Counter()
+        for postings in lists:
+            if overlap and len(postings) > self._common:
+                break
+            overlap.update(postings)
+
+        # Exact trigram Dice on the leading candidates, then the costlier edit
+        # distance only on the few best of those.
+        scored = []
+        for doc, _ in overlap.most_common(_CANDIDATES):
+            doc_grams = self._grams[doc]
+            scored.append((2.0 * len(grams & doc_grams) / (len(grams) + len(doc_grams)), doc))
+        scored.sort(reverse=True)
+
+        best: Dict[str, Match] = {}
+        for dice, doc in scored[:_RERANK]:
+            target = self._norms[doc]
+            edit = 1.0 - _levenshtein(norm, target) / max(len(norm), len(target))
+            score = round(self._weights[doc] * (dice + edit) / 2.0, 3)
+            key = self._keys[doc]
+            if score >= SUGGEST_THRESHOLD and (key not in best or score > best[key].score):
+                best[key] = Match(key, self._texts[doc], score)
+        return sorted(best.values(), key=lambda m: -m.score)[:limit]
+
+    def resolve(
+        self,
+        query: str,
+        auto_threshold: Optional[float] = AUTO_THRESHOLD,
+        limit: int = 5,
+    ) -> Tuple[Optional[str], List[Match]]:
+        """Return ``(key, suggestions)``.
+
+        ``key`` is set for an exact normalized alias hit, or for a fuzzy match
+        scoring at least ``auto_threshold`` (``None`` disables fuzzy
+        auto-resolution). Otherwise ``suggestions`` lists ranked candidates.
+        """
+        key = self.exact(query)
+        if key is not None:
+            return key, []
+        matches = self.search(query, limit)
+        if matches and auto_threshold is not None and matches[0].score >= auto_threshold:
+            return matches[0].key, []
+        return None, matches
@@ -1,49 +1,31 @@
 """Design Foundry MCP server entrypoint.
 
 Stateless, HTTP-streaming MCP server built with the FastMCP helper.
-Tools are registered in dedicated modules under ``src/tools``.
+Tools are implemented in dedicated modules under ``src/tools`` and declared
+once in ``src/registry.py``.
+
+Each transport imports only what it uses: HTTP builds the FastMCP server
+and Starlette app from :mod:`src.http_app`, stdio serves the registry from
+:mod:`src.stdio`. The module-level ``server`` and ``app`` (for ``uvicorn
+src.server:app`` and ``api/index.py``) are built on first access;
+:func:`create_app` builds a fresh app. ``main`` prints a startup timing
+report (see :mod:`src.startup`).
 """
 
 from __future__ import annotations
 
 import os
-from typing import Any, Iterable
-
-from fastmcp import FastMCP, settings as mcp_settings
-from mcp.server.sse import SseServerTransport
-from starlette.applications import Starlette
-from starlette.responses import JSONResponse
-from starlette.routing import Route
-from starlette.requests import Request
-from starlette.responses import Response
-import uvicorn
-import warnings
-
-# Suppress noisy deprecation warnings from vendored websockets in uvicorn
-warnings.filterwarnings(
-    "ignore",
-    category=DeprecationWarning,
-    module=r"_vendor\.websockets\.legacy.*",
-)
-warnings.filterwarnings(
-    "ignore",
-    category=DeprecationWarning,
-    module=r"_vendor\.uvicorn\.protocols\.websockets\.websockets_impl",
-)
-# Also suppress upstream module paths (non-vendored) that Vercel might use
-warnings.filterwarnings(
-    "ignore",
-    category=DeprecationWarning,
-    module=r"websockets\.legacy.*",
-)
-warnings.filterwarnings(
-    "ignore",
-    category=DeprecationWarning,
-    module=r"uvicorn\.protocols\.websockets\.websockets_impl",
-)
-
-def create_server(extra_tools: Iterable[Any] | None = None) -> FastMCP:
-    """Create and configure the MCP server instance.
+from typing import TYPE_CHECKING, Any, Iterable
+
+from . import startup
+
+if TYPE_CHECKING:
+    from fastmcp import FastMCP
+    from starlette.applications import Starlette
+
+
+def create_server(extra_tools: Iterable[Any] | None = None) -> "FastMCP":
+    """Create and configure the FastMCP server instance.
 
     Parameters
     ----------
@@ -52,115 +34,80 @@ def create_server(extra_tools: Iterable[Any] | None = None) -> FastMCP:
         should be registered in addition to the built-in tool set. Useful for
         testing or extensions.
     """
+    from .http_app import create_server
 
-    server = FastMCP(name="design-foundry-mcp")
+    return create_server(extra_tools)
 
-    # Core tool registration is deferred to keep this module minimal.
-    # Individual tool modules will import the shared server instance and
-    # attach their tools.
-    if extra_tools:
-        for tool in extra_tools:
-            server.add_tool(tool)
 
-    return server
+def create_app(mcp: "FastMCP | None" = None) -> "Starlette":
+    """Create the Starlette app; ``/sse`` uses ``mcp`` or the default ``server``."""
+    from .http_app import create_app
 
+    return create_app(mcp if mcp is not None else __getattr__("server"))
 
-# Create the default server instance and expose FastAPI app for hosting.
-server = create_server()
 
-# Register tools by importing modules (side-effect registration via decorator).
-# Keep imports near here to avoid import cycles.
-from .tools import terminology  # noqa: F401
-from .tools import design_rules  # noqa: F401
-from .tools import tapeout  # noqa: F401
-from .tools import process  # noqa: F401
-from .tools import pdk  # noqa: F401
-from .tools import communication  # noqa: F401
-from .tools import methodology  # noqa: F401
+def _build_defaults() -> None:
+    with startup.phase("registry"):
+        from . import registry  # noqa: F401
+    with startup.phase("import"):
+        from . import http_app
+    with startup.phase("server"):
+        server = http_app.create_server()
+        app = http_app.create_app(server)
+    globals().update(server=server, app=app)
 
 
-def _build_sse_app() -> Starlette:
-    """Create Starlette app that bridges FastMCP over SSE and JSON RPC.
+def __getattr__(name: str) -> Any:
+    # Default FastMCP ``server`` and ASGI ``app`` (uvicorn src.server:app ...).
+    if name in ("server", "app"):
+        if name not in globals():
+            _build_defaults()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-    Provides:
-    - GET /          : status JSON
-    - POST /         : JSON-RPC (initialize/tools.list/tools.call) via mcp_handler
-    - GET /health    : health check
-    - GET /sse       : MCP SSE stream
-    - POST /messages : MCP SSE message endpoint
-    """
 
-    sse = SseServerTransport("/messages")
-
-    async def handle_sse(request: Request):
-        async with sse.connect_sse(
-            request.scope, request.receive, request._send
-        ) as streams:
-            await server._mcp_server.run(  # type: ignore[attr-defined]
-                streams[0],
-                streams[1],
-                server._mcp_server.create_initialization_options(),  # type: ignore[attr-defined]
-            )
-
-    async def handle_messages(request: Request):
-        await sse.handle_post_message(
-            request.scope, request.receive, request._send
-        )
-
-    async def root_handler(request: Request):
-        if request.method == "GET":
-            return JSONResponse({"name": "design-foundry-mcp", "version": "1.0.0", "status": "running"})
-        # POST -> JSON-RPC fallback (non-SSE HTTP)
-        try:
-            payload = await request.json()
-        except Exception as exc:  # noqa: BLE001
-            return JSONResponse(
-                {"jsonrpc": "2.0", "id": None, "error": {"code": -32700, "message": f"Parse error: {exc}"}},
-                status_code=400,
-            )
-        # Lazy import to avoid circular dependency on startup
-        from api import mcp_handler
-
-        try:
-            response = await mcp_handler.dispatch_async(payload if isinstance(payload, dict) else {})
-            return JSONResponse(response)
-        except Exception as exc:  # noqa: BLE001
-            # log and return structured error
-            print("mcp-http error", exc)
-            return JSONResponse(
-                {"jsonrpc": "2.0", "id": payload.get("id") if isinstance(payload, dict) else None, "error": {"code": -32603, "message": str(exc)}},
-                status_code=500,
-            )
-
-    async def health_handler(request: Request):
-        return JSONResponse({"status": "ok"})
-
-    return Starlette(
-        debug=mcp_settings.debug,
-        routes=[
-            Route("/", endpoint=root_handler, methods=["GET", "POST"]),
-            Route("/health", endpoint=health_handler, methods=["GET"]),
-            Route("/sse", endpoint=handle_sse, methods=["GET"]),
-            Route("/messages", endpoint=handle_messages, methods=["POST"]),
-            Route("/favicon.ico", endpoint=lambda request: Response(status_code=204)),
-            Route("/favicon.png", endpoint=lambda request: Response(status_code=204)),
-        ],
-    )
+def _warmup(forked: bool = False) -> None:
+    from . import registry
 
+    if forked or not registry.LAZY_LOAD:
+        from .workers import preload
 
-# ASGI app for uvicorn entrypoint (uvicorn src.server:app ...)
-app = _build_sse_app()
+        with startup.phase("warmup"):
+            preload()
+    else:
+        startup.record("warmup", 0.0, note="lazy (first tools/call)")
 
 
-def main() -> None:
-    """Run the server (SSE over HTTP by default, stdio optional)."""
-    transport = os.getenv("MCP_TRANSPORT", "sse")
-    if transport not in ("sse", "stdio"):
-        transport = "sse"
-    if transport == "stdio":
-        server.run(transport="stdio")
+def _serve_stdio() -> None:
+    with startup.phase("registry"):
+        from . import registry  # noqa: F401
+    with startup.phase("import"):
+        from . import stdio
+    with startup.phase("server"):
+        server = stdio.create_server()
+    _warmup()
+    startup.report("stdio")
+    stdio.serve(server)
+
+
+def _serve_http() -> None:
+    app = __getattr__("app")
+    with startup.phase("import"):
+        from fastmcp import settings as mcp_settings
+
+        from .workers import serve, worker_count
+
+    workers = worker_count(os.getenv("MCP_WORKERS"))
+    if workers > 1 and hasattr(os, "fork"):
+        _warmup(forked=True)
+        startup.report(f"http, {workers} workers")
+        serve(app, mcp_settings.host, mcp_settings.port, workers, log_level=mcp_settings.log_level, warm=False)
         return
 
+    with startup.phase("import"):
+        import uvicorn
+    _warmup()
+    startup.report("http")
     uvicorn.run(
         app,
         host=mcp_settings.host,
@@ -169,7 +116,20 @@ def main() -> None:
     )
 
 
-if __name__ == "__main__":
-    main()
+def main() -> None:
+    """Run the server (SSE over HTTP by default, stdio optional).
 
+    ``MCP_WORKERS`` > 1 (or ``auto``) serves HTTP from pre-forked workers,
+    see :mod:`src.workers`.
+    """
+    transport = os.getenv("MCP_TRANSPORT", "sse")
+    if transport not in ("sse", "stdio"):
+        transport = "sse"
+    if transport == "stdio":
+        _serve_stdio()
+    else:
+        _serve_http()
 
+
+if __name__ == "__main__":
+    main()
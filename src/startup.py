@@ -0,0 +1,79 @@
+"""Boot timing report.
+
+``python -m src.server`` times each startup phase and prints one line per
+phase when the server is ready. The report goes to stderr, so it stays out
+of the stdio transport's stdout channel. The phases are:
+
+- ``registry``: tool definitions and the argument validators.
+- ``import``: the modules the chosen transport needs (the stdio transport
+  loads neither FastMCP nor the Starlette app).
+- ``server``: the FastMCP server and Starlette app for HTTP, the MCP SDK's
+  low-level server for stdio.
+- ``warmup``: tool modules, knowledge bases and indexes (see
+  :func:`src.workers.preload`). Skipped, and reported as ``lazy``, unless
+  workers are forked or ``MCP_LAZY_LOAD=0``.
+
+Each phase records wall time and how many modules it imported. HTTP
+servers also return the report in the ``startup`` field of ``GET /``.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+_PHASES: List[Dict[str, Any]] = []
+_MODE: Optional[str] = None
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Time the enclosed block as startup phase ``name``."""
+    modules = len(sys.modules)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, time.perf_counter() - start, len(sys.modules) - modules)
+
+
+def record(name: str, seconds: float, modules: int = 0, note: str = "") -> None:
+    """Add ``seconds`` and ``modules`` to phase ``name``, creating it if new."""
+    for entry in _PHASES:
+        if entry["phase"] == name:
+            entry["ms"] = round(entry["ms"] + seconds * 1000, 1)
+            entry["modules"] += modules
+            entry["note"] = note or entry["note"]
+            return
+    _PHASES.append({"phase": name, "ms": round(seconds * 1000, 1), "modules": modules, "note": note})
+
+
+def summary() -> Dict[str, Any]:
+    """Recorded phases and their total; ``mode`` is set by :func:`report`."""
+    return {
+        "mode": _MODE,
+        "phases": [dict(entry) for entry in _PHASES],
+        "total_ms": round(sum(entry["ms"] for entry in _PHASES), 1),
+    }
+
+
+def report(mode: str) -> str:
+    """Close the report for ``mode``, print it to stderr and return it."""
+    global _MODE
+    _MODE = mode
+    info = summary()
+    lines = [f"design-foundry-mcp startup ({mode}): {info['total_ms']:.1f} ms"]
+    for entry in info["phases"]:
+        note = f"  {entry['note']}" if entry["note"] else ""
+        lines.append(f"  {entry['phase']:<9}{entry['ms']:>9.1f} ms{entry['modules']:>6} modules{note}")
+    text = "\n".join(lines)
+    print(text, file=sys.stderr, flush=True)
+    return text
+
+
+def reset() -> None:
+    global _MODE
+    _PHASES.clear()
+    _MODE = None
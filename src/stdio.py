@@ -0,0 +1,46 @@
+"""stdio transport on the MCP SDK's low-level server.
+
+``MCP_TRANSPORT=stdio`` only needs ``tools/list`` and ``tools/call`` over
+stdin/stdout, so it skips FastMCP and the Starlette app in
+:mod:`src.http_app`. Tools are listed from ``registry.TOOL_DEFINITIONS``
+and called through :func:`src.registry.call_tool`, which validates
+arguments and shares the result cache with the HTTP transports.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+import anyio
+from mcp import types
+from mcp.server.lowlevel import Server
+from mcp.server.stdio import stdio_server
+
+from . import registry
+
+
+def create_server() -> Server:
+    """Low-level MCP server exposing the registry's tools."""
+    server: Server = Server("design-foundry-mcp")
+    tools = [types.Tool.model_validate(definition) for definition in registry.TOOL_DEFINITIONS]
+
+    @server.list_tools()
+    async def list_tools() -> List[types.Tool]:
+        return tools
+
+    # The registry's precompiled validator checks arguments; skip jsonschema.
+    @server.call_tool(validate_input=False)
+    async def call_tool(name: str, arguments: Dict[str, Any]) -> List[types.TextContent]:
+        return [types.TextContent(type="text", text=await registry.call_tool(name, arguments))]
+
+    return server
+
+
+async def _run(server: Server) -> None:
+    async with stdio_server() as (read_stream, write_stream):
+        await server.run(read_stream, write_stream, server.create_initialization_options())
+
+
+def serve(server: Server) -> None:
+    """Serve ``server`` on stdin/stdout until the client disconnects."""
+    anyio.run(_run, server)
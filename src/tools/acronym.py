@@ -1,26 +1,50 @@
 from __future__ import annotations
 
-from typing import List
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
-from src.data.acronyms_db import SEMICONDUCTOR_ACRONYMS
+from src.data.knowledge import get_knowledge
+from src.search.fuzzy import FuzzyIndex
+from src.tools.batch import dedupe, render_page
 
 
-def acronym_decoder(
-    acronym: str,
-    context: str = "general",
-) -> str:
-    """
-    반도체 업계에서 사용되는 약어와 축약어를 해석합니다.
-    """
-    key = (acronym or "").strip().upper()
-    ctx = (context or "general").strip().lower()
-    if not key:
-        return "입력 오류: acronym은 필수입니다."
+@lru_cache(maxsize=1)
+def _acronym_index() -> Optional[FuzzyIndex]:
+    """Near-miss index over acronym keys and their full names (``None`` for a searchable store)."""
+    acronyms = get_knowledge("SEMICONDUCTOR_ACRONYMS")
+    if hasattr(acronyms, "candidates"):
+        return None
+    aliases = []
+    for key, data in acronyms.items():
+        aliases.append((key, key))
+        if full_name := data.get("full_name"):
+            aliases.append((full_name, key))
+    return FuzzyIndex(aliases)
 
-    data = SEMICONDUCTOR_ACRONYMS.get(key)
-    if not data:
-        return f"등록되지 않은 약어입니다: `{acronym}`. 다른 표현을 시도하거나 맥락을 알려주세요."
 
+def _lookup(acronym: str) -> Tuple[Optional[str], list]:
+    """Registered key for ``acronym`` and near-miss suggestions when there is none."""
+    key = acronym.strip().upper()
+    acronyms = get_knowledge("SEMICONDUCTOR_ACRONYMS")
+    if key in acronyms:
+        return key, []
+    index = _acronym_index()
+    if index is None:
+        index = FuzzyIndex(*acronyms.candidates(acronym))  # type: ignore[attr-defined]
+    # Distinct acronyms are often one letter apart (DRC/DRV), so only
+    # normalized exact hits resolve; fuzzy matches become suggestions.
+    return index.resolve(acronym, auto_threshold=None)
+
+
+def _not_found(acronym: str, suggestions: list) -> str:
+    message = f"등록되지 않은 약어입니다: `{acronym}`. 다른 표현을 시도하거나 맥락을 알려주세요."
+    if suggestions:
+        message += "\n- 혹시 다음 약어를 찾으셨나요: " + ", ".join(f"`{m.key}`" for m in suggestions)
+    return message
+
+
+def _format_acronym(key: str, ctx: str) -> str:
+    data = get_knowledge("SEMICONDUCTOR_ACRONYMS")[key]
     cat = data.get("category", "general")
     lines: List[str] = [
         f"### Acronym Decoder: {key}",
@@ -41,3 +65,49 @@ def acronym_decoder(
 
     return "\n".join(lines)
 
+
+def acronym_decoder(
+    acronym: str,
+    context: str = "general",
+) -> str:
+    """
+    반도체 업계에서 사용되는 약어와 축약어를 해석합니다.
+    """
+    ctx = (context or "general").strip().lower()
+    if not (acronym or "").strip():
+        return "입력 오류: acronym은 필수입니다."
+
+    key, suggestions = _lookup(acronym)
+    if key is None:
+        return _not_found(acronym, suggestions)
+    return _format_acronym(key, ctx)
+
+
+def acronym_decoder_batch(
+    acronyms: List[str],
+    context: str = "general",
+    cursor: str = "",
+) -> str:
+    """
+    여러 약어를 한 번에 해석합니다. 중복은 한 번만 설명하고, 24KB를 넘으면
+    cursor로 이어서 조회합니다.
+    """
+    ctx = (context or "general").strip().lower()
+    inputs = [a for a in (str(a) for a in acronyms or []) if a.strip()]
+    if not inputs:
+        return "입력 오류: acronyms는 비어 있지 않은 목록이어야 합니다."
+
+    # Repeats are dropped before the lookup and again once spellings resolve to one key.
+    inputs, repeated = dedupe(inputs, lambda acronym: acronym.strip().upper())
+    found = [(acronym, *_lookup(acronym)) for acronym in inputs]
+    items, aliased = dedupe(found, lambda item: item[1] or "?" + item[0].strip().upper())
+    keys = [key or "?" + acronym.strip().upper() for acronym, key, _ in items]
+    duplicates = repeated + aliased
+
+    def render(i: int) -> str:
+        acronym, key, suggestions = items[i]
+        return _format_acronym(key, ctx) if key else _not_found(acronym, suggestions)
+
+    missing = sum(1 for _, key, _ in items if key is None)
+    notes = [f"- 미등록: {missing}개"] if missing else []
+    return render_page("Acronym Decoder", keys, render, cursor, duplicates, notes)
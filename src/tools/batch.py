@@ -0,0 +1,103 @@
+"""Shared paging for the multi-item lookup tools.
+
+``acronym_decoder_batch``, ``explain_foundry_term_batch``,
+``drc_error_guide_batch`` and ``timing_violation_debug_batch`` each resolve
+a list of keys in one call. They hand the deduplicated items to
+:func:`render_page`, which concatenates one Markdown section per item and
+stays under the 24KB response budget. When the budget runs out it returns
+a continuation cursor.
+
+The server is stateless, so the cursor only encodes the offset of the next
+item plus a digest of the deduplicated list. The caller repeats the same
+list with the cursor to get the next page, and a cursor taken from a
+different list is rejected.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Tuple, TypeVar
+
+MAX_RESPONSE_BYTES = 24 * 1024
+# Room kept for the page header and the continuation footer.
+_RESERVED_BYTES = 512
+
+T = TypeVar("T")
+
+
+def dedupe(items: Iterable[T], key: Callable[[T], Hashable]) -> Tuple[List[T], int]:
+    """First occurrence of every key, in input order, and the number dropped."""
+    seen: Dict[Hashable, None] = {}
+    unique: List[T] = []
+    dropped = 0
+    for item in items:
+        k = key(item)
+        if k in seen:
+            dropped += 1
+            continue
+        seen[k] = None
+        unique.append(item)
+    return unique, dropped
+
+
+def _digest(keys: List[str]) -> str:
+    return hashlib.sha1("\x1f".join(keys).encode("utf-8")).hexdigest()[:8]
+
+
+def parse_cursor(cursor: str, keys: List[str]) -> Optional[int]:
+    """Offset encoded in ``cursor`` for ``keys``; ``None`` if it does not belong to them."""
+    if not cursor:
+        return 0
+    offset, _, digest = cursor.strip().partition(":")
+    if not offset.isdigit() or digest != _digest(keys) or int(offset) > len(keys):
+        return None
+    return int(offset)
+
+
+def render_page(
+    title: str,
+    keys: List[str],
+    render: Callable[[int], str],
+    cursor: str = "",
+    duplicates: int = 0,
+    notes: Iterable[str] = (),
+) -> str:
+    """One page of per-item sections for the deduplicated ``keys``.
+
+    ``render(i)`` returns the Markdown section for ``keys[i]``. Items are
+    rendered lazily from the cursor offset until the byte budget is spent;
+    at least one item is always rendered so paging makes progress.
+    """
+    if not keys:
+        return "입력 오류: 조회할 항목이 없습니다."
+    start = parse_cursor(cursor, keys)
+    if start is None:
+        return "입력 오류: cursor가 요청 목록과 일치하지 않습니다. 같은 목록으로 처음부터 다시 호출하세요."
+
+    budget = MAX_RESPONSE_BYTES - _RESERVED_BYTES
+    sections: List[str] = []
+    end = start
+    while end < len(keys):
+        section = render(end)
+        size = len(section.encode("utf-8")) + 2
+        if sections and size > budget:
+            break
+        budget -= size
+        sections.append(section)
+        end += 1
+
+    summary = f"- 항목: {len(keys)}개"
+    if duplicates:
+        summary += f" (중복 {duplicates}개 제외)"
+    if start or end < len(keys):
+        summary += f", 이번 응답: {start + 1}–{end}"
+    header = [f"## {title}", summary, *notes]
+
+    body = "\n".join(header) + "\n\n" + "\n\n".join(sections)
+    if end < len(keys):
+        next_cursor = f"{end}:{_digest(keys)}"
+        body += (
+            f"\n\n> 응답 크기 제한(24KB)으로 {end}/{len(keys)}개까지 표시했습니다. "
+            f'나머지는 같은 목록과 `cursor: "{next_cursor}"`로 다시 호출하세요.'
+        )
+    return body
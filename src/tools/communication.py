@@ -1,64 +1,165 @@
 """Tool: foundry_communication_template
 
 FAE와의 커뮤니케이션 템플릿을 상황별로 생성.
+`foundry_communication_template_batch`는 컨텍스트 목록(또는 CSV)으로 같은 템플릿을
+여러 건(예: rule/위치별 DRC waiver 요청) 한 번에 렌더링합니다.
 """
 
 from __future__ import annotations
 
-from typing import Any, Dict
-
-from ..data.templates_db import TEMPLATES
-from ..server import server
-
-
-def _fill(template: str, context: Dict[str, Any]) -> str:
-    # Provide safe defaults to avoid KeyError.
-    safe_ctx = {
-        "project_name": context.get("project_name", "PROJECT"),
-        "process": context.get("process", "PROCESS"),
-        "issue_description": context.get("issue_description", "Describe issue"),
-        "urgency": context.get("urgency", "medium"),
-        "sender": context.get("sender", "Team"),
-        "rule_id": context.get("rule_id", "RuleID"),
-        "location": context.get("location", "Layout location"),
-        "netlist_freeze": context.get("netlist_freeze", "YYYY-MM-DD"),
-        "signoff_complete": context.get("signoff_complete", "YYYY-MM-DD"),
-        "gds_release": context.get("gds_release", "YYYY-MM-DD"),
-        "lots": context.get("lots", "N/A"),
-        "test_conditions": context.get("test_conditions", "N/A"),
-        "impact": context.get("impact", "Impact description"),
-    }
-    try:
-        return template.format(**safe_ctx)
-    except Exception:
-        return "컨텍스트 치환 중 오류가 발생했습니다. 필드를 확인하세요."
-
-
-@server.tool(
-    name="foundry_communication_template",
-    description=(
-        "파운드리 FAE와의 커뮤니케이션 템플릿 생성. "
-        "communication_type: technical_inquiry/drc_waiver_request/"
-        "tapeout_schedule/yield_issue_report/respin_request."
-    ),
-)
+import csv
+import io
+import json
+from collections import Counter
+from functools import lru_cache
+from string import Formatter
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from ..data.knowledge import get_knowledge
+from ..resolver import resolve
+from .batch import dedupe, render_page
+
+# Values used for fields the context does not provide.
+_DEFAULTS: Dict[str, str] = {
+    "project_name": "PROJECT",
+    "process": "PROCESS",
+    "issue_description": "Describe issue",
+    "urgency": "medium",
+    "sender": "Team",
+    "rule_id": "RuleID",
+    "location": "Layout location",
+    "netlist_freeze": "YYYY-MM-DD",
+    "signoff_complete": "YYYY-MM-DD",
+    "gds_release": "YYYY-MM-DD",
+    "lots": "N/A",
+    "test_conditions": "N/A",
+    "impact": "Impact description",
+}
+_TYPES = "technical_inquiry/drc_waiver_request/tapeout_schedule/yield_issue_report/respin_request"
+
+
+class _Template:
+    """A template split once into literal text and the fields between it.
+
+    Rendering only looks up the fields the template uses and joins the
+    pieces, instead of building a defaults dict and re-parsing the format
+    string on every call.
+    """
+
+    _formatter = Formatter()
+
+    def __init__(self, text: str) -> None:
+        # (literal, field, conversion, format spec) per ``{field!conversion:spec}``;
+        # a trailing literal has field None.
+        self.parts: List[Tuple[str, Optional[str], Optional[str], str]] = [
+            (literal, field, conversion, spec or "")
+            for literal, field, spec, conversion in self._formatter.parse(text)
+        ]
+        self.fields = frozenset(field for _, field, _, _ in self.parts if field)
+
+    def render(self, context: Dict[str, Any]) -> str:
+        pieces: List[str] = []
+        for literal, field, conversion, spec in self.parts:
+            pieces.append(literal)
+            if field is None:
+                continue
+            value = context.get(field, _DEFAULTS.get(field))
+            if value is None:
+                pieces.append(f"{{{field}}}")  # left in place; reported by the batch tool
+            elif conversion or spec:
+                pieces.append(format(self._formatter.convert_field(value, conversion), spec))
+            else:
+                pieces.append(value if isinstance(value, str) else str(value))
+        return "".join(pieces)
+
+
+@lru_cache(maxsize=1)
+def _templates() -> Dict[str, _Template]:
+    return {name: _Template(text) for name, text in get_knowledge("TEMPLATES").items()}
+
+
+def _template_type(communication_type: str) -> str:
+    return resolve("communication_type", communication_type or "") or (communication_type or "").lower().strip()
+
+
 async def foundry_communication_template(
     communication_type: str,
     context: Dict[str, Any],
 ) -> str:
     """커뮤니케이션 템플릿을 Markdown 텍스트로 반환."""
-    ctype = communication_type.lower().strip()
+    ctype = _template_type(communication_type)
     if not ctype:
         return "입력 오류: communication_type은 필수입니다."
-    template = TEMPLATES.get(ctype)
+    template = _templates().get(ctype)
     if not template:
-        return (
-            f"지원하지 않는 communication_type: `{communication_type}`. "
-            "technical_inquiry/drc_waiver_request/tapeout_schedule/"
-            "yield_issue_report/respin_request 중 선택하세요."
-        )
-    body = _fill(template, context)
-    return body
+        return f"지원하지 않는 communication_type: `{communication_type}`. {_TYPES} 중 선택하세요."
+    return template.render(context or {})
+
+
+def _csv_contexts(text: str) -> Iterator[Dict[str, Any]]:
+    """Rows of a CSV with a header line; empty cells fall back to defaults."""
+    for row in csv.DictReader(io.StringIO(text.strip())):
+        yield {key.strip(): value.strip() for key, value in row.items() if key and value and value.strip()}
+
 
+async def foundry_communication_template_batch(
+    communication_type: str,
+    contexts: Optional[List[Dict[str, Any]]] = None,
+    contexts_csv: str = "",
+    defaults: Optional[Dict[str, Any]] = None,
+    cursor: str = "",
+) -> str:
+    """
+    같은 템플릿을 여러 컨텍스트로 렌더링합니다. 동일한 컨텍스트는 한 번만 렌더링하고,
+    템플릿에 없는 필드와 기본값으로 채운 필드는 항목마다가 아니라 배치당 한 번 보고합니다.
+    """
+    ctype = _template_type(communication_type)
+    if not ctype:
+        return "입력 오류: communication_type은 필수입니다."
+    template = _templates().get(ctype)
+    if not template:
+        return f"지원하지 않는 communication_type: `{communication_type}`. {_TYPES} 중 선택하세요."
+    if bool(contexts) == bool(contexts_csv.strip()):
+        return "입력 오류: contexts 또는 contexts_csv 중 하나만 지정하세요."
+    try:
+        rows = list(_csv_contexts(contexts_csv)) if contexts_csv.strip() else list(contexts or [])
+    except csv.Error as exc:
+        return f"입력 오류: CSV를 해석할 수 없습니다: {exc}"
+    if not all(isinstance(row, dict) for row in rows):
+        return "입력 오류: contexts의 각 항목은 object여야 합니다."
+    if not rows:
+        return "입력 오류: 렌더링할 컨텍스트가 없습니다."
+
+    shared = dict(defaults or {})
+    keyed, duplicates = dedupe(((json.dumps(row, sort_keys=True, default=str), row) for row in rows), lambda kr: kr[0])
+    keys = [key for key, _ in keyed]
+    items = [row for _, row in keyed]
+
+    # One pass over the keys, not over the rendered text.
+    unused: Counter = Counter()
+    defaulted: Counter = Counter()
+    for row in items:
+        unused.update(key for key in row if key not in template.fields)
+        defaulted.update(field for field in template.fields if field not in row and field not in shared)
+    unused.update(key for key in shared if key not in template.fields)
+
+    notes = [f"- 템플릿: `{ctype}` (필드: {', '.join(sorted(template.fields))})"]
+    if unused:
+        notes.append(
+            "- 템플릿에 없는 필드 (무시됨): " + ", ".join(f"`{key}` {n}건" for key, n in sorted(unused.items()))
+        )
+    if defaulted:
+        notes.append(
+            "- 값이 없어 기본값을 사용한 필드: "
+            + ", ".join(
+                f"`{field}` {n}건" + ("" if field in _DEFAULTS else " (기본값 없음, 그대로 남김)")
+                for field, n in sorted(defaulted.items())
+            )
+        )
 
+    def render(i: int) -> str:
+        # Only the items of the requested page are rendered.
+        context = {**shared, **items[i]} if shared else items[i]
+        return f"### {i + 1}/{len(items)}\n\n" + template.render(context)
 
+    return render_page("Communication Templates", keys, render, cursor, duplicates, notes)
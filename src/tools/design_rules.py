@@ -1,80 +1,209 @@
 """Tool: design_rule_qa
 
 공정 노드/카테고리별 디자인 룰 Q&A. 공개 일반 정보만 제공하며, 응답은
-Markdown 텍스트로 24KB 미만을 유지합니다.
+Markdown 텍스트로 24KB 미만을 유지합니다. Notes/Practical tips는 질문과의
+TF-IDF 코사인 유사도 순으로 정렬됩니다. 미등록 노드는 가장 가까운 등록
+노드(위/아래)의 규칙을 외삽 참고치로 표시합니다.
 """
 
 from __future__ import annotations
 
-from typing import List
-
-from ..data.design_rules_db import DESIGN_RULES_KNOWLEDGE, NodeRules, RuleCategoryEntry
-from ..server import server
-
-
-def _format_rule(node: str, category: str, entry: RuleCategoryEntry) -> str:
+from bisect import bisect_left
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Tuple
+
+from ..data.knowledge import get_knowledge
+from ..resolver import canonical, node_nm, resolve
+from ..search.tfidf import TfidfMatrix
+
+if TYPE_CHECKING:
+    from ..data.design_rules_db import NodeRules, RuleCategoryEntry
+
+
+MAX_RESPONSE_BYTES = 24 * 1024
+_FOOTER = "\n\n> 불확실하거나 NDA 대상 세부치는 파운드리 FAE에 확인을 권장합니다."
+# Facts pulled in from the node's other categories when include_related is set.
+_RELATED_LIMIT = 3
+
+
+class RuleFact(NamedTuple):
+    category: str
+    kind: str  # "notes" | "practical_considerations"
+    text: str
+
+
+class FactIndex(NamedTuple):
+    facts: List[RuleFact]
+    matrix: TfidfMatrix
+    # Facts are stored contiguously per node and per (node, category).
+    nodes: Dict[str, slice]
+    categories: Dict[Tuple[str, str], slice]
+
+
+@lru_cache(maxsize=1)
+def _fact_index() -> FactIndex:
+    facts: List[RuleFact] = []
+    texts: List[str] = []
+    nodes: Dict[str, slice] = {}
+    categories: Dict[Tuple[str, str], slice] = {}
+    for node, node_rules in get_knowledge("DESIGN_RULES_KNOWLEDGE").items():
+        node_start = len(facts)
+        for category, entry in node_rules.items():
+            start = len(facts)
+            for kind in ("notes", "practical_considerations"):
+                for text in entry.get(kind) or []:
+                    facts.append(RuleFact(category, kind, text))
+                    # The category name is context for short facts ("metal", "via").
+                    texts.append(f"{category} {text}")
+            categories[(node, category)] = slice(start, len(facts))
+        nodes[node] = slice(node_start, len(facts))
+    return FactIndex(facts, TfidfMatrix(texts), nodes, categories)
+
+
+@lru_cache(maxsize=1)
+def _node_index() -> Dict[str, Tuple[List[float], List[str]]]:
+    """Registered nodes per category as parallel lists sorted by size in nm."""
+    by_category: Dict[str, List[Tuple[float, str]]] = {}
+    for node, node_rules in get_knowledge("DESIGN_RULES_KNOWLEDGE").items():
+        size = node_nm(node)
+        if size is None:
+            continue
+        for category in node_rules:
+            by_category.setdefault(category, []).append((size, node))
+    index: Dict[str, Tuple[List[float], List[str]]] = {}
+    for category, pairs in by_category.items():
+        pairs.sort()
+        index[category] = ([size for size, _ in pairs], [node for _, node in pairs])
+    return index
+
+
+def _bracketing_nodes(category: str, size: float) -> List[str]:
+    """Nearest registered nodes below/above ``size`` (one at either end)."""
+    sizes, nodes = _node_index().get(category, ([], []))
+    i = bisect_left(sizes, size)
+    return nodes[max(i - 1, 0):i + 1]
+
+
+def _ranked(index: FactIndex, rows: slice, question: str) -> List[Tuple[float, RuleFact]]:
+    return [(score, index.facts[rows.start + i]) for i, score in index.matrix.rank(question, rows)]
+
+
+def _format_rule(
+    node: str,
+    category: str,
+    entry: RuleCategoryEntry,
+    ranked: List[Tuple[float, RuleFact]],
+    label: str = "",
+) -> List[str]:
     lines: List[str] = []
-    lines.append(f"### Design Rule: {node} / {category}")
+    lines.append(f"### Design Rule: {node} / {category}{label}")
     if mw := entry.get("min_width"):
         lines.append(f"- Min width: {mw}")
     if ms := entry.get("min_spacing"):
         lines.append(f"- Min spacing: {ms}")
     if enc := entry.get("enclosure"):
         lines.append(f"- Enclosure: {enc}")
-    if notes := entry.get("notes"):
-        lines.append("- Notes:")
-        for n in notes[:4]:
-            lines.append(f"  - {n}")
-    if tips := entry.get("practical_considerations"):
-        lines.append("- Practical tips:")
-        for t in tips[:6]:
-            lines.append(f"  - {t}")
-    return "\n".join(lines)
-
-
-@server.tool(
-    name="design_rule_qa",
-    description=(
-        "공정 노드/카테고리별 디자인 룰 질의응답. "
-        "process_node 예: '5nm','7nm','28nm','65nm'. "
-        "rule_category 예: metal/via/poly/well/antenna/density/esd/general. "
-        "응답은 Markdown 텍스트."
-    ),
-)
+    for kind, title in (("notes", "- Notes:"), ("practical_considerations", "- Practical tips:")):
+        facts = [fact.text for _, fact in ranked if fact.kind == kind]
+        if facts:
+            lines.append(title)
+            lines.extend(f"  - {text}" for text in facts)
+    return lines
+
+
+def _fit(lines: List[str], footer: str) -> str:
+    """Join ``lines`` in order, dropping the tail once the byte budget is hit."""
+    budget = MAX_RESPONSE_BYTES - len(footer.encode("utf-8"))
+    kept: List[str] = []
+    for line in lines:
+        budget -= len(line.encode("utf-8")) + 1
+        if budget < 0:
+            break
+        kept.append(line)
+    return "\n".join(kept) + footer
+
+
+def _missing_category(process_node: str, rule_category: str) -> str:
+    return (
+        f"`{process_node}` 노드에 대한 `{rule_category}` 카테고리 정보가 없습니다.\n"
+        "- 카테고리는 metal/via/poly/well/antenna/density/esd/general 중 하나로 입력하세요."
+    )
+
+
+def _extrapolated(
+    process_node: str,
+    category: str,
+    neighbours: List[str],
+    question: str,
+    foundry: str,
+) -> str:
+    """Rules of the registered nodes bracketing an unregistered one."""
+    rules = get_knowledge("DESIGN_RULES_KNOWLEDGE")
+    index = _fact_index()
+    refs = ", ".join(f"`{node}`" for node in neighbours)
+    lines = [
+        f"지원되지 않는 공정 노드입니다: `{process_node}` — 가장 가까운 등록 노드 {refs}의 규칙을 표시합니다.",
+        f"> **EXTRAPOLATED**: 아래 값은 `{process_node}` 실측치가 아닌 인접 노드 기준 외삽 참고치입니다.",
+    ]
+    for node in neighbours:
+        rows = index.categories.get((node, category), slice(0, 0))
+        ranked = _ranked(index, rows, question)
+        lines.append("")
+        lines.extend(_format_rule(node, category, rules[node][category], ranked, " (extrapolation reference)"))
+
+    lines.append("")
+    lines.append("- Foundry context: " + canonical("foundry", foundry or "general"))
+    lines.append("- Question: " + question.strip())
+    return _fit(lines, _FOOTER)
+
+
 async def design_rule_qa(
     process_node: str,
     rule_category: str,
     question: str,
     foundry: str = "general",
+    include_related: bool = False,
 ) -> str:
     """Design Rule 관련 질문에 답변합니다. 반환은 Markdown 텍스트."""
-    node_key = process_node.strip().lower()
-    cat_key = rule_category.strip().lower()
+    node_key = resolve("node", process_node) or process_node.strip().lower()
+    cat_key = resolve("rule_category", rule_category) or rule_category.strip().lower()
 
     if not node_key or not cat_key or not question.strip():
         return "입력 오류: process_node, rule_category, question은 필수입니다."
 
-    node_data: NodeRules | None = DESIGN_RULES_KNOWLEDGE.get(node_key) or DESIGN_RULES_KNOWLEDGE.get(process_node)
+    rules = get_knowledge("DESIGN_RULES_KNOWLEDGE")
+    node_data: NodeRules | None = rules.get(node_key)
     if not node_data:
-        return (
-            f"지원되지 않는 공정 노드입니다: `{process_node}`.\n"
-            "- 공개 정보 기반 일반 답변만 제공하며, 미등록 노드는 파운드리 FAE 확인을 권장합니다."
-        )
+        size = node_nm(process_node)
+        if size is not None and cat_key not in _node_index():
+            return _missing_category(process_node, rule_category)
+        neighbours = _bracketing_nodes(cat_key, size) if size is not None else []
+        if not neighbours:
+            return (
+                f"지원되지 않는 공정 노드입니다: `{process_node}`.\n"
+                "- 공개 정보 기반 일반 답변만 제공하며, 미등록 노드는 파운드리 FAE 확인을 권장합니다."
+            )
+        return _extrapolated(process_node, cat_key, neighbours, question, foundry)
 
     entry: RuleCategoryEntry | None = node_data.get(cat_key)  # type: ignore[index]
     if not entry:
-        return (
-            f"`{process_node}` 노드에 대한 `{rule_category}` 카테고리 정보가 없습니다.\n"
-            "- 카테고리는 metal/via/poly/well/antenna/density/esd/general 중 하나로 입력하세요."
-        )
-
-    body = _format_rule(process_node, rule_category, entry)
-
-    body += "\n- Foundry context: " + (foundry or "general")
-    body += "\n- Question: " + question.strip()
-
-    body += "\n\n> 불확실하거나 NDA 대상 세부치는 파운드리 FAE에 확인을 권장합니다."
-    return body
-
-
-
+        return _missing_category(process_node, rule_category)
+
+    index = _fact_index()
+    cat_rows = index.categories.get((node_key, cat_key), slice(0, 0))
+    lines = _format_rule(process_node, rule_category, entry, _ranked(index, cat_rows, question))
+
+    if include_related:
+        related = [
+            (score, fact)
+            for score, fact in _ranked(index, index.nodes.get(node_key, slice(0, 0)), question)
+            if fact.category != cat_key and score > 0
+        ][:_RELATED_LIMIT]
+        if related:
+            lines.append("- Related (other categories):")
+            lines.extend(f"  - [{fact.category}] {fact.text}" for _, fact in related)
+
+    lines.append("- Foundry context: " + canonical("foundry", foundry or "general"))
+    lines.append("- Question: " + question.strip())
+
+    return _fit(lines, _FOOTER)
@@ -1,38 +1,30 @@
 from __future__ import annotations
 
-from typing import List
+from functools import lru_cache
+from typing import List, Mapping, Optional, Tuple
 
-from src.data.drc_errors_db import DRC_ERRORS_KNOWLEDGE
+from src.data.compact import ordered_steps
+from src.data.knowledge import get_knowledge
+from src.resolver import resolve
+from src.tools.batch import dedupe, render_page
+from src.tools.prerender import ResponseTable, build_table, lookup
 
 
-def _format_steps(solutions: dict) -> List[str]:
-    # Preserve insertion order (step1...stepN)
-    lines: List[str] = []
-    for key in sorted(solutions.keys()):
-        lines.append(f"- {solutions[key]}")
-    return lines
+def _format_steps(solutions: Mapping[str, str]) -> List[str]:
+    # step1...stepN; compact entries come sorted from the loader.
+    return [f"- {step}" for step in ordered_steps(solutions)]
 
 
-def drc_error_guide(
-    error_type: str,
-    layer: str = "general",
+def _format_guide(
+    label: str,
+    data: dict,
+    layer_key: str,
     error_description: str = "",
+    note_key: Optional[str] = None,
 ) -> str:
-    """
-    DRC(Design Rule Check) 에러 유형별 원인 분석과 해결 방법을 제공합니다.
-    """
-    et = (error_type or "").strip().lower()
-    if not et:
-        return "입력 오류: error_type은 필수입니다."
-
-    data = DRC_ERRORS_KNOWLEDGE.get(et)
-    if not data:
-        available = ", ".join(sorted(DRC_ERRORS_KNOWLEDGE.keys()))
-        return f"지원하지 않는 DRC 에러 유형입니다: `{error_type}`. 사용 가능: {available}"
-
-    layer_key = (layer or "general").strip()
+    """``note_key`` picks the layer note when it differs from the ``layer_key`` shown."""
     lines: List[str] = [
-        f"### DRC Error Guide: {error_type} ({layer_key})",
+        f"### DRC Error Guide: {label} ({layer_key})",
         f"- What it is: {data.get('description','')}",
     ]
     if error_description:
@@ -54,9 +46,83 @@ def drc_error_guide(
             lines.append(f"- {tip}")
 
     layer_notes = data.get("layer_specific", {})
-    specific = layer_notes.get(layer_key) or layer_notes.get("general")
+    specific = layer_notes.get(layer_key if note_key is None else note_key) or layer_notes.get("general")
     if specific:
         lines.append(f"\n**Layer note ({layer_key})**: {specific}")
 
     return "\n".join(lines)
 
+
+def _note_key(data: dict, layer_key: str) -> str:
+    """Layer note ``layer_key`` selects; ``""`` when it falls back to the general note."""
+    return layer_key if layer_key in data.get("layer_specific", {}) else ""
+
+
+@lru_cache(maxsize=1)
+def _responses() -> ResponseTable:
+    errors = get_knowledge("DRC_ERRORS_KNOWLEDGE")
+    keys = [(et, note) for et, data in errors.items() for note in ("", *data.get("layer_specific", {}))]
+
+    def render(key: Tuple[str, str], label: str, layer_key: str, error_description: str) -> str:
+        et, note = key
+        return _format_guide(label, errors[et], layer_key, error_description, note_key=note)
+
+    return build_table(keys, render, 3)
+
+
+def drc_error_guide(
+    error_type: str,
+    layer: str = "general",
+    error_description: str = "",
+) -> str:
+    """
+    DRC(Design Rule Check) 에러 유형별 원인 분석과 해결 방법을 제공합니다.
+    """
+    et = resolve("drc_error", error_type or "") or (error_type or "").strip().lower()
+    if not et:
+        return "입력 오류: error_type은 필수입니다."
+
+    errors = get_knowledge("DRC_ERRORS_KNOWLEDGE")
+    data = errors.get(et)
+    if not data:
+        available = ", ".join(sorted(errors.keys()))
+        return f"지원하지 않는 DRC 에러 유형입니다: `{error_type}`. 사용 가능: {available}"
+
+    layer_key = (layer or "general").strip()
+    hit = lookup(_responses(), (et, _note_key(data, layer_key)), error_type, layer_key, error_description)
+    return hit if hit is not None else _format_guide(error_type, data, layer_key, error_description)
+
+
+def drc_error_guide_batch(
+    error_types: List[str],
+    layer: str = "general",
+    cursor: str = "",
+) -> str:
+    """
+    여러 DRC 에러 유형의 가이드를 한 번에 제공합니다. 같은 유형으로 해석되는
+    입력은 한 번만 설명합니다.
+    """
+    inputs = [e for e in (str(e).strip() for e in error_types or []) if e]
+    if not inputs:
+        return "입력 오류: error_types는 비어 있지 않은 목록이어야 합니다."
+
+    errors = get_knowledge("DRC_ERRORS_KNOWLEDGE")
+    resolved = [(e, resolve("drc_error", e) or e.lower()) for e in inputs]
+    unknown, _ = dedupe([e for e, et in resolved if et not in errors], str.lower)
+    items, duplicates = dedupe([(e, et) for e, et in resolved if et in errors], lambda item: item[1])
+    available = ", ".join(sorted(errors.keys()))
+    if not items:
+        return f"지원하지 않는 DRC 에러 유형입니다: {', '.join(f'`{e}`' for e in unknown)}. 사용 가능: {available}"
+
+    layer_key = (layer or "general").strip()
+    notes = []
+    if unknown:
+        notes.append(f"- 지원하지 않는 유형: {', '.join(f'`{e}`' for e in unknown)} (사용 가능: {available})")
+    return render_page(
+        "DRC Error Guide",
+        [et for _, et in items],
+        lambda i: _format_guide(items[i][0], errors[items[i][1]], layer_key),
+        cursor,
+        duplicates,
+        notes,
+    )
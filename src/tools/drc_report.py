@@ -0,0 +1,103 @@
+"""Tool: drc_report_summary
+
+Calibre/ICV DRC 결과 파일을 한 줄씩 스트리밍으로 파싱해 rule check별 위반 수를
+DRC 에러 유형(spacing/width/enclosure/density/antenna/overlap/extension)과
+레이어별로 집계하고, 위반이 많은 유형부터 `drc_error_guide` 가이드를 붙여
+요약합니다. 파일 크기와 무관하게 rule check 수만큼의 메모리만 사용합니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import List
+
+from ..reports import ReportPathError, report_lines
+from ..reports.drc import UNCLASSIFIED, DrcReport, guide_layer, parse_drc_report
+from .batch import MAX_RESPONSE_BYTES
+from .drc_debug import drc_error_guide
+
+_MAX_GUIDES = 7
+_TABLE_RULES = 15
+_FOOTER = "\n\n> 위반 수는 리포트에 기록된 결과 수 기준입니다. waiver/실제 수정 범위는 파운드리 FAE와 확인하세요."
+
+
+def _layers(counts, limit: int = 3) -> str:
+    return ", ".join(f"{layer} {count:,}" for layer, count in counts.most_common(limit))
+
+
+def _summary_lines(report: DrcReport) -> List[str]:
+    types = report.by_type()
+    lines = [
+        "## DRC Report Summary",
+        f"- 형식: {report.format}, {report.lines:,}줄",
+        f"- Rule check: {len(report.rules):,}개 (위반 있음 {sum(1 for r in report.rules.values() if r.count):,}개)",
+        f"- 총 위반: {report.total:,}",
+        "",
+        "| 순위 | 유형 | 위반 수 | 주요 레이어 |",
+        "| --- | --- | ---: | --- |",
+    ]
+    for rank, (error_type, count, layers) in enumerate(types, 1):
+        lines.append(f"| {rank} | {error_type} | {count:,} | {_layers(layers)} |")
+
+    lines += ["", "**위반이 많은 rule check**", "", "| Rule | 유형 | 레이어 | 위반 수 |", "| --- | --- | --- | ---: |"]
+    for rule in report.top_rules(limit=_TABLE_RULES):
+        lines.append(f"| `{rule.name}` | {rule.error_type} | {rule.layer} | {rule.count:,} |")
+
+    unclassified = report.top_rules(UNCLASSIFIED, limit=5)
+    if unclassified:
+        lines.append("")
+        lines.append(
+            "- 분류하지 못한 rule: "
+            + ", ".join(f"`{r.name}`" + (f" ({r.description[:60]})" if r.description else "") for r in unclassified)
+        )
+    return lines
+
+
+def _parse(report_text: str, report_path: str) -> DrcReport:
+    with report_lines(report_text, report_path) as lines:
+        return parse_drc_report(lines)
+
+
+async def drc_report_summary(
+    report_text: str = "",
+    report_path: str = "",
+    top_n: int = 3,
+) -> str:
+    """
+    DRC 결과 리포트를 유형/레이어별로 집계하고 상위 유형의 해결 가이드를 제공합니다.
+    """
+    if bool(report_text.strip()) == bool(report_path.strip()):
+        return "입력 오류: report_text 또는 report_path 중 하나만 지정하세요."
+    try:
+        # Large reports take seconds to parse; keep the event loop serving other requests.
+        report = await asyncio.to_thread(_parse, report_text, report_path.strip())
+    except ReportPathError as exc:
+        return f"입력 오류: {exc}"
+    except OSError as exc:
+        return f"리포트를 읽을 수 없습니다: {exc}"
+
+    if not report.rules:
+        return (
+            "DRC 리포트에서 rule check 결과를 찾지 못했습니다.\n"
+            "- 지원 형식: Calibre ASCII results DB, Calibre summary (`RULECHECK ... TOTAL Result Count = N`), "
+            "ICV summary (`RULE: ... N violations found`)"
+        )
+    if not report.total:
+        return "\n".join(_summary_lines(report)[:4]) + "\n\nDRC clean: 모든 rule check의 위반 수가 0입니다."
+
+    body = "\n".join(_summary_lines(report))
+    budget = MAX_RESPONSE_BYTES - len(body.encode("utf-8")) - len(_FOOTER.encode("utf-8"))
+    offenders = [t for t in report.by_type() if t[0] != UNCLASSIFIED][: max(1, min(top_n, _MAX_GUIDES))]
+    for rank, (error_type, count, layers) in enumerate(offenders, 1):
+        layer = layers.most_common(1)[0][0]
+        rules = ", ".join(f"`{r.name}` {r.count:,}" for r in report.top_rules(error_type, limit=5))
+        section = (
+            f"\n\n---\n## {rank}. {error_type}: {count:,}건 ({_layers(layers)})\n- 주요 rule: {rules}\n\n"
+            + drc_error_guide(error_type, layer=guide_layer(layer))
+        )
+        size = len(section.encode("utf-8"))
+        if size > budget:
+            break
+        budget -= size
+        body += section
+    return body + _FOOTER
@@ -0,0 +1,97 @@
+"""Tool: extract_foundry_terms
+
+붙여 넣은 문서(스펙, DRC 로그, FAE 메일 등)에서 등록된 약어와 파운드리 용어를
+한 번에 찾아 카테고리별로 해석합니다. 약어 키/정식 명칭, 용어 키/정식 명칭을
+모아 시작 시 한 번 컴파일한 matcher로 문서를 한 번만 스캔합니다.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+from ..data.knowledge import get_knowledge
+from ..search.keywords import KeywordMatcher
+from .acronym import _format_acronym
+from .batch import render_page
+from .terminology import _format_term_entry
+
+# Group title for foundry terms (acronyms are grouped by their own category).
+_TERM_GROUP = "terminology"
+
+
+@lru_cache(maxsize=1)
+def _matcher() -> KeywordMatcher:
+    """Acronyms match case-sensitively (``ATE`` but not "ate"), names and terms do not."""
+    keywords = []
+    for key, data in get_knowledge("SEMICONDUCTOR_ACRONYMS").items():
+        keywords.append((key, ("acronym", key), True))
+        if full_name := data.get("full_name"):
+            keywords.append((full_name, ("acronym", key), False))
+    for key, entry in get_knowledge("FOUNDRY_TERMINOLOGY").items():
+        keywords.append((key, ("term", key), False))
+        if full_name := entry.get("full_name"):
+            keywords.append((full_name, ("term", key), False))
+    return KeywordMatcher(keywords)
+
+
+def _group(kind: str, key: str) -> str:
+    if kind == "term":
+        return _TERM_GROUP
+    return get_knowledge("SEMICONDUCTOR_ACRONYMS")[key].get("category", "general")
+
+
+def extract_foundry_terms(
+    text: str,
+    context: str = "general",
+    cursor: str = "",
+) -> str:
+    """
+    문서에 등장하는 반도체 약어/파운드리 용어를 모두 찾아 카테고리별로 해석합니다.
+    """
+    if not (text or "").strip():
+        return "입력 오류: text는 필수입니다."
+    ctx = (context or "general").strip().lower()
+
+    counts = _matcher().count(text)
+    if not counts:
+        return (
+            f"문서({len(text):,}자)에서 등록된 약어/용어를 찾지 못했습니다.\n"
+            "- 개별 용어는 `explain_foundry_term` 또는 `acronym_decoder`로 조회하세요."
+        )
+
+    groups: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
+    for kind, key in counts:
+        groups[_group(kind, key)].append((kind, key))
+    group_total = {name: sum(counts[item] for item in items) for name, items in groups.items()}
+    # Busiest category first; within a category, most frequent first.
+    ordered: List[Tuple[str, str, str]] = [
+        (name, kind, key)
+        for name in sorted(groups, key=lambda name: (-group_total[name], name))
+        for kind, key in sorted(groups[name], key=lambda item: (-counts[item], item[1]))
+    ]
+
+    def render(i: int) -> str:
+        name, kind, key = ordered[i]
+        if kind == "term":
+            section = _format_term_entry(key, get_knowledge("FOUNDRY_TERMINOLOGY")[key], "general")
+        else:
+            section = _format_acronym(key, ctx)
+        section += f"\n- Occurrences: {counts[(kind, key)]}"
+        if i == 0 or ordered[i - 1][0] != name:
+            section = f"## {name} ({group_total[name]}회)\n\n" + section
+        return section
+
+    acronym_count = sum(1 for _, kind, _ in ordered if kind == "acronym")
+    notes = [
+        f"- 문서: {len(text):,}자, 약어 {acronym_count}개 / 용어 {len(ordered) - acronym_count}개, "
+        f"총 {sum(counts.values())}회 등장"
+    ]
+    return render_page(
+        "Extracted Terms",
+        [f"{kind}:{key}" for _, kind, key in ordered],
+        render,
+        cursor,
+        notes=notes,
+    )
@@ -5,9 +5,11 @@
 
 from __future__ import annotations
 
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Tuple
 
-from ..server import server
+from ..resolver import resolve
+from .prerender import ResponseTable, build_table, lookup
 
 
 GUIDES: Dict[str, Dict[str, List[str]]] = {
@@ -95,21 +97,28 @@ GUIDES: Dict[str, Dict[str, List[str]]] = {
 }
 
 
-@server.tool(
-    name="design_methodology_guide",
-    description=(
-        "공정 분류(advanced/mature)와 주제별 설계 방법론 가이드 제공. "
-        "methodology_topic: floorplan/power_grid/clock_tree/placement/"
-        "routing/timing_closure/low_power/multi_voltage."
-    ),
-)
+def _format_guide(key: Tuple[str, str], label: str) -> str:
+    topic, proc = key
+    lines = [f"### Design Methodology: {label} ({proc})"]
+    for t in GUIDES[topic][proc][:8]:
+        lines.append(f"- {t}")
+    lines.append("\n> 공정/파운드리별 수치는 FAE 가이드를 따르세요.")
+    return "\n".join(lines)
+
+
+@lru_cache(maxsize=1)
+def _responses() -> ResponseTable:
+    keys = [(topic, proc) for topic, info in GUIDES.items() for proc, tips in info.items() if tips]
+    return build_table(keys, _format_guide, 1)
+
+
 async def design_methodology_guide(
     methodology_topic: str,
     process_node: str = "advanced",
 ) -> str:
     """공정별 설계 방법론 가이드를 제공합니다."""
-    topic = methodology_topic.lower().strip()
-    proc = "advanced" if process_node.lower().startswith("adv") else "mature"
+    topic = resolve("methodology_topic", methodology_topic) or methodology_topic.lower().strip()
+    proc = resolve("process_class", process_node) or "mature"
 
     if not topic:
         return "입력 오류: methodology_topic은 필수입니다."
@@ -122,15 +131,6 @@ async def design_methodology_guide(
             "timing_closure/low_power/multi_voltage 중 선택하세요."
         )
 
-    tips = info.get(proc) or []
-    if not tips:
+    if not info.get(proc):
         return "가이드를 찾지 못했습니다. 입력을 다시 확인하세요."
-
-    lines = [f"### Design Methodology: {methodology_topic} ({proc})"]
-    for t in tips[:8]:
-        lines.append(f"- {t}")
-    lines.append("\n> 공정/파운드리별 수치는 FAE 가이드를 따르세요.")
-    return "\n".join(lines)
-
-
-
+    return lookup(_responses(), (topic, proc), methodology_topic) or _format_guide((topic, proc), methodology_topic)
@@ -5,9 +5,11 @@ PDK 문서 타입별 구조와 활용 팁을 설명합니다.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Dict, List
 
-from ..server import server
+from ..resolver import resolve
+from .prerender import ResponseTable, build_table, lookup
 
 
 DOC_GUIDES: Dict[str, Dict[str, List[str]]] = {
@@ -46,32 +48,9 @@ DOC_GUIDES: Dict[str, Dict[str, List[str]]] = {
 }
 
 
-@server.tool(
-    name="pdk_document_guide",
-    description=(
-        "PDK 문서 타입별 구조/주요 내용/활용 팁을 Markdown으로 안내. "
-        "document_type: tech_file/drc_deck/lvs_deck/spice_model/cell_library/"
-        "io_library/memory_compiler/design_guide."
-    ),
-)
-async def pdk_document_guide(
-    document_type: str,
-    specific_topic: str = "",
-) -> str:
-    """PDK 문서 구조와 활용 방법을 안내합니다."""
-    doc = document_type.lower().strip()
-    if not doc:
-        return "입력 오류: document_type은 필수입니다."
-
-    info = DOC_GUIDES.get(doc)
-    if not info:
-        return (
-            f"지원하지 않는 document_type: `{document_type}`. "
-            "tech_file/drc_deck/lvs_deck/spice_model/cell_library/io_library/"
-            "memory_compiler/design_guide 중 선택하세요."
-        )
-
-    lines = [f"### PDK Document Guide: {document_type}"]
+def _format_guide(doc: str, label: str, specific_topic: str = "") -> str:
+    info = DOC_GUIDES[doc]
+    lines = [f"### PDK Document Guide: {label}"]
     if contents := info.get("contents"):
         lines.append("- Typical contents:")
         for c in contents[:8]:
@@ -86,4 +65,24 @@ async def pdk_document_guide(
     return "\n".join(lines)
 
 
+@lru_cache(maxsize=1)
+def _responses() -> ResponseTable:
+    return build_table(DOC_GUIDES, _format_guide, 2)
 
+
+async def pdk_document_guide(
+    document_type: str,
+    specific_topic: str = "",
+) -> str:
+    """PDK 문서 구조와 활용 방법을 안내합니다."""
+    doc = resolve("document_type", document_type) or document_type.lower().strip()
+    if not doc:
+        return "입력 오류: document_type은 필수입니다."
+
+    if doc not in DOC_GUIDES:
+        return (
+            f"지원하지 않는 document_type: `{document_type}`. "
+            "tech_file/drc_deck/lvs_deck/spice_model/cell_library/io_library/"
+            "memory_compiler/design_guide 중 선택하세요."
+        )
+    return lookup(_responses(), doc, document_type, specific_topic) or _format_guide(doc, document_type, specific_topic)
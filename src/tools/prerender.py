@@ -0,0 +1,70 @@
+"""Pre-rendered responses for tools with closed argument domains.
+
+``pdk_document_guide``, ``design_methodology_guide``, ``tapeout_checklist``,
+``drc_error_guide`` and ``timing_violation_debug`` only vary over a handful
+of knowledge keys, apart from free text they echo back (the caller's
+spelling of the type, ``specific_topic``, ``context``, ...). Each of them
+builds a table once, at worker preload or on first use. The table renders
+every domain key through the tool's own formatter, with a sentinel
+in place of each echo, and splits the result at the sentinels. A request
+then only joins the stored literals with its echo strings.
+
+Echoes that add a line only when non-empty render differently when empty,
+so every combination of present/absent echoes gets its own entry.
+Segments are kept as ``str``. Both transports serialize ``str``, so
+storing encoded bytes would only add a decode per call.
+"""
+
+from __future__ import annotations
+
+import itertools
+import re
+from typing import Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+# NUL never occurs in knowledge text or in the formatters' own markup.
+_SLOT = "\x00{}\x00"
+_SLOT_RE = re.compile("\x00(\\d+)\x00")
+
+
+class Spliced:
+    """A rendered response with holes for the echoed arguments."""
+
+    __slots__ = ("literals", "slots")
+
+    def __init__(self, text: str) -> None:
+        parts = _SLOT_RE.split(text)
+        self.literals: Tuple[str, ...] = tuple(parts[0::2])
+        self.slots: Tuple[int, ...] = tuple(int(p) for p in parts[1::2])
+
+    def render(self, echoes: Tuple[str, ...]) -> str:
+        if not self.slots:
+            return self.literals[0]
+        pieces = [self.literals[0]]
+        for slot, literal in zip(self.slots, self.literals[1:]):
+            pieces.append(echoes[slot])
+            pieces.append(literal)
+        return "".join(pieces)
+
+
+ResponseTable = Dict[Tuple[Hashable, Tuple[bool, ...]], Spliced]
+
+
+def build_table(
+    keys: Iterable[Hashable],
+    render: Callable[..., str],
+    n_echoes: int,
+) -> ResponseTable:
+    """``render(key, *echoes)`` for every key and every present/absent echo combination."""
+    table: ResponseTable = {}
+    masks = list(itertools.product((False, True), repeat=n_echoes))
+    for key in keys:
+        for mask in masks:
+            echoes = [_SLOT.format(i) if present else "" for i, present in enumerate(mask)]
+            table[(key, mask)] = Spliced(render(key, *echoes))
+    return table
+
+
+def lookup(table: ResponseTable, key: Hashable, *echoes: str) -> Optional[str]:
+    """Pre-rendered response for ``key`` with ``echoes`` spliced in, or ``None`` if outside the domain."""
+    spliced = table.get((key, tuple(bool(e) for e in echoes)))
+    return None if spliced is None else spliced.render(echoes)
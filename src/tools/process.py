@@ -7,7 +7,7 @@ from __future__ import annotations
 
 from typing import Dict, List
 
-from ..server import server
+from ..resolver import canonical, resolve
 
 
 ALLOWED_ASPECTS = {
@@ -44,13 +44,6 @@ def _build_table(node1: str, node2: str, aspects: List[str]) -> str:
     return "\n".join(lines)
 
 
-@server.tool(
-    name="compare_process_nodes",
-    description=(
-        "두 공정 노드를 성능/전력/면적/비용/성숙도/가용성 관점에서 비교. "
-        "응답은 Markdown 테이블과 간단한 메모."
-    ),
-)
 async def compare_process_nodes(
     node1: str,
     node2: str,
@@ -61,14 +54,13 @@ async def compare_process_nodes(
         return "입력 오류: node1, node2는 필수입니다."
 
     aspects = comparison_aspects or ["performance", "power", "area", "cost"]
-    cleaned = [a.lower() for a in aspects if a.lower() in ALLOWED_ASPECTS]
+    cleaned = list(dict.fromkeys(key for key in (resolve("aspect", a) for a in aspects) if key))
     if not cleaned:
         cleaned = ["performance", "power", "area", "cost"]
 
-    table = _build_table(node1, node2, cleaned)
+    table = _build_table(canonical("node", node1), canonical("node", node2), cleaned)
     bullet = "\n".join(f"- {a}: {ALLOWED_ASPECTS[a]}" for a in cleaned)
     note = "\n> NDA 정보는 포함하지 않으며, 파운드리별 수치는 FAE 확인 권장."
     return "\n".join([table, "", "요약 메모:", bullet, note])
 
 
-
@@ -0,0 +1,140 @@
+"""Tool: search_foundry_knowledge
+
+모든 지식 베이스(용어, 약어, 디자인 룰, DRC/Timing 가이드, 체크리스트,
+템플릿, 방법론, PDK 문서)를 한 번에 검색하는 BM25 전문 검색 도구.
+각 결과는 다음에 호출할 도구와 인자를 함께 제공한다.
+
+When the SQLite store (``MCP_KNOWLEDGE_STORE=sqlite:...``) serves the
+terminology or acronym catalog, that base is left out of the BM25 index.
+Per query, its FTS5 candidates (:meth:`src.data.store.StoreMapping.candidates`,
+matched on names and aliases) are decoded and scored with the index's
+statistics, so the catalog is never held in memory.
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, NamedTuple, Tuple
+
+from ..data.knowledge import get_knowledge, store_backed
+from ..search.bm25 import BM25Index, flatten_text
+
+MAX_TOP_K = 20
+_SNIPPET_CHARS = 160
+
+
+class KnowledgeDoc(NamedTuple):
+    source: str
+    title: str
+    tool: str
+    arguments: Dict[str, Any]
+    snippet: str
+
+
+def _doc(source: str, title: str, tool: str, arguments: Dict[str, Any], body: Any) -> Tuple[KnowledgeDoc, str]:
+    text = flatten_text(body)
+    snippet = " ".join(text.split())[:_SNIPPET_CHARS]
+    # Titles carry the lookup keys, so index them alongside the body.
+    return KnowledgeDoc(source, title, tool, arguments, snippet), f"{title}\n{text}"
+
+
+# Catalog bases searched through the store's FTS5 table when it serves them:
+# base -> (source, tool, argument).
+_CATALOGS: Dict[str, Tuple[str, str, str]] = {
+    "FOUNDRY_TERMINOLOGY": ("terminology", "explain_foundry_term", "term"),
+    "SEMICONDUCTOR_ACRONYMS": ("acronyms", "acronym_decoder", "acronym"),
+}
+
+
+def _catalog_doc(name: str, key: str, entry: Any) -> Tuple[KnowledgeDoc, str]:
+    source, tool, argument = _CATALOGS[name]
+    return _doc(source, f"{key} — {entry.get('full_name', '')}", tool, {argument: key}, entry)
+
+
+def _documents() -> Iterator[Tuple[KnowledgeDoc, str]]:
+    from .methodology import GUIDES
+    from .pdk import DOC_GUIDES
+
+    for name in _CATALOGS:
+        if not store_backed(name):
+            for key, entry in get_knowledge(name).items():
+                yield _catalog_doc(name, key, entry)
+    for node, categories in get_knowledge("DESIGN_RULES_KNOWLEDGE").items():
+        for category, entry in categories.items():
+            args = {"process_node": node, "rule_category": category}
+            yield _doc("design_rules", f"{node} / {category}", "design_rule_qa", args, entry)
+    for key, entry in get_knowledge("DRC_ERRORS_KNOWLEDGE").items():
+        yield _doc("drc_errors", f"DRC {key}", "drc_error_guide", {"error_type": key}, entry)
+    for key, entry in get_knowledge("TIMING_VIOLATIONS_KNOWLEDGE").items():
+        yield _doc("timing", f"Timing {key}", "timing_violation_debug", {"violation_type": key}, entry)
+    for design_type, categories in get_knowledge("CHECKLIST_ITEMS").items():
+        for category, items in categories.items():
+            args = {"design_type": design_type, "checklist_category": category}
+            yield _doc("checklist", f"{design_type} / {category}", "tapeout_checklist", args, items)
+    for key, template in get_knowledge("TEMPLATES").items():
+        yield _doc("templates", key, "foundry_communication_template", {"communication_type": key}, template)
+    for topic, by_process in GUIDES.items():
+        for process, tips in by_process.items():
+            args = {"methodology_topic": topic, "process_node": process}
+            yield _doc("methodology", f"{topic} ({process})", "design_methodology_guide", args, tips)
+    for doc_type, info in DOC_GUIDES.items():
+        yield _doc("pdk_docs", doc_type, "pdk_document_guide", {"document_type": doc_type}, info)
+
+
+@lru_cache(maxsize=1)
+def _index() -> BM25Index[KnowledgeDoc]:
+    return BM25Index(_documents())
+
+
+# Required arguments the search cannot infer from a hit.
+_NEEDS: Dict[str, str] = {
+    "design_rule_qa": "question",
+    "tapeout_checklist": "process_node",
+    "foundry_communication_template": "context",
+}
+
+
+def _next_call(doc: KnowledgeDoc, query: str) -> str:
+    args = dict(doc.arguments)
+    if doc.tool == "design_rule_qa":
+        args["question"] = query
+    call = f"`{doc.tool}` {json.dumps(args, ensure_ascii=False)}"
+    if doc.tool in _NEEDS and _NEEDS[doc.tool] not in args:
+        call += f" (+ `{_NEEDS[doc.tool]}`)"
+    return call
+
+
+async def search_foundry_knowledge(
+    query: str,
+    top_k: int = 5,
+) -> str:
+    """모든 지식 베이스를 검색하고 다음에 호출할 도구/인자를 안내합니다."""
+    q = (query or "").strip()
+    if not q:
+        return "입력 오류: query는 필수입니다."
+    k = max(1, min(int(top_k or 5), MAX_TOP_K))
+
+    index = _index()
+    hits = index.search(q, k)
+    for name in _CATALOGS:
+        if store_backed(name):
+            base = get_knowledge(name)
+            aliases, hints = base.candidates(q)  # type: ignore[attr-defined]
+            for key in dict.fromkeys(key for _, key in aliases + hints):
+                doc, text = _catalog_doc(name, key, base[key])
+                hits.append((index.score(q, text), doc))
+    hits = heapq.nlargest(k, (hit for hit in hits if hit[0] > 0), key=lambda hit: hit[0])
+    if not hits:
+        return (
+            f"`{q}`와 일치하는 지식 항목을 찾지 못했습니다.\n"
+            "- 다른 키워드(영문 용어/약어 또는 한글 설명)로 다시 검색하세요."
+        )
+
+    lines = [f"### Foundry Knowledge Search: {q}"]
+    for rank, (score, doc) in enumerate(hits, 1):
+        lines.append(f"\n**{rank}. {doc.title}** ({doc.source}, score {score})")
+        lines.append(f"- {doc.snippet}")
+        lines.append(f"- Next call: {_next_call(doc, q)}")
+    return "\n".join(lines)
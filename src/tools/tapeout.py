@@ -5,22 +5,27 @@ Tape-out 전 점검 체크리스트를 Markdown 체크박스 형태로 생성.
 
 from __future__ import annotations
 
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
 
-from ..data.checklist_db import CATEGORY_ALIASES, CHECKLIST_ITEMS
-from ..server import server
+from ..data.knowledge import get_knowledge
+from ..resolver import resolve
+from .prerender import ResponseTable, build_table, lookup
 
 
-def _gather_items(design_type: str, checklist_category: str) -> List[str]:
-    dt = design_type.lower()
-    cat = checklist_category.lower()
+def _domain_key(design_type: str, checklist_category: str) -> Tuple[str, str]:
+    dt = resolve("design_type", design_type) or design_type.lower()
+    cat = resolve("checklist_category", checklist_category) or checklist_category.lower()
+    return dt, cat
 
-    data = CHECKLIST_ITEMS.get(dt)
+
+def _gather_items(dt: str, cat: str) -> List[str]:
+    data = get_knowledge("CHECKLIST_ITEMS").get(dt)
     if not data:
         return []
 
     if cat == "all":
-        categories = CATEGORY_ALIASES["all"]
+        categories = get_knowledge("CATEGORY_ALIASES")["all"]
     else:
         categories = [cat]
 
@@ -33,14 +38,20 @@ def _gather_items(design_type: str, checklist_category: str) -> List[str]:
     return items
 
 
-@server.tool(
-    name="tapeout_checklist",
-    description=(
-        "Tape-out 전 체크리스트를 Markdown 체크박스 형태로 생성. "
-        "design_type: digital/analog/mixed_signal/memory/io. "
-        "checklist_category: all/drc_lvs/timing/power/signal_integrity/documentation."
-    ),
-)
+def _format_checklist(key: Tuple[str, str], design_type: str, process_node: str) -> str:
+    lines = [f"### Tape-out Checklist ({design_type}, {process_node})"]
+    for it in _gather_items(*key):
+        lines.append(f"- [ ] {it}")
+    return "\n".join(lines)
+
+
+@lru_cache(maxsize=1)
+def _responses() -> ResponseTable:
+    categories = ["all", *get_knowledge("CATEGORY_ALIASES")["all"]]
+    keys = [(dt, cat) for dt in get_knowledge("CHECKLIST_ITEMS") for cat in categories if _gather_items(dt, cat)]
+    return build_table(keys, _format_checklist, 2)
+
+
 async def tapeout_checklist(
     design_type: str,
     process_node: str,
@@ -50,18 +61,14 @@ async def tapeout_checklist(
     if not design_type.strip() or not process_node.strip():
         return "입력 오류: design_type과 process_node는 필수입니다."
 
-    items = _gather_items(design_type, checklist_category)
-    if not items:
+    key = _domain_key(design_type, checklist_category)
+    hit = lookup(_responses(), key, design_type, process_node)
+    if hit is not None:
+        return hit
+    if not _gather_items(*key):
         return (
             f"`{design_type}` 유형이나 `{checklist_category}` 카테고리를 찾을 수 없습니다. "
             "지원 값: design_type=digital/analog/mixed_signal/memory/io, "
             "category=all/drc_lvs/timing/power/signal_integrity/documentation."
         )
-
-    lines = [f"### Tape-out Checklist ({design_type}, {process_node})"]
-    for it in items:
-        lines.append(f"- [ ] {it}")
-    return "\n".join(lines)
-
-
-
+    return _format_checklist(key, design_type, process_node)
@@ -6,10 +6,16 @@ Tool 응답 크기를 작게 유지하도록 핵심 정보 위주로 구성한
 
 from __future__ import annotations
 
-from typing import List
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
-from ..data.terminology_db import FOUNDRY_TERMINOLOGY, TermEntry
-from ..server import server
+from ..data.knowledge import get_knowledge
+from ..resolver import canonical
+from ..search.fuzzy import FuzzyIndex
+from .batch import dedupe, render_page
+
+if TYPE_CHECKING:
+    from ..data.terminology_db import TermEntry
 
 
 def _format_term_entry(term: str, entry: TermEntry, foundry: str) -> str:
@@ -17,7 +23,7 @@ def _format_term_entry(term: str, entry: TermEntry, foundry: str) -> str:
     lines: List[str] = []
     title = entry.get("full_name") or term
     lines.append(f"### {title} ({term})")
-    lines.append(f"- Foundry context: {foundry or 'general'}")
+    lines.append(f"- Foundry context: {canonical('foundry', foundry or 'general')}")
     if desc := entry.get("description"):
         lines.append(f"- What it means: {desc}")
     if tips := entry.get("practical_tips"):
@@ -36,14 +42,57 @@ def _format_term_entry(term: str, entry: TermEntry, foundry: str) -> str:
     return "\n".join(lines)
 
 
-@server.tool(
-    name="explain_foundry_term",
-    description=(
-        "파운드리/PDK 전문 용어를 설명하고 실무 팁을 제공하는 도구. "
-        "term은 필수, foundry는 'TSMC', 'Samsung', 'GlobalFoundries', "
-        "또는 'general'을 권장. 응답은 Markdown 텍스트로 제공."
-    ),
-)
+@lru_cache(maxsize=1)
+def _term_index() -> Optional[FuzzyIndex]:
+    """Near-miss index over term keys, full names and related terms.
+
+    ``None`` when the base is served by a store that searches itself
+    (``candidates``); the catalog is then never held in memory.
+    """
+    terms = get_knowledge("FOUNDRY_TERMINOLOGY")
+    if hasattr(terms, "candidates"):
+        return None
+    aliases = []
+    hints = []
+    for key, entry in terms.items():
+        aliases.append((key, key))
+        if full_name := entry.get("full_name"):
+            aliases.append((full_name, key))
+        hints.extend((related, key) for related in entry.get("related_terms", []))
+    return FuzzyIndex(aliases, hints)
+
+
+def _lookup(term: str) -> Tuple[Optional[str], list]:
+    """Registered key for ``term`` (exact, upper-cased or fuzzy) and suggestions."""
+    terms = get_knowledge("FOUNDRY_TERMINOLOGY")
+    for key in (term, term.upper()):
+        if key in terms:
+            return key, []
+    index = _term_index()
+    if index is None:
+        index = FuzzyIndex(*terms.candidates(term))  # type: ignore[attr-defined]
+    return index.resolve(term)
+
+
+def _not_found(term: str, suggestions: list) -> str:
+    hint = ""
+    if suggestions:
+        hint = "- 혹시 다음 용어를 찾으셨나요: " + ", ".join(f"`{m.key}`" for m in suggestions) + "\n"
+    return (
+        f"아직 등록되지 않은 용어입니다: `{term}`.\n"
+        + hint
+        + "- 공개 정보 범위에서 일반적인 설명이 필요하면 term을 다시 입력하세요.\n"
+        "- 특정 파운드리 규칙은 NDA 대상일 수 있으므로 FAE 확인을 권장합니다."
+    )
+
+
+def _explain(term: str, key: str, foundry: str) -> str:
+    body = _format_term_entry(key, get_knowledge("FOUNDRY_TERMINOLOGY")[key], foundry)
+    if key not in (term, term.upper()):
+        body += f"\n- Matched from input: `{term}`"
+    return body
+
+
 async def explain_foundry_term(
     term: str,
     foundry: str = "general",
@@ -57,20 +106,43 @@ async def explain_foundry_term(
     if not term_key:
         return "입력 오류: term을 비워둘 수 없습니다."
 
-    entry = FOUNDRY_TERMINOLOGY.get(term_key) or FOUNDRY_TERMINOLOGY.get(term_key.upper())
-    if not entry:
-        return (
-            f"아직 등록되지 않은 용어입니다: `{term}`.\n"
-            "- 공개 정보 범위에서 일반적인 설명이 필요하면 term을 다시 입력하세요.\n"
-            "- 특정 파운드리 규칙은 NDA 대상일 수 있으므로 FAE 확인을 권장합니다."
-        )
-
-    body = _format_term_entry(term_key, entry, foundry)
+    key, suggestions = _lookup(term_key)
+    if key is None:
+        return _not_found(term, suggestions)
 
+    body = _explain(term_key, key, foundry)
     if context:
         body += "\n- Given context: " + context.strip()
 
     return body
 
 
+async def explain_foundry_term_batch(
+    terms: List[str],
+    foundry: str = "general",
+    context: str = "",
+    cursor: str = "",
+) -> str:
+    """여러 용어를 한 번에 설명합니다.
 
+    중복 용어는 한 번만 설명하며, 24KB를 넘으면 cursor로 이어서 조회합니다.
+    """
+    inputs = [t for t in (str(t).strip() for t in terms or []) if t]
+    if not inputs:
+        return "입력 오류: terms는 비어 있지 않은 목록이어야 합니다."
+
+    inputs, repeated = dedupe(inputs, str.upper)
+    found = [(term, *_lookup(term)) for term in inputs]
+    items, aliased = dedupe(found, lambda item: item[1] or "?" + item[0].upper())
+    keys = [key or "?" + term.upper() for term, key, _ in items]
+
+    def render(i: int) -> str:
+        term, key, suggestions = items[i]
+        return _explain(term, key, foundry) if key else _not_found(term, suggestions)
+
+    notes = []
+    if missing := sum(1 for _, key, _ in items if key is None):
+        notes.append(f"- 미등록: {missing}개")
+    if context:
+        notes.append("- Given context: " + context.strip())
+    return render_page("Foundry Terms", keys, render, cursor, repeated + aliased, notes)
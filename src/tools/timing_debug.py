@@ -1,8 +1,13 @@
 from __future__ import annotations
 
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
 
-from src.data.timing_violations_db import TIMING_VIOLATIONS_KNOWLEDGE
+from src.data.compact import ordered_steps
+from src.data.knowledge import get_knowledge
+from src.resolver import alias_table, resolve
+from src.tools.batch import dedupe, render_page
+from src.tools.prerender import ResponseTable, build_table, lookup
 
 
 def _section(title: str, items: List[str]) -> List[str]:
@@ -14,26 +19,9 @@ def _section(title: str, items: List[str]) -> List[str]:
     return lines
 
 
-def timing_violation_debug(
-    violation_type: str,
-    severity: str = "medium",
-    context: str = "",
-) -> str:
-    """
-    Timing violation 유형별 디버깅 방법과 해결 전략을 제공합니다.
-    """
-    vt = (violation_type or "").strip().lower()
-    sev = (severity or "medium").strip().lower()
-    if not vt:
-        return "입력 오류: violation_type은 필수입니다."
-
-    data = TIMING_VIOLATIONS_KNOWLEDGE.get(vt)
-    if not data:
-        available = ", ".join(sorted(TIMING_VIOLATIONS_KNOWLEDGE.keys()))
-        return f"지원하지 않는 timing violation 유형입니다: `{violation_type}`. 사용 가능: {available}"
-
+def _format_debug(label: str, data: dict, sev: str, context: str = "") -> str:
     lines: List[str] = [
-        f"### Timing Violation Debug: {violation_type} (severity: {sev})",
+        f"### Timing Violation Debug: {label} (severity: {sev})",
         f"- What it is: {data.get('description','')}",
     ]
     if context:
@@ -44,8 +32,7 @@ def timing_violation_debug(
     debug_flow = data.get("debug_flow", {})
     if debug_flow:
         lines.append("\n**Debug flow**")
-        for key in sorted(debug_flow.keys()):
-            lines.append(f"- {debug_flow[key]}")
+        lines.extend(f"- {step}" for step in ordered_steps(debug_flow))
 
     solutions = data.get("solutions", {})
     if solutions:
@@ -68,3 +55,76 @@ def timing_violation_debug(
 
     return "\n".join(lines)
 
+
+@lru_cache(maxsize=1)
+def _responses() -> ResponseTable:
+    violations = get_knowledge("TIMING_VIOLATIONS_KNOWLEDGE")
+    severities = sorted(set(alias_table("severity").values()))
+    keys = [(vt, sev) for vt in violations for sev in severities]
+
+    def render(key: Tuple[str, str], label: str, context: str) -> str:
+        vt, sev = key
+        return _format_debug(label, violations[vt], sev, context)
+
+    return build_table(keys, render, 2)
+
+
+def timing_violation_debug(
+    violation_type: str,
+    severity: str = "medium",
+    context: str = "",
+) -> str:
+    """
+    Timing violation 유형별 디버깅 방법과 해결 전략을 제공합니다.
+    """
+    vt = resolve("timing_violation", violation_type or "") or (violation_type or "").strip().lower()
+    sev = resolve("severity", severity or "medium") or (severity or "medium").strip().lower()
+    if not vt:
+        return "입력 오류: violation_type은 필수입니다."
+
+    violations = get_knowledge("TIMING_VIOLATIONS_KNOWLEDGE")
+    data = violations.get(vt)
+    if not data:
+        available = ", ".join(sorted(violations.keys()))
+        return f"지원하지 않는 timing violation 유형입니다: `{violation_type}`. 사용 가능: {available}"
+
+    hit = lookup(_responses(), (vt, sev), violation_type, context)
+    return hit if hit is not None else _format_debug(violation_type, data, sev, context)
+
+
+def timing_violation_debug_batch(
+    violation_types: List[str],
+    severity: str = "medium",
+    cursor: str = "",
+) -> str:
+    """
+    여러 timing violation 유형의 디버깅 가이드를 한 번에 제공합니다. 같은
+    유형으로 해석되는 입력은 한 번만 설명합니다.
+    """
+    inputs = [v for v in (str(v).strip() for v in violation_types or []) if v]
+    if not inputs:
+        return "입력 오류: violation_types는 비어 있지 않은 목록이어야 합니다."
+
+    sev = resolve("severity", severity or "medium") or (severity or "medium").strip().lower()
+    violations = get_knowledge("TIMING_VIOLATIONS_KNOWLEDGE")
+    resolved = [(v, resolve("timing_violation", v) or v.lower()) for v in inputs]
+    unknown, _ = dedupe([v for v, vt in resolved if vt not in violations], str.lower)
+    items, duplicates = dedupe([(v, vt) for v, vt in resolved if vt in violations], lambda item: item[1])
+    available = ", ".join(sorted(violations.keys()))
+    if not items:
+        return (
+            f"지원하지 않는 timing violation 유형입니다: {', '.join(f'`{v}`' for v in unknown)}. "
+            f"사용 가능: {available}"
+        )
+
+    notes = []
+    if unknown:
+        notes.append(f"- 지원하지 않는 유형: {', '.join(f'`{v}`' for v in unknown)} (사용 가능: {available})")
+    return render_page(
+        "Timing Violation Debug",
+        [vt for _, vt in items],
+        lambda i: _format_debug(items[i][0], violations[items[i][1]], sev),
+        cursor,
+        duplicates,
+        notes,
+    )
@@ -0,0 +1,189 @@
+"""Pre-fork multi-worker launcher.
+
+With ``MCP_WORKERS`` > 1, ``python -m src.server`` loads everything once in
+the parent process: every tool module, every knowledge base, and the
+fuzzy/BM25/TF-IDF indexes and alias tables. It then moves that heap to the
+permanent GC generation with ``gc.freeze()`` and forks the uvicorn workers.
+The workers all accept on one shared listening socket, so any worker can
+take any connection. They read the parent's pages copy-on-write; because
+the frozen objects are never scanned by the collector, those pages stay
+shared, and RSS grows only by each worker's private allocations.
+"""
+
+from __future__ import annotations
+
+import gc
+import importlib
+import math
+import os
+import signal
+import socket
+import time
+from typing import Any, Dict, Optional
+
+from . import registry
+
+# Lazily built indexes (``module:function``, same form as registry targets).
+PRELOAD_TARGETS = (
+    "src.tools.terminology:_term_index",
+    "src.tools.acronym:_acronym_index",
+    "src.tools.extract:_matcher",
+    "src.tools.communication:_templates",
+    "src.tools.pdk:_responses",
+    "src.tools.methodology:_responses",
+    "src.tools.tapeout:_responses",
+    "src.tools.drc_debug:_responses",
+    "src.tools.timing_debug:_responses",
+    "src.tools.design_rules:_fact_index",
+    "src.tools.design_rules:_node_index",
+    "src.tools.search:_index",
+)
+# Targets that read every row of these bases; left lazy when the SQLite store serves any of them.
+_FULL_SCANS = {"src.tools.extract:_matcher": ("FOUNDRY_TERMINOLOGY", "SEMICONDUCTOR_ACRONYMS")}
+# cgroup v2 ``cpu.max`` ("<quota> <period>" or "max <period>") and v1 quota/period files.
+CGROUP_CPU_MAX = "/sys/fs/cgroup/cpu.max"
+CGROUP_V1_QUOTA = ("/sys/fs/cgroup/cpu/cpu.cfs_quota_us", "/sys/fs/cgroup/cpu/cpu.cfs_period_us")
+# A worker that dies sooner than this after forking is restarted with a delay.
+_RESTART_BACKOFF_S = 1.0
+
+
+def preload() -> None:
+    """Import and build everything workers would otherwise build on first use.
+
+    Targets in ``_FULL_SCANS`` are skipped when the SQLite store backs one of
+    their bases, so a store-backed catalog is never decoded at boot.
+    """
+    from . import resolver
+    from .data.knowledge import get_knowledge, store_backed
+    from .data.snapshot import KNOWLEDGE_SOURCES
+
+    importlib.import_module("api.mcp_handler")
+    registry.warm()
+    for name in KNOWLEDGE_SOURCES:
+        get_knowledge(name)
+    resolver.warm()
+    for target in PRELOAD_TARGETS:
+        if any(store_backed(name) for name in _FULL_SCANS.get(target, ())):
+            continue
+        module, func = target.split(":")
+        getattr(importlib.import_module(module), func)()
+
+
+def _read(path: str) -> str:
+    with open(path) as fh:
+        return fh.read().strip()
+
+
+def _cgroup_cpu_quota() -> Optional[float]:
+    """CPUs allowed by the cgroup CPU quota, or None when unlimited or unknown."""
+    try:
+        quota, period = _read(CGROUP_CPU_MAX).split()[:2]
+        return None if quota == "max" else int(quota) / int(period)
+    except (OSError, ValueError):
+        pass
+    try:
+        quota, period = (int(_read(path)) for path in CGROUP_V1_QUOTA)
+        return quota / period if quota > 0 else None
+    except (OSError, ValueError):
+        return None
+
+
+def available_cpus() -> int:
+    """CPUs this process may run on: its affinity mask, capped by the cgroup quota.
+
+    ``os.cpu_count()`` reports the host's CPUs. A container limited to two
+    CPUs on a 64-core host would otherwise fork 64 full-heap workers.
+    """
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:  # not on Linux
+        cpus = os.cpu_count() or 1
+    quota = _cgroup_cpu_quota()
+    if quota is not None:
+        cpus = min(cpus, math.ceil(quota))
+    return max(1, cpus)
+
+
+def worker_count(value: str | None) -> int:
+    """Parse ``MCP_WORKERS``: a positive integer or ``auto`` (one per available CPU)."""
+    if value and value.strip().lower() == "auto":
+        return available_cpus()
+    try:
+        return max(1, int(value or 1))
+    except ValueError:
+        return 1
+
+
+def _bind(host: str, port: int) -> socket.socket:
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+def _run_worker(app: Any, sock: socket.socket, log_level: str) -> None:
+    import uvicorn
+
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    uvicorn.Server(uvicorn.Config(app, log_level=log_level.lower())).run(sockets=[sock])
+
+
+def serve(app: Any, host: str, port: int, workers: int, log_level: str = "info", warm: bool = True) -> None:
+    """Preload, freeze the heap, and supervise ``workers`` forked uvicorn workers.
+
+    ``warm=False`` skips :func:`preload` for callers that already ran it.
+    """
+    if warm:
+        preload()
+    sock = _bind(host, port)
+    gc.collect()
+    gc.freeze()
+
+    children: Dict[int, float] = {}
+    stopping = False
+
+    def spawn() -> None:
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                _run_worker(app, sock, log_level)
+            except BaseException:  # noqa: BLE001
+                code = 1
+                raise
+            finally:
+                os._exit(code)
+        children[pid] = time.monotonic()
+
+    def stop(signum: int, frame: Any) -> None:
+        nonlocal stopping
+        stopping = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    print(f"design-foundry-mcp: {workers} workers on {host}:{port} (pid {os.getpid()})")
+    for _ in range(workers):
+        spawn()
+
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        started = children.pop(pid, None)
+        if stopping or started is None:
+            continue
+        print(f"worker {pid} exited with status {status}; restarting")
+        if time.monotonic() - started < _RESTART_BACKOFF_S:
+            time.sleep(_RESTART_BACKOFF_S)
+        spawn()
+    sock.close()
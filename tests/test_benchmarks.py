@@ -0,0 +1,30 @@
+"""Perf regression gate against ``benchmarks/baseline.json``.
+
+Peak allocations are compared on every run. Throughput is machine specific,
+so it is only compared when ``MCP_BENCH_TIMING=1`` (after recording a
+baseline on the same machine with ``python -m benchmarks.suite
+--update-baseline``).
+"""
+
+import os
+
+import pytest
+
+from benchmarks import suite
+
+
+@pytest.mark.asyncio
+async def test_no_regressions_against_baseline():
+    baseline = suite.load_baseline()
+    timing = os.getenv("MCP_BENCH_TIMING") == "1"
+    results = await suite.run_suite(iterations=200 if timing else 20, warmup=20)
+    assert set(results) <= set(baseline), "new benchmark cases need a baseline entry"
+    assert suite.compare(results, baseline, timing=timing) == []
+
+
+def test_compare_flags_slowdowns_and_allocation_growth():
+    baseline = {"case": {"ops_per_s": 1000.0, "peak_alloc_bytes": 10_000}}
+    assert suite.compare({"case": {"ops_per_s": 900.0, "peak_alloc_bytes": 10_000}}, baseline) == []
+    slow, fat = suite.compare({"case": {"ops_per_s": 500.0, "peak_alloc_bytes": 40_000}}, baseline)
+    assert "ops/s" in slow and "peak alloc" in fat
+    assert suite.compare({"case": {"ops_per_s": 500.0, "peak_alloc_bytes": 10_000}}, baseline, timing=False) == []
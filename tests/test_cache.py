@@ -0,0 +1,143 @@
+import asyncio
+
+import pytest
+from fastmcp import Client
+
+from api import mcp_handler
+from src.cache import RESULT_CACHE, ResultCache
+from src.server import server
+
+
+@pytest.mark.asyncio
+async def test_cache_lru_eviction_by_entries_and_bytes():
+    cache = ResultCache(max_entries=2, max_bytes=1024)
+
+    async def make(value):
+        return value
+
+    await cache.get_or_compute("t", {"k": 1}, lambda: make("a"))
+    await cache.get_or_compute("t", {"k": 2}, lambda: make("b"))
+    # Touch k=1 so k=2 becomes least recently used.
+    assert await cache.get_or_compute("t", {"k": 1}, lambda: make("x")) == "a"
+    await cache.get_or_compute("t", {"k": 3}, lambda: make("c"))
+    assert cache.get(cache.make_key("t", {"k": 2})) is None
+    assert cache.stats()["evictions"] == 1
+
+    await cache.get_or_compute("t", {"k": 4}, lambda: make("z" * 1000))
+    assert cache.stats()["bytes"] <= 1024
+    assert cache.stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_key_ignores_argument_order():
+    assert ResultCache.make_key("t", {"a": 1, "b": 2}) == ResultCache.make_key("t", {"b": 2, "a": 1})
+
+
+@pytest.mark.asyncio
+async def test_cache_bounds_key_memory_and_skips_large_arguments():
+    cache = ResultCache(max_arg_bytes=4096)
+
+    async def make():
+        return "terms"
+
+    for i in range(5):
+        await cache.get_or_compute("extract", {"text": f"{i} " + "x" * 2 * 1024 * 1024}, make)
+    assert cache.stats()["entries"] == 0 and cache.stats()["bypassed"] == 5
+
+    await cache.get_or_compute("extract", {"text": "y" * 4000}, make)
+    (key,) = cache._entries
+    assert key.startswith("extract:") and len(key) == len("extract:") + 64
+    assert cache.stats()["bytes"] == len("terms") + len(key)
+    assert cache.discard(["extract"]) == 1 and cache.stats()["bytes"] == 0
+
+
+@pytest.mark.asyncio
+async def test_cache_coalesces_inflight_calls():
+    cache = ResultCache()
+    calls = 0
+
+    async def slow():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "done"
+
+    results = await asyncio.gather(*(cache.get_or_compute("t", {}, slow) for _ in range(10)))
+    assert results == ["done"] * 10
+    assert calls == 1
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["coalesced"] == 9
+
+
+@pytest.mark.asyncio
+async def test_cancelled_first_caller_does_not_cancel_waiters():
+    cache = ResultCache()
+    calls = 0
+
+    async def slow():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return "done"
+
+    first = asyncio.create_task(cache.get_or_compute("t", {}, slow))
+    await asyncio.sleep(0.01)
+    waiters = [asyncio.create_task(cache.get_or_compute("t", {}, slow)) for _ in range(3)]
+    await asyncio.sleep(0.01)
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    assert await asyncio.gather(*waiters) == ["done"] * 3
+    # One waiter took over; the others coalesced onto it.
+    assert calls == 2 and cache.stats()["entries"] == 1 and not cache._inflight
+
+    # A waiter cancelled itself still sees CancelledError.
+    cache.clear()
+    leader = asyncio.create_task(cache.get_or_compute("t", {}, slow))
+    await asyncio.sleep(0.01)
+    waiter = asyncio.create_task(cache.get_or_compute("t", {}, slow))
+    await asyncio.sleep(0.01)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert await leader == "done"
+
+
+@pytest.mark.asyncio
+async def test_cache_does_not_store_failures():
+    cache = ResultCache()
+
+    async def boom():
+        raise RuntimeError("fail")
+
+    with pytest.raises(RuntimeError):
+        await cache.get_or_compute("t", {}, boom)
+    assert cache.stats()["entries"] == 0
+
+
+@pytest.mark.asyncio
+async def test_cache_shared_between_jsonrpc_and_fastmcp():
+    RESULT_CACHE.clear()
+    args = {"acronym": "CMP", "context": "foundry"}
+    request = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "tools/call",
+        "params": {"name": "acronym_decoder", "arguments": args},
+    }
+    first = await mcp_handler.dispatch_async(request)
+    hits = RESULT_CACHE.hits
+    second = await mcp_handler.dispatch_async(request)
+    assert second == first
+    assert RESULT_CACHE.hits == hits + 1
+
+    RESULT_CACHE.clear()
+    pdk_args = {"document_type": "drc_deck"}
+    async with Client(server) as client:
+        via_sse = await client.call_tool("pdk_document_guide", pdk_args)
+    hits = RESULT_CACHE.hits
+    via_rpc = await mcp_handler.dispatch_async(
+        {"jsonrpc": "2.0", "id": 2, "method": "tools/call", "params": {"name": "pdk_document_guide", "arguments": pdk_args}}
+    )
+    assert RESULT_CACHE.hits == hits + 1
+    assert via_rpc["result"]["content"][0]["text"] == via_sse.content[0].text
@@ -0,0 +1,75 @@
+import json
+import tracemalloc
+
+import pytest
+
+from benchmarks import memory
+from src import reload
+from src.data import compact, knowledge
+from src.data.compact import COMPACT_BASES, Record, Steps
+from src.tools import acronym, drc_debug, terminology, timing_debug
+
+
+def test_records_are_frozen_mappings_with_sorted_steps():
+    base = {
+        "a": {"description": "x", "solutions": {"step10": "j", "step2": "b", "step1": "a"}, "tags": ["m", "n"]},
+        "b": {"description": "y", "layer_specific": {"M1": "tight"}},
+    }
+    records = compact.compact_base("DRC_ERRORS_KNOWLEDGE", base)
+    a, b = records["a"], records["b"]
+    assert isinstance(a, Record) and type(a).__name__ == "DrcErrorRecord" and type(b) is type(a)
+    assert a == base["a"] and b == base["b"] and compact.plain(records) == base
+    assert "layer_specific" not in a and a.get("layer_specific", {}) == {} and list(b) == ["description", "layer_specific"]
+    with pytest.raises(KeyError):
+        a["layer_specific"]
+    with pytest.raises(AttributeError):
+        a.description = "changed"  # type: ignore[misc]
+    assert isinstance(a["solutions"], Steps) and list(a["solutions"]) == ["step1", "step2", "step10"]
+    assert compact.ordered_steps(a["solutions"]) == ("a", "b", "j")
+    assert compact.ordered_steps(base["a"]["solutions"]) == ["a", "b", "j"]
+    assert a["tags"] == ("m", "n") and b["layer_specific"]["M1"] == "tight"
+    # Equal strings are stored once per base.
+    shared = compact.compact_base("X", {"p": {"c": "design" + "er"}, "q": {"c": "de" + "signer"}})
+    assert shared["p"]["c"] is shared["q"]["c"]
+
+
+def _outputs():
+    return (
+        [drc_debug.drc_error_guide(et, "M1", "ctx") for et in knowledge.get_knowledge("DRC_ERRORS_KNOWLEDGE")]
+        + [timing_debug.timing_violation_debug(vt, "high") for vt in knowledge.get_knowledge("TIMING_VIOLATIONS_KNOWLEDGE")]
+        + [acronym.acronym_decoder(key) for key in knowledge.get_knowledge("SEMICONDUCTOR_ACRONYMS")]
+    )
+
+
+@pytest.mark.asyncio
+async def test_tools_answer_the_same_from_compact_and_plain_bases():
+    if knowledge.snapshot_version() is not None:
+        pytest.skip("bases are served from a snapshot")
+    for name in COMPACT_BASES:
+        assert all(isinstance(entry, Record) for entry in knowledge.get_knowledge(name).values())
+        json.dumps(knowledge.builtin_knowledge(name))  # plain for validation, stores and snapshots
+    terms = list(knowledge.get_knowledge("FOUNDRY_TERMINOLOGY"))
+    compact_outputs = _outputs() + [await terminology.explain_foundry_term(term) for term in terms]
+
+    plain = {name: ("plain", knowledge.builtin_knowledge(name)) for name in COMPACT_BASES}
+    reload.invalidate(knowledge.apply_overrides(plain))
+    try:
+        assert not isinstance(next(iter(knowledge.get_knowledge("DRC_ERRORS_KNOWLEDGE").values())), Record)
+        plain_outputs = _outputs() + [await terminology.explain_foundry_term(term) for term in terms]
+    finally:
+        reload.invalidate(knowledge.apply_overrides({}))
+    assert compact_outputs == plain_outputs
+
+
+def test_compact_form_holds_less_heap_at_ten_times_the_data():
+    texts = {name: memory._scaled(knowledge.builtin_knowledge(name), 10) for name in COMPACT_BASES}
+    entries = 10 * sum(len(knowledge.builtin_knowledge(name)) for name in COMPACT_BASES)
+    heap = {}
+    for mode in memory.MODES:
+        tracemalloc.start()
+        held = memory._load(mode, texts)
+        heap[mode] = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        assert sum(len(base) for base in held.values()) == entries
+        del held
+    assert heap["compact"] < 0.9 * heap["dict"], heap
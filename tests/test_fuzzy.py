@@ -0,0 +1,50 @@
+import time
+
+import pytest
+
+from src.search.fuzzy import FuzzyIndex, normalize
+from src.tools import acronym, terminology
+
+
+def test_normalize_drops_case_and_punctuation():
+    assert normalize("C-PODE") == normalize("cpode") == "cpode"
+    assert normalize("Metal Fill") == "metalfill"
+
+
+def test_resolve_exact_alias_and_suggestions():
+    index = FuzzyIndex([("Antenna Rule", "Antenna Rule"), ("Metal Fill", "Metal Fill")], [("Partial Ratio", "Antenna Rule")])
+    assert index.resolve("metal-fill") == ("Metal Fill", [])
+    key, suggestions = index.resolve("antenna ratio")
+    assert key is None
+    assert suggestions[0].key == "Antenna Rule"
+    assert index.resolve("zzzz") == (None, [])
+
+
+@pytest.mark.asyncio
+async def test_explain_foundry_term_near_miss():
+    resp = await terminology.explain_foundry_term("metal fill")
+    assert "Metal Dummy Fill" in resp
+    assert "Matched from input" in resp
+
+    resp = await terminology.explain_foundry_term("antenna ratio")
+    assert "찾으셨나요" in resp and "Antenna Rule" in resp
+
+
+def test_acronym_decoder_near_miss():
+    assert "Design Rule Check" in acronym.acronym_decoder("design rule check")
+    resp = acronym.acronym_decoder("DRV")
+    assert "등록되지 않은 약어" in resp
+    assert "`DRC`" in resp
+
+
+def test_search_is_sub_millisecond_at_10k_entries():
+    words = ["metal", "poly", "via", "gate", "fill", "rule", "cut", "edge", "diff", "well"]
+    aliases = [(f"{words[i % 10]} {words[(i // 10) % 10]} {i}", f"K{i}") for i in range(10_000)]
+    index = FuzzyIndex(aliases)
+    queries = ["metal fil 4321", "poly edge 77", "gate rule 9001", "via cut 5"]
+    start = time.perf_counter()
+    for _ in range(25):
+        for q in queries:
+            index.search(q)
+    per_query = (time.perf_counter() - start) / (25 * len(queries))
+    assert per_query < 0.005
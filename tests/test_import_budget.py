@@ -0,0 +1,51 @@
+"""Cold-start import budget for the Vercel entrypoint (``api.index``).
+
+Runs ``python -X importtime`` in a fresh interpreter and fails if tool
+modules or knowledge bases are imported eagerly, or if the import cost of
+this project's own modules regresses past the budget.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Self time of modules under src/ and api/ (microseconds).
+OWN_MODULES_BUDGET_US = 100_000
+# Cumulative time of the whole entrypoint, dominated by fastmcp/starlette.
+ENTRYPOINT_BUDGET_US = 5_000_000
+LAZY_PREFIXES = ("src.tools.", "src.data.")
+
+
+def _importtime(module: str) -> Dict[str, Tuple[int, int]]:
+    env = {**os.environ, "MCP_LAZY_LOAD": "1"}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows: Dict[str, Tuple[int, int]] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows[name.strip()] = (int(self_us), int(cumulative_us))
+    return rows
+
+
+def test_entrypoint_import_is_lazy_and_within_budget():
+    rows = _importtime("api.index")
+
+    eager = sorted(name for name in rows if name.startswith(LAZY_PREFIXES))
+    assert not eager, f"tool/data modules imported at cold start: {eager}"
+
+    own = sum(self_us for name, (self_us, _) in rows.items() if name.split(".")[0] in ("src", "api"))
+    assert own < OWN_MODULES_BUDGET_US, f"own module import time {own}us exceeds {OWN_MODULES_BUDGET_US}us"
+
+    assert rows["api.index"][1] < ENTRYPOINT_BUDGET_US
@@ -0,0 +1,33 @@
+from src.search.keywords import KeywordMatcher
+
+
+def _matcher():
+    return KeywordMatcher(
+        [
+            ("DRC", "DRC", True),
+            ("Design Rule Check", "DRC", False),
+            ("ATE", "ATE", True),
+            ("Metal Fill", "fill", False),
+            ("Metal", "metal", False),
+        ]
+    )
+
+
+def test_leftmost_longest_on_word_boundaries():
+    text = "Metal Fill after DRC를 실행; metal density, DRCs and xDRC ignored"
+    found = [(text[s:e], t) for s, e, t in _matcher().finditer(text)]
+    assert found == [("Metal Fill", "fill"), ("DRC", "DRC"), ("metal", "metal")]
+
+
+def test_case_sensitive_keywords_only_match_their_spelling():
+    counts = _matcher().count("We ate lunch. ATE time booked. design rule check / DESIGN RULE CHECK / drc")
+    assert counts == {"ATE": 1, "DRC": 2}
+
+
+def test_offsets_survive_lowercasing_that_changes_length():
+    text = "İstanbul DRC"
+    assert [(text[s:e], t) for s, e, t in _matcher().finditer(text)] == [("DRC", "DRC")]
+
+
+def test_empty_keyword_set_matches_nothing():
+    assert KeywordMatcher([]).count("anything") == {}
@@ -0,0 +1,64 @@
+import httpx
+import pytest
+
+from api import mcp_handler
+from src.server import app
+
+
+def _call(request_id, name, arguments):
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "method": "tools/call",
+        "params": {"name": name, "arguments": arguments},
+    }
+
+
+@pytest.mark.asyncio
+async def test_dispatch_batch_preserves_order_and_ids():
+    batch = [
+        _call(1, "acronym_decoder", {"acronym": "DRC"}),
+        {"jsonrpc": "2.0", "id": 2, "method": "tools/list"},
+        _call(3, "drc_error_guide", {"error_type": "spacing"}),
+    ]
+    responses = await mcp_handler.dispatch_payload_async(batch)
+    assert [r["id"] for r in responses] == [1, 2, 3]
+    assert "Design Rule Check" in responses[0]["result"]["content"][0]["text"]
+    assert responses[1]["result"]["tools"]
+
+
+@pytest.mark.asyncio
+async def test_dispatch_batch_isolates_errors_and_drops_notifications():
+    batch = [
+        {"jsonrpc": "2.0", "id": "a", "method": "unknown/method"},
+        "not-an-object",
+        {"jsonrpc": "2.0", "method": "notifications/initialized"},
+        _call("b", "acronym_decoder", {"acronym": "LVS"}),
+    ]
+    responses = await mcp_handler.dispatch_payload_async(batch)
+    assert len(responses) == 3
+    assert responses[0]["error"]["code"] == -32601
+    assert responses[1] == {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "Invalid Request"}}
+    assert responses[2]["id"] == "b"
+
+
+@pytest.mark.asyncio
+async def test_dispatch_empty_batch_is_invalid_request():
+    response = await mcp_handler.dispatch_payload_async([])
+    assert response["error"]["code"] == -32600
+
+
+@pytest.mark.asyncio
+async def test_root_post_accepts_batch():
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        resp = await client.post(
+            "/",
+            json=[_call(i, "acronym_decoder", {"acronym": a}) for i, a in enumerate(["DRC", "LVS", "OPC"])],
+        )
+        assert resp.status_code == 200
+        body = resp.json()
+        assert [r["id"] for r in body] == [0, 1, 2]
+
+        resp = await client.post("/", json=[{"jsonrpc": "2.0", "method": "notifications/initialized"}])
+        assert resp.status_code == 202
@@ -0,0 +1,68 @@
+import httpx
+import pytest
+
+from src import metrics
+from src.server import app
+
+
+def test_histogram_renders_cumulative_buckets():
+    hist = metrics.Histogram("test_latency_seconds", "Test.", ["op"], buckets=(0.1, 1.0))
+    metrics.REGISTRY.remove(hist)
+    hist.labels("a").observe(0.05)
+    hist.labels("a").observe(0.5)
+    hist.labels("a").observe(5)
+    lines = list(hist.render())
+    assert '# TYPE test_latency_seconds histogram' in lines
+    assert 'test_latency_seconds_bucket{op="a",le="0.1"} 1' in lines
+    assert 'test_latency_seconds_bucket{op="a",le="1"} 2' in lines
+    assert 'test_latency_seconds_bucket{op="a",le="+Inf"} 3' in lines
+    assert 'test_latency_seconds_count{op="a"} 3' in lines
+
+
+def _sample(text: str, series: str) -> float:
+    for line in text.splitlines():
+        if line.startswith(series + " "):
+            return float(line.rsplit(" ", 1)[1])
+    return 0.0
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_counts_calls_and_errors():
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        before = (await client.get("/metrics")).text
+        await client.post("/", json={"jsonrpc": "2.0", "id": 1, "method": "tools/call",
+                                     "params": {"name": "acronym_decoder", "arguments": {"acronym": "DRC"}}})
+        await client.post("/", json={"jsonrpc": "2.0", "id": 2, "method": "no/such"})
+        resp = await client.get("/metrics")
+
+    assert resp.headers["content-type"].startswith("text/plain; version=0.0.4")
+    after = resp.text
+    for series, delta in [
+        ('mcp_request_duration_seconds_count{method="tools/call"}', 1),
+        ('mcp_request_duration_seconds_count{method="other"}', 1),
+        ('mcp_tool_duration_seconds_count{tool="acronym_decoder"}', 1),
+        ('mcp_errors_total{code="-32601"}', 1),
+        ("mcp_response_bytes_count", 2),
+    ]:
+        assert _sample(after, series) - _sample(before, series) == delta, series
+    assert "mcp_tool_calls_in_flight 0" in after
+    assert "mcp_sse_sessions_active 0" in after
+    assert "mcp_cache_hits_total" in after
+
+
+@pytest.mark.asyncio
+async def test_non_string_method_is_method_not_found():
+    request = {"jsonrpc": "2.0", "id": 1, "method": [1]}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        single = (await client.post("/", json=request)).json()
+        via_mcp = (await client.post("/mcp", json={**request, "method": {"a": 1}})).json()
+        batch = (await client.post("/", json=[request])).json()
+    assert single["error"]["code"] == via_mcp["error"]["code"] == batch[0]["error"]["code"] == -32601
+
+
+def test_metric_base_is_abstract():
+    with pytest.raises(TypeError):
+        metrics._Metric("mcp_abstract", "Not a concrete metric kind.")
+    assert not any(m.name == "mcp_abstract" for m in metrics.REGISTRY)
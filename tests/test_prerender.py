@@ -0,0 +1,54 @@
+import pytest
+
+from src.data.knowledge import get_knowledge
+from src.tools import drc_debug, methodology, pdk, tapeout, timing_debug
+from src.tools.prerender import Spliced, build_table, lookup
+
+# Echo values that would break naive formatting or splitting.
+ECHOES = ["", "N5 {block}", "50% \\n 'x'", "\x00 0 \x00"]
+
+
+def test_spliced_round_trip():
+    table = build_table(["a"], lambda key, x, y: f"[{key}:{x}]" + (f" y={y}" if y else ""), 2)
+    assert len(table) == 4
+    assert lookup(table, "a", "X", "") == "[a:X]"
+    assert lookup(table, "a", "{}", "\x001\x00") == "[a:{}] y=\x001\x00"
+    assert lookup(table, "b", "X", "") is None
+    assert Spliced("plain").render(()) == "plain"
+
+
+@pytest.mark.asyncio
+async def test_pdk_and_methodology_tables_match_formatters():
+    for doc in pdk.DOC_GUIDES:
+        for topic in ECHOES:
+            assert await pdk.pdk_document_guide(doc.upper(), topic) == pdk._format_guide(doc, doc.upper(), topic)
+    for topic, info in methodology.GUIDES.items():
+        for proc in info:
+            expected = methodology._format_guide((topic, proc), topic.title())
+            assert await methodology.design_methodology_guide(topic.title(), proc) == expected
+
+
+@pytest.mark.asyncio
+async def test_tapeout_table_matches_formatter():
+    categories = ["all", *get_knowledge("CATEGORY_ALIASES")["all"]]
+    for dt in get_knowledge("CHECKLIST_ITEMS"):
+        for cat in categories:
+            key = (dt, cat)
+            if not tapeout._gather_items(*key):
+                continue
+            for node in ECHOES[1:]:
+                assert await tapeout.tapeout_checklist(dt, node, cat) == tapeout._format_checklist(key, dt, node)
+    assert (await tapeout.tapeout_checklist("digital", "5nm", "nope")).startswith("`digital`")
+
+
+def test_drc_and_timing_tables_match_formatters():
+    for et, data in get_knowledge("DRC_ERRORS_KNOWLEDGE").items():
+        for layer in ["general", "m1", "  M5  ", *data.get("layer_specific", {})]:
+            for desc in ECHOES:
+                expected = drc_debug._format_guide(et, data, layer.strip(), desc)
+                assert drc_debug.drc_error_guide(et, layer, desc) == expected
+    for vt, data in get_knowledge("TIMING_VIOLATIONS_KNOWLEDGE").items():
+        for sev in ("critical", "medium", "minor", "bogus"):
+            for context in ECHOES:
+                expected = timing_debug._format_debug(vt, data, sev, context)
+                assert timing_debug.timing_violation_debug(vt, sev, context) == expected
@@ -0,0 +1,110 @@
+import httpx
+import pytest
+
+from src import server
+
+CALL = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "tools/call",
+    "params": {"name": "design_rule_qa", "arguments": {"process_node": "5nm", "rule_category": "metal", "question": "spacing"}},
+}
+
+
+def _client(app) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+@pytest.mark.asyncio
+async def test_profiling_disabled_by_default():
+    assert not any(m.cls.__name__ == "ProfilingMiddleware" for m in server.app.user_middleware)
+    async with _client(server.app) as client:
+        resp = await client.post("/", json=CALL, headers={"X-MCP-Profile": "1"})
+        listing = await client.get("/debug/profiles")
+    assert "x-mcp-profile-id" not in resp.headers
+    assert listing.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_profiled_request_is_stored_and_listed(tmp_path, monkeypatch):
+    monkeypatch.setenv("MCP_PROFILE_DIR", str(tmp_path))
+    monkeypatch.setenv("MCP_PROFILE_KEEP", "2")
+    app = server.create_app()
+    async with _client(app) as client:
+        plain = await client.post("/", json=CALL)
+        ids = []
+        for _ in range(3):
+            resp = await client.post("/", json=CALL, headers={"X-MCP-Profile": "1"})
+            assert resp.status_code == 200
+            ids.append(resp.headers["x-mcp-profile-id"])
+        opt_in = {"X-MCP-Profile": "1"}
+        hidden = await client.get("/debug/profiles")
+        listing = (await client.get("/debug/profiles", headers=opt_in)).json()
+        summary = await client.get(listing["profiles"][0]["files"]["txt"], headers=opt_in)
+        hidden_file = await client.get(listing["profiles"][0]["files"]["txt"])
+        prof = await client.get(listing["profiles"][0]["files"]["prof"], headers=opt_in)
+        missing = await client.get("/debug/profiles/..%2Fsecret.txt", headers=opt_in)
+
+    assert "x-mcp-profile-id" not in plain.headers
+    # Bounded ring: only the newest two survive.
+    assert [p["id"] for p in listing["profiles"]] == ids[:0:-1]
+    assert sorted(f.name for f in tmp_path.iterdir()) == sorted(f"{i}.{ext}" for i in ids[1:] for ext in ("prof", "txt"))
+    assert listing["profiles"][0]["label"] == "POST / tools/call design_rule_qa"
+    assert "functions by cumulative time" in summary.text
+    assert "allocation sites" in summary.text
+    assert "result cache: hits +" in summary.text
+    assert prof.status_code == 200 and prof.content
+    assert missing.status_code == 404
+    # The listing is gated on the opt-in header and is not profiled itself.
+    assert hidden.status_code == hidden_file.status_code == 404
+    assert len(listing["profiles"]) == 2 and "x-mcp-profile-id" not in summary.headers
+
+
+@pytest.mark.asyncio
+async def test_profile_token_gates_profiling_and_listing(tmp_path, monkeypatch):
+    monkeypatch.setenv("MCP_PROFILE_DIR", str(tmp_path))
+    monkeypatch.setenv("MCP_PROFILE_TOKEN", "s3cret")
+    app = server.create_app()
+    async with _client(app) as client:
+        plain = await client.post("/", json=CALL, headers={"X-MCP-Profile": "1"})
+        profiled = await client.post("/", json=CALL, headers={"X-MCP-Profile": "s3cret"})
+        denied = await client.get("/debug/profiles", headers={"X-MCP-Profile": "1"})
+        listing = (await client.get("/debug/profiles", headers={"X-MCP-Profile": "s3cret"})).json()
+    assert "x-mcp-profile-id" not in plain.headers and denied.status_code == 404
+    assert [p["id"] for p in listing["profiles"]] == [profiled.headers["x-mcp-profile-id"]]
+
+
+@pytest.mark.asyncio
+async def test_failed_profile_save_does_not_fail_the_request(tmp_path, monkeypatch, capsys):
+    from src import profiling
+
+    monkeypatch.setenv("MCP_PROFILE_DIR", str(tmp_path))
+
+    def broken(self, profile_id, profiler, summary):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(profiling.ProfileStore, "save", broken)
+    async with _client(server.create_app()) as client:
+        resp = await client.post("/", json=CALL, headers={"X-MCP-Profile": "1"})
+    assert resp.status_code == 200 and resp.json()["result"]["content"]
+    assert "not saved: OSError('disk full')" in capsys.readouterr().err
+
+
+def test_profile_is_loadable_by_pstats(tmp_path, monkeypatch):
+    import asyncio
+    import pstats
+
+    monkeypatch.setenv("MCP_PROFILE_DIR", str(tmp_path))
+    app = server.create_app()
+
+    # A question no other test asks, so the tool runs instead of hitting the cache.
+    call = {**CALL, "params": {**CALL["params"], "arguments": {**CALL["params"]["arguments"], "question": "pstats"}}}
+
+    async def run():
+        async with _client(app) as client:
+            await client.post("/mcp", json=call, headers={"X-MCP-Profile": "1", "Accept": "text/event-stream"})
+
+    asyncio.run(run())
+    (prof,) = tmp_path.glob("*.prof")
+    stats = pstats.Stats(str(prof))
+    assert any("design_rule_qa" in func[2] for func in stats.stats)
@@ -0,0 +1,72 @@
+import json
+
+import pytest
+
+from api import mcp_handler
+from src import registry
+from src.registry import ToolArgumentError
+from src.server import server
+
+
+@pytest.mark.asyncio
+async def test_fastmcp_server_exposes_every_registry_tool():
+    tools = await server.get_tools()
+    assert set(tools) == set(registry.REGISTRY)
+    for name in ("drc_error_guide", "timing_violation_debug", "acronym_decoder"):
+        assert tools[name].parameters == registry.REGISTRY[name].input_schema
+
+
+def test_registry_records_sync_and_async_kind():
+    assert registry.REGISTRY["explain_foundry_term"].load()
+    assert registry.REGISTRY["explain_foundry_term"].is_async
+    assert registry.REGISTRY["drc_error_guide"].load()
+    assert not registry.REGISTRY["drc_error_guide"].is_async
+
+
+def test_validator_fills_defaults_and_rejects_bad_arguments():
+    validate = registry.REGISTRY["timing_violation_debug"].validate
+    assert validate({"violation_type": "setup"}) == {
+        "violation_type": "setup",
+        "severity": "medium",
+        "context": "",
+    }
+    with pytest.raises(ToolArgumentError, match="missing"):
+        validate({})
+    with pytest.raises(ToolArgumentError, match="unknown"):
+        validate({"violation_type": "setup", "bogus": 1})
+    with pytest.raises(ToolArgumentError, match="must be string"):
+        validate({"violation_type": 3})
+
+
+@pytest.mark.asyncio
+async def test_jsonrpc_invalid_params_error():
+    resp = await mcp_handler.dispatch_async(
+        {"jsonrpc": "2.0", "id": 7, "method": "tools/call", "params": {"name": "acronym_decoder", "arguments": {}}}
+    )
+    assert resp["error"]["code"] == -32602
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "params, message",
+    [
+        ([], "params must be an object"),
+        ({"name": "acronym_decoder", "arguments": ["DRC"]}, "arguments must be an object"),
+        ({"name": "acronym_decoder", "arguments": "DRC"}, "arguments must be an object"),
+        ({"name": "no_such_tool", "arguments": {}}, "unknown tool 'no_such_tool'"),
+        ({"name": ["acronym_decoder"]}, "unknown tool"),
+    ],
+)
+async def test_jsonrpc_malformed_tools_call_is_invalid_params(params, message):
+    resp = await mcp_handler.dispatch_async({"jsonrpc": "2.0", "id": 8, "method": "tools/call", "params": params})
+    assert resp["id"] == 8 and resp["error"]["code"] == -32602 and message in resp["error"]["message"]
+
+
+@pytest.mark.asyncio
+async def test_tools_list_uses_preserialized_bytes():
+    resp = await mcp_handler.dispatch_async({"jsonrpc": "2.0", "id": 5, "method": "tools/list"})
+    encoded = mcp_handler.encode_response(resp)
+    assert registry.TOOLS_LIST_RESULT_JSON in encoded
+    decoded = json.loads(encoded)
+    assert decoded["id"] == 5
+    assert [t["name"] for t in decoded["result"]["tools"]] == [s["name"] for s in registry.TOOL_SPECS]
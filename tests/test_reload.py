@@ -0,0 +1,133 @@
+import json
+import os
+
+import pytest
+
+from src import registry, reload
+from src.cache import RESULT_CACHE
+from src.data import external, knowledge
+from src.data.snapshot import KNOWLEDGE_SOURCES
+from src.tools import acronym, terminology
+
+
+@pytest.fixture
+def reloader(tmp_path):
+    yield reload.KnowledgeReloader(tmp_path, interval=0.01)
+    reload.invalidate(knowledge.apply_overrides({}))
+
+
+def _write(path, data):
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    # Same-size rewrites within one mtime tick must still look changed.
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def _terms(**extra):
+    terms = dict(knowledge.builtin_knowledge("FOUNDRY_TERMINOLOGY"))
+    terms.update(extra)
+    return terms
+
+
+def test_dependency_maps_cover_every_base_and_exist():
+    assert set(reload.DERIVED_CACHES) == set(KNOWLEDGE_SOURCES) == set(reload.DEPENDENT_TOOLS)
+    for tools in reload.DEPENDENT_TOOLS.values():
+        assert set(tools) <= set(registry.REGISTRY)
+    for targets in reload.DERIVED_CACHES.values():
+        for target in targets:
+            module, _, attr = target.partition(":")
+            assert hasattr(getattr(__import__(module, fromlist=[attr]), attr), "cache_clear"), target
+
+
+def test_validation_uses_typeddict_and_shipped_shapes():
+    shipped = knowledge.builtin_knowledge
+    bad_term = {"PODE": {"full_name": "x", "descripton": "typo", "related_terms": ["a", 1]}}
+    errors = external.validate("FOUNDRY_TERMINOLOGY", bad_term, shipped("FOUNDRY_TERMINOLOGY"))
+    assert any("unknown field `descripton`" in e for e in errors)
+    assert any("related_terms[1]: expected str" in e for e in errors)
+    rules = {"5nm": {"metal": {"min_width": 18}}}
+    assert external.validate("DESIGN_RULES_KNOWLEDGE", rules, shipped("DESIGN_RULES_KNOWLEDGE")) == [
+        "DESIGN_RULES_KNOWLEDGE.5nm.metal.min_width: expected str, got int"
+    ]
+    # No annotation: checked against the fields the shipped acronyms use.
+    acronyms = {"ZQ": {"full_name": "Zed Queue", "category": 3}}
+    assert external.validate("SEMICONDUCTOR_ACRONYMS", acronyms, shipped("SEMICONDUCTOR_ACRONYMS")) == [
+        "SEMICONDUCTOR_ACRONYMS.ZQ.category: expected str, got int"
+    ]
+    assert external.validate("TEMPLATES", [], shipped("TEMPLATES"))
+
+
+@pytest.mark.asyncio
+async def test_reload_swaps_changed_base_and_clears_only_its_caches(reloader, tmp_path):
+    before = knowledge.knowledge_version()
+    entry = {"full_name": "Zebra Quilt Fill", "description": "Hot reloaded term.", "related_terms": ["Dummy Fill"]}
+    acronym_index = acronym._acronym_index()
+    await registry.call_tool("acronym_decoder", {"acronym": "DRC"})
+    await registry.call_tool("explain_foundry_term", {"term": "ZQFILL"})
+    assert "ZQFILL" not in knowledge.get_knowledge("FOUNDRY_TERMINOLOGY")
+
+    _write(tmp_path / "FOUNDRY_TERMINOLOGY.json", _terms(ZQFILL=entry))
+    assert await reloader.reload()
+    version = knowledge.knowledge_version()
+    assert version != before
+    assert reload.status()["version"] == version
+    assert knowledge.active_overrides() == {"FOUNDRY_TERMINOLOGY": external.content_hash(_terms(ZQFILL=entry))}
+    assert "Zebra Quilt Fill" in await registry.call_tool("explain_foundry_term", {"term": "ZQFILL"})
+    assert "Zebra Quilt Fill" in await terminology.explain_foundry_term("zebra quilt fil")  # fuzzy index rebuilt
+    # Unrelated indexes and cached responses survive.
+    assert acronym._acronym_index() is acronym_index
+    hits = RESULT_CACHE.hits
+    await registry.call_tool("acronym_decoder", {"acronym": "DRC"})
+    assert RESULT_CACHE.hits == hits + 1
+
+    # Unchanged directory: nothing to do.
+    assert not await reloader.reload()
+    # Removing the file restores the built-in base.
+    (tmp_path / "FOUNDRY_TERMINOLOGY.json").unlink()
+    assert await reloader.reload()
+    assert knowledge.knowledge_version() == before
+    assert "ZQFILL" not in knowledge.get_knowledge("FOUNDRY_TERMINOLOGY")
+
+
+@pytest.mark.asyncio
+async def test_invalid_file_rejects_whole_set_and_keeps_version(reloader, tmp_path):
+    _write(tmp_path / "TEMPLATES.json", {"technical_inquiry": "Hi {sender}"})
+    assert await reloader.reload()
+    version = knowledge.knowledge_version()
+
+    _write(tmp_path / "TEMPLATES.json", {"technical_inquiry": "Hello {sender}"})
+    _write(tmp_path / "DRC_ERRORS_KNOWLEDGE.json", {"spacing": {"description": 1}})
+    assert not await reloader.reload()
+    assert "DRC_ERRORS_KNOWLEDGE.json: DRC_ERRORS_KNOWLEDGE.spacing.description: expected str" in reloader.last_error
+    assert knowledge.knowledge_version() == version
+    assert knowledge.get_knowledge("TEMPLATES")["technical_inquiry"] == "Hi {sender}"
+    assert reload.status()["version"] == version
+
+
+def test_yaml_files_and_startup_load(reloader, tmp_path):
+    pytest.importorskip("yaml")
+    (tmp_path / "CATEGORY_ALIASES.yaml").write_text("all:\n  - drc_lvs\n  - timing\n", encoding="utf-8")
+    (tmp_path / "notes.txt").write_text("ignored", encoding="utf-8")
+    assert reloader.load()
+    assert list(knowledge.get_knowledge("CATEGORY_ALIASES")["all"]) == ["drc_lvs", "timing"]
+    assert reloader.status()["overrides"].keys() == {"CATEGORY_ALIASES"}
+
+
+@pytest.mark.asyncio
+async def test_status_endpoint_reports_active_version(tmp_path, monkeypatch):
+    import httpx
+
+    from src import server
+
+    _write(tmp_path / "TEMPLATES.json", {"technical_inquiry": "Hi {sender}"})
+    monkeypatch.setenv("MCP_KNOWLEDGE_DIR", str(tmp_path))
+    monkeypatch.setattr(reload, "RELOADER", None)
+    try:
+        app = server.create_app()
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            info = (await client.get("/")).json()["knowledge"]
+    finally:
+        reload.invalidate(knowledge.apply_overrides({}))
+    assert info["version"] != knowledge.knowledge_version()
+    assert info["overrides"] == {"TEMPLATES": external.content_hash({"technical_inquiry": "Hi {sender}"})}
+    assert info["directory"] == str(tmp_path.resolve()) and info["last_error"] is None
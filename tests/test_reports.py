@@ -0,0 +1,331 @@
+import gzip
+import tracemalloc
+
+import pytest
+
+from src import registry
+from src.reports.drc import classify, parse_drc_report
+from src.reports.timing import parse_timing_report, severity
+from src.tools.drc_report import drc_report_summary
+from src.tools.timing_report import timing_report_summary
+
+CALIBRE_DB = """TOP_CELL 1000
+M1.S.1
+2 2 1 Jan 1 00:00:00 2025
+M1 spacing < 0.032 um
+p 1 4
+0 0
+10 0
+10 10
+0 10
+e 2 1
+0 0 5 5
+VIA1.EN.2
+1 3 2 Jan 1 00:00:00 2025
+VIA1 enclosure by M2 < 0.01 um
+on two opposite sides
+p 1 4
+CN top c 1 0 0 1 0 0
+0 0
+1 0
+1 1
+0 1
+DENSITY_M3_LOW
+0 0 0 Jan 1 00:00:00 2025
+CHK_LATCHUP
+1 1 1 Jan 1 00:00:00 2025
+latch-up tap distance
+p 1 2
+0 0
+1 1
+"""
+
+CALIBRE_SUMMARY = """--- RULECHECK RESULTS STATISTICS
+RULECHECK M2.W.1 ..................... TOTAL Result Count = 120 (120)
+RULECHECK M2.S.3 ..................... TOTAL Result Count = 45 (45)
+RULECHECK PO.S.2 ..................... TOTAL Result Count = 7 (7)
+RULECHECK M1.A.1 ..................... TOTAL Result Count = 0 (0)
+"""
+
+ICV_SUMMARY = """ICV summary for TOP
+M5.S.1: Metal5 spacing < 0.08 ........... 30 violations found.
+ANT.M3.R: antenna ratio exceeds limit ... 4 violations found.
+V2.EN.1: via2 enclosure ................ 1 violation found.
+"""
+
+PT_TIMING = """****************************************
+Report : timing
+****************************************
+  Startpoint: u_core/a_reg (rising edge-triggered flip-flop clocked by clk)
+  Endpoint: u_core/b_reg (rising edge-triggered flip-flop clocked by clk)
+  Path Group: clk
+  Path Type: max
+
+  Point                                    Incr       Path
+  -----------------------------------------------------------
+  u_core/b_reg/D (DFF)                     0.02       1.20 r
+  data arrival time                                   1.20
+  library setup time                      -0.05       0.95
+  data required time                                  0.95
+  -----------------------------------------------------------
+  slack (VIOLATED)                                   -0.25
+
+  Startpoint: u_io/in_reg
+  Endpoint: u_io/out_reg (rising edge-triggered flip-flop clocked by io_clk)
+  Path Group: io_clk
+  Path Type: min
+
+  library hold time                        0.02       0.05
+  slack (MET)                                         0.10
+
+  Startpoint: rst_n (input port)
+  Endpoint: u_core/c_reg (recovery check against rising-edge clock clk)
+  Path Group: **async_default**
+  Path Type: max
+
+  library recovery time                    0.10       0.90
+  slack (VIOLATED)                                   -0.70
+"""
+
+TEMPUS_TIMING = """Path 1: VIOLATED Setup Check with Pin u_x/q_reg/CK
+Endpoint:   u_x/q_reg/D (v) checked with  leading edge of 'clk'
+Path Groups: {reg2reg}
+= Slack Time                  -321
+Path 2: VIOLATED Hold Check with Pin u_y/q_reg/CK
+Endpoint:   u_y/q_reg/D (^) checked with  leading edge of 'clk'
+= Slack Time                   -11
+"""
+
+PT_CONSTRAINT = """max_delay/setup ('clk' group)
+
+                             Required        Actual
+  Endpoint                   Path Delay      Path Delay      Slack
+  -----------------------------------------------------------------
+  u_a/d_reg/D                  1.00           1.60 r        -0.60  (VIOLATED)
+  u_a/e_reg/D                  1.00           1.10 f        -0.10  (VIOLATED)
+  u_a/d_reg/D                  1.00           1.05 f        -0.05  (VIOLATED)
+
+min_delay/hold ('clk2' group)
+
+  u_b/q_reg/D                  0.05           0.01 r        -0.04  (VIOLATED)
+
+max_transition
+
+                             Required        Actual
+  Pin Name                   Transition      Transition      Slack
+  -----------------------------------------------------------------
+  u_c/n1                        0.20            0.35          -0.15 (VIOLATED)
+"""
+
+
+def test_classify_rule_names():
+    assert classify("M1.S.1") == ("spacing", "M1")
+    assert classify("VIA1.EN.2") == ("enclosure", "VIA1")
+    assert classify("RULE_M3_SPACING") == ("spacing", "M3")
+    assert classify("M1.A.1") == ("unclassified", "M1")
+    assert classify("CHK_7", "minimum width of poly") == ("width", "CHK")
+
+
+def test_parse_calibre_results_database():
+    report = parse_drc_report(CALIBRE_DB.splitlines(True))
+    assert report.format == "calibre-db"
+    counts = {name: (rule.error_type, rule.layer, rule.count) for name, rule in report.rules.items()}
+    assert counts == {
+        "M1.S.1": ("spacing", "M1", 2),
+        # Original count (3) is used even though only one result was written.
+        "VIA1.EN.2": ("enclosure", "VIA1", 3),
+        "DENSITY_M3_LOW": ("density", "M3", 0),
+        "CHK_LATCHUP": ("unclassified", "CHK", 1),
+    }
+    assert report.rules["VIA1.EN.2"].description == "VIA1 enclosure by M2 < 0.01 um on two opposite sides"
+
+
+def test_parse_summaries():
+    calibre = parse_drc_report(CALIBRE_SUMMARY.splitlines(True))
+    assert calibre.format == "calibre-summary"
+    assert [(t, n) for t, n, _ in calibre.by_type()] == [("width", 120), ("spacing", 52)]
+    icv = parse_drc_report(ICV_SUMMARY.splitlines(True))
+    assert icv.format == "icv-summary"
+    assert {n: r.count for n, r in icv.rules.items()} == {"M5.S.1": 30, "ANT.M3.R": 4, "V2.EN.1": 1}
+    assert icv.rules["ANT.M3.R"].error_type == "antenna"
+
+
+@pytest.mark.asyncio
+async def test_drc_report_summary_embeds_guides_for_top_offenders():
+    resp = await drc_report_summary(report_text=CALIBRE_SUMMARY, top_n=2)
+    assert "- 총 위반: 172" in resp
+    assert resp.index("## 1. width: 120건 (M2 120)") < resp.index("## 2. spacing: 52건 (M2 45, PO 7)")
+    assert "### DRC Error Guide: width (upper_metal)" in resp
+    assert "| `M2.W.1` | width | M2 | 120 |" in resp
+    assert len(resp.encode("utf-8")) < 24 * 1024
+
+
+@pytest.mark.asyncio
+async def test_drc_report_summary_input_errors(tmp_path, monkeypatch):
+    assert (await drc_report_summary()).startswith("입력 오류")
+    assert "MCP_REPORT_DIR" in await drc_report_summary(report_path="drc.db")
+    monkeypatch.setenv("MCP_REPORT_DIR", str(tmp_path))
+    assert "MCP_REPORT_DIR" in await drc_report_summary(report_path="../etc/passwd")
+    assert "찾을 수 없습니다" in await drc_report_summary(report_path="missing.db")
+    assert "찾지 못했습니다" in await drc_report_summary(report_text="hello\nworld\n")
+
+
+@pytest.mark.asyncio
+async def test_rewritten_drc_report_is_not_served_from_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("MCP_REPORT_DIR", str(tmp_path))
+    path = tmp_path / "a.rpt"
+    path.write_text(ICV_SUMMARY)
+    first = await registry.call_tool("drc_report_summary", {"report_path": "a.rpt"})
+    assert first == await registry.call_tool("drc_report_summary", {"report_path": "a.rpt"})
+    path.write_text(CALIBRE_SUMMARY)
+    second = await registry.call_tool("drc_report_summary", {"report_path": "a.rpt"})
+    assert second != first and "- 총 위반: 172" in second
+
+
+@pytest.mark.asyncio
+async def test_large_gzip_report_streams_with_bounded_memory(tmp_path, monkeypatch):
+    path = tmp_path / "big.db.gz"
+    rules = [f"M{layer}.{code}.{n}" for layer in range(1, 9) for code in ("S", "W", "EN") for n in range(1, 6)]
+    with gzip.open(path, "wt") as fh:
+        fh.write("TOP 1000\n")
+        for rule in rules:
+            fh.write(f"{rule}\n500 500 1 Jan 1 00:00:00 2025\n{rule} check\n")
+            for i in range(500):
+                fh.write(f"p {i + 1} 4\n0 0\n1 0\n1 1\n0 1\n")
+    monkeypatch.setenv("MCP_REPORT_DIR", str(tmp_path))
+
+    tracemalloc.start()
+    try:
+        resp = await drc_report_summary(report_path="big.db.gz")
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert f"- 총 위반: {len(rules) * 500:,}" in resp
+    assert f"{len(rules) * 500 * 5 + len(rules) * 3 + 1:,}줄" in resp
+    assert peak < 4 * 1024 * 1024
+
+
+def test_parse_primetime_timing_paths():
+    report = parse_timing_report(PT_TIMING.splitlines(True))
+    assert report.format == "primetime-timing"
+    assert len(report) == 3
+    stats = {s.check: s for s in report.checks()}
+    assert [s.check for s in report.checks()] == ["recovery", "setup", "hold"]
+    assert (stats["setup"].violations, stats["setup"].wns, stats["setup"].severity) == (1, -0.25, "medium")
+    assert (stats["hold"].violations, stats["hold"].wns) == (0, 0.1)
+    assert stats["recovery"].severity == "critical"
+    assert report.worst("recovery")[0] == (-0.7, "u_core/c_reg", "**async_default**")
+
+
+def test_parse_tempus_timing_in_picoseconds():
+    report = parse_timing_report(TEMPUS_TIMING.splitlines(True), time_unit="ps")
+    assert report.format == "tempus-timing"
+    stats = {s.check: s for s in report.checks()}
+    assert stats["setup"].wns == pytest.approx(-0.321)
+    assert stats["hold"].wns == pytest.approx(-0.011)
+    assert report.worst("setup")[0].endpoint == "u_x/q_reg/D"
+    assert report.worst("setup")[0].group == "reg2reg"
+    assert report.worst("hold")[0].group == "default"
+
+
+def test_parse_constraint_violators():
+    report = parse_timing_report(PT_CONSTRAINT.splitlines(True))
+    assert report.format == "primetime-constraint"
+    setup = report.checks()[0]
+    assert setup.check == "setup"
+    assert (setup.violations, setup.endpoints, setup.wns) == (3, 2, -0.6)
+    assert setup.tns == pytest.approx(-0.75)
+    assert report.groups()[0][:3] == ("clk", "setup", 3)
+    assert ("clk2", "hold") in {row[:2] for row in report.groups()}
+    counts, edges = report.histogram("setup", bins=4)
+    assert counts.tolist() == [1, 0, 0, 2]
+    assert edges[0] == pytest.approx(-0.6) and edges[-1] == 0.0
+
+
+def test_more_than_256_check_types():
+    text = "".join(f"Path {i + 1}: VIOLATED Check{i} Check with Pin u{i}/CK\n= Slack Time -0.{i % 9 + 1}\n" for i in range(300))
+    report = parse_timing_report(text.splitlines(True))
+    assert len(report) == 300 and len(report.checks()) == 300
+    assert report.worst("check299")[0] == (-0.3, "u299/CK", "default")
+    assert report.histogram("check299")[0].sum() == 1
+
+
+def test_severity_thresholds():
+    assert severity("setup", -0.6, 1) == "critical"
+    assert severity("hold", -0.1, 1) == "medium"
+    assert severity("hold", -0.05, 1) == "minor"
+    assert severity("max_transition", -0.01, 1500) == "critical"
+    assert severity("max_fanout", -3, 120) == "medium"
+    assert severity("setup", 0.2, 0) == "minor"
+
+
+@pytest.mark.asyncio
+async def test_timing_report_summary_embeds_guides_by_tns():
+    resp = await timing_report_summary(report_text=PT_CONSTRAINT, top_n=2)
+    assert "| setup | 3 | 3 | -0.600 | -0.750 | 2 | critical |" in resp
+    assert "| clk | setup | 3 | -0.600 | -0.750 |" in resp
+    assert resp.index("## 1. setup: 3건") < resp.index("## 2. max_transition: 1건")
+    assert "### Timing Violation Debug: setup (severity: critical)" in resp
+    assert "`u_a/d_reg/D` -0.600 (clk)" in resp
+    assert "## 3." not in resp
+    assert len(resp.encode("utf-8")) < 24 * 1024
+
+
+@pytest.mark.asyncio
+async def test_timing_report_summary_clean_and_input_errors():
+    clean = PT_TIMING.replace("VIOLATED)                                   -", "MET)                                        ")
+    assert "Timing clean" in await timing_report_summary(report_text=clean)
+    assert (await timing_report_summary()).startswith("입력 오류")
+    assert (await timing_report_summary(report_text=PT_TIMING, time_unit="us")).startswith("입력 오류")
+    assert "MCP_REPORT_DIR" in await timing_report_summary(report_path="sta.rpt")
+    assert "찾지 못했습니다" in await timing_report_summary(report_text="hello\nworld\n")
+
+
+@pytest.mark.asyncio
+async def test_timing_report_parses_off_the_event_loop_and_tracks_rewrites(tmp_path, monkeypatch):
+    import threading
+
+    from src.tools import timing_report
+
+    monkeypatch.setenv("MCP_REPORT_DIR", str(tmp_path))
+    path = tmp_path / "sta.rpt"
+    path.write_text(PT_TIMING)
+    parse = timing_report.parse_timing_report
+    threads = []
+    monkeypatch.setattr(
+        timing_report, "parse_timing_report", lambda *a: threads.append(threading.current_thread()) or parse(*a)
+    )
+    first = await registry.call_tool("timing_report_summary", {"report_path": "sta.rpt"})
+    assert threads and threads[0] is not threading.main_thread()
+    assert first == await registry.call_tool("timing_report_summary", {"report_path": "sta.rpt"}) and len(threads) == 1
+    path.write_text(PT_CONSTRAINT)
+    second = await registry.call_tool("timing_report_summary", {"report_path": "sta.rpt"})
+    assert len(threads) == 2 and "| clk | setup | 3 | -0.600 | -0.750 |" in second
+
+
+@pytest.mark.asyncio
+async def test_large_timing_report_keeps_only_numeric_arrays(tmp_path, monkeypatch):
+    paths = 30_000
+    path = tmp_path / "sta.rpt.gz"
+    with gzip.open(path, "wt") as fh:
+        for i in range(paths):
+            slack = -((i % 1000) + 1) / 1000 if i % 4 else 0.05
+            status = "VIOLATED" if slack < 0 else "MET"
+            fh.write(
+                f"  Startpoint: u_src/r{i}_reg\n  Endpoint: u_dst/r{i % 5000}_reg (rising edge)\n"
+                f"  Path Group: clk{i % 3}\n  Path Type: max\n\n"
+                f"  library setup time   -0.05   0.95\n  slack ({status})   {slack:.3f}\n\n"
+            )
+    monkeypatch.setenv("MCP_REPORT_DIR", str(tmp_path))
+
+    tracemalloc.start()
+    try:
+        resp = await timing_report_summary(report_path="sta.rpt.gz", top_n=1)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    violations = paths - paths // 4
+    assert f"| setup | {paths:,} | {violations:,} | -1.000 |" in resp
+    assert f"path {paths:,}개" in resp
+    # Endpoint strings are not kept per path, only 21 bytes of arrays each.
+    assert peak < 4 * 1024 * 1024
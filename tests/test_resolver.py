@@ -0,0 +1,54 @@
+import pytest
+
+from src.resolver import alias_table, canonical, resolve
+from src.tools import design_rules, methodology, tapeout, timing_debug
+
+
+@pytest.mark.parametrize("raw", ["5nm", "5NM", "5 nm", "N5", "n5", "5"])
+def test_node_spellings_resolve_to_canonical(raw):
+    assert resolve("node", raw) == "5nm"
+
+
+def test_node_units_and_unknowns():
+    assert resolve("node", "0.18um") == "180nm"
+    assert resolve("node", "abc") is None
+    assert canonical("node", " abc ") == "abc"
+
+
+@pytest.mark.parametrize(
+    "domain, raw, key",
+    [
+        ("design_type", "Mixed-Signal", "mixed_signal"),
+        ("design_type", "mixed signal", "mixed_signal"),
+        ("checklist_category", "DRC/LVS", "drc_lvs"),
+        ("timing_violation", "Max Transition", "max_transition"),
+        ("drc_error", "Spacing", "spacing"),
+        ("foundry", "tsmc", "TSMC"),
+        ("methodology_topic", "CTS", "clock_tree"),
+        ("process_class", "5nm", "advanced"),
+        ("process_class", "N28", "mature"),
+        ("process_class", "adv", "advanced"),
+    ],
+)
+def test_domain_aliases(domain, raw, key):
+    assert resolve(domain, raw) == key
+
+
+def test_alias_tables_cover_knowledge_keys():
+    assert alias_table("design_type")["mixedsignal"] == "mixed_signal"
+    assert alias_table("communication_type")["drcwaiverrequest"] == "drc_waiver_request"
+
+
+@pytest.mark.asyncio
+async def test_tools_accept_alias_spellings():
+    resp = await design_rules.design_rule_qa("N5", "Metal", "min spacing?")
+    assert "Design Rule" in resp
+    assert "Min spacing" in resp
+
+    resp = await tapeout.tapeout_checklist("Mixed-Signal", "28nm", "DRC/LVS")
+    assert "- [ ]" in resp
+
+    resp = await methodology.design_methodology_guide("Clock Tree", "5nm")
+    assert "(advanced)" in resp
+
+    assert "Timing Violation Debug" in timing_debug.timing_violation_debug("Max Transition", "HIGH")
@@ -0,0 +1,64 @@
+import pytest
+
+from src.data import knowledge, snapshot
+from src.data.snapshot import KnowledgeSnapshot, SnapshotError
+from src.tools import acronym, drc_debug, terminology
+
+
+@pytest.fixture
+def snap(tmp_path):
+    path = snapshot.write_snapshot(tmp_path / "kb.snapshot")
+    snap = KnowledgeSnapshot(path)
+    knowledge.use_snapshot(snap)
+    yield snap
+    knowledge.use_snapshot(None)
+
+
+def test_snapshot_round_trips_every_knowledge_base(snap):
+    sources = snapshot._load_sources()
+    assert snap.names() == list(sources)
+    for name, base in sources.items():
+        mapped = snap.base(name)
+        assert len(mapped) == len(base)
+        assert list(mapped) == list(base)
+        assert dict(mapped.items()) == base
+    assert "NOPE" not in snap.base("SEMICONDUCTOR_ACRONYMS")
+    assert snap.is_current()
+
+
+def test_snapshot_interns_repeated_strings():
+    data = {"A": {"k": ["x", "x", "x"]}, "B": {"k": ["x"]}}
+    blob = snapshot.build_snapshot({"BASE": data})
+    assert blob.count(b"x") == 1
+
+
+@pytest.mark.asyncio
+async def test_tools_serve_from_snapshot(snap):
+    assert isinstance(knowledge.get_knowledge("FOUNDRY_TERMINOLOGY"), snapshot.SnapshotMapping)
+    assert "Poly on Diffusion Edge" in await terminology.explain_foundry_term("PODE")
+    assert "Design Rule Check" in acronym.acronym_decoder("drc")
+    assert "Resolution steps" in drc_debug.drc_error_guide("spacing", "M1")
+
+
+def test_corrupt_snapshot_is_rejected(tmp_path):
+    path = tmp_path / "bad.snapshot"
+    path.write_bytes(b"XXXX" + b"\0" * 100)
+    with pytest.raises(SnapshotError):
+        KnowledgeSnapshot(path)
+
+
+@pytest.mark.parametrize("problem", ["corrupt", "stale"])
+def test_unusable_snapshot_is_reported_on_stderr(tmp_path, monkeypatch, capsys, problem):
+    path = tmp_path / "kb.snapshot"
+    if problem == "corrupt":
+        path.write_bytes(b"XXXX" + b"\0" * 100)
+    else:
+        snapshot.write_snapshot(path)
+        monkeypatch.setattr(snapshot, "source_fingerprint", lambda: b"edited sources")
+    monkeypatch.setenv("MCP_KNOWLEDGE_SNAPSHOT", str(path))
+    monkeypatch.setattr(knowledge, "_SNAPSHOT_CHECKED", False)
+    monkeypatch.setattr(knowledge, "_SNAPSHOT", None)
+    assert knowledge._snapshot() is None
+    out, err = capsys.readouterr()
+    # stdout is the JSON-RPC channel of the stdio transport.
+    assert out == "" and ("ignored" if problem == "corrupt" else "is stale") in err
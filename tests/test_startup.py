@@ -0,0 +1,72 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+
+from src import server, startup
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture
+def fresh_report():
+    saved = startup.summary()
+    startup.reset()
+    yield
+    startup.reset()
+    for entry in saved["phases"]:
+        startup.record(entry["phase"], entry["ms"] / 1000, entry["modules"], entry["note"])
+
+
+def test_report_merges_repeated_phases(fresh_report, capsys):
+    with startup.phase("import"):
+        import json  # noqa: F401
+    startup.record("import", 0.002, 3)
+    startup.record("warmup", 0.0, note="lazy (first tools/call)")
+    text = startup.report("stdio")
+
+    info = startup.summary()
+    assert info["mode"] == "stdio" and [p["phase"] for p in info["phases"]] == ["import", "warmup"]
+    assert info["phases"][0]["ms"] >= 2.0 and info["phases"][0]["modules"] >= 3
+    assert text.startswith("design-foundry-mcp startup (stdio):") and "lazy (first tools/call)" in text
+    assert capsys.readouterr().err.strip() == text
+
+
+@pytest.mark.asyncio
+async def test_status_endpoint_includes_startup_report():
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=server.app), base_url="http://test") as client:
+        info = (await client.get("/")).json()["startup"]
+    assert {"registry", "import", "server"} <= {p["phase"] for p in info["phases"]}
+
+
+def test_stdio_transport_does_not_load_the_http_stack():
+    code = "import sys, src.server, src.stdio; print(sorted(m for m in ('fastmcp', 'src.http_app') if m in sys.modules))"
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True).stdout
+    assert out.strip() == "[]"
+
+
+@pytest.mark.asyncio
+async def test_stdio_transport_lists_and_calls_tools(tmp_path):
+    from src import registry
+
+    params = StdioServerParameters(
+        command=sys.executable, args=["-m", "src.server"], env={**os.environ, "MCP_TRANSPORT": "stdio"}, cwd=str(ROOT)
+    )
+    with open(tmp_path / "stderr.txt", "w") as errlog:
+        async with stdio_client(params, errlog=errlog) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                tools = (await session.list_tools()).tools
+                ok = await session.call_tool("acronym_decoder", {"acronym": "DRC"})
+                bad = await session.call_tool("acronym_decoder", {})
+
+    assert [tool.name for tool in tools] == list(registry.REGISTRY)
+    assert not ok.isError and ok.content[0].text == await registry.call_tool("acronym_decoder", {"acronym": "DRC"})
+    assert bad.isError and "acronym" in bad.content[0].text
+    report = (tmp_path / "stderr.txt").read_text()
+    assert "design-foundry-mcp startup (stdio):" in report and "lazy (first tools/call)" in report
@@ -0,0 +1,133 @@
+import json
+
+import pytest
+
+from src import reload, workers
+from src.data import knowledge, store
+from src.data.store import SqliteStore, StoreError
+from src.search.fuzzy import FuzzyIndex
+from src.tools import acronym, design_rules, extract, search, terminology
+
+
+def _shipped():
+    return {name: knowledge.builtin_knowledge(name) for name in store.STORE_BASES}
+
+
+def _use(kb):
+    knowledge.use_store(kb)
+    reload.invalidate(list(store.STORE_BASES))
+
+
+@pytest.fixture
+def sqlite_store(tmp_path):
+    kb = SqliteStore(store.build_store(tmp_path / "kb.db", _shipped()))
+    _use(kb)
+    yield kb
+    _use(None)
+
+
+def test_store_round_trips_bases_in_source_order(sqlite_store):
+    for name, base in _shipped().items():
+        stored = sqlite_store.base(name)
+        assert len(stored) == len(base)
+        assert list(stored) == list(base)
+        assert dict(stored.items()) == base
+    terms = sqlite_store.base("FOUNDRY_TERMINOLOGY")
+    assert "NOPE" not in terms and 1 not in terms
+    with pytest.raises(KeyError):
+        terms["NOPE"]
+    assert sqlite_store.version == store.content_version(_shipped())
+
+
+@pytest.mark.asyncio
+async def test_tools_serve_from_store_with_same_answers(sqlite_store):
+    queries = ["DRX", "OPCX", "pode", "metal fil", "antena ratio", "C-PODE"]
+
+    def lookups():
+        return [acronym._lookup(q) if q.isupper() else terminology._lookup(q) for q in queries]
+
+    from_store = lookups()
+    _use(None)
+    assert lookups() == from_store
+    _use(sqlite_store)
+
+    assert isinstance(knowledge.get_knowledge("FOUNDRY_TERMINOLOGY"), store.StoreMapping)
+    assert terminology._term_index() is None and acronym._acronym_index() is None
+    assert "Poly on Diffusion Edge" in await terminology.explain_foundry_term("poly on diffusion edg")
+    assert "Design Rule Check" in acronym.acronym_decoder("drc")
+    assert "### Design Rule: 5nm / metal" in await design_rules.design_rule_qa("5nm", "metal", "spacing?")
+    # Bases the store does not hold still come from the dict backend.
+    assert isinstance(knowledge.get_knowledge("TEMPLATES"), dict)
+
+
+@pytest.mark.asyncio
+async def test_search_and_preload_leave_store_catalogs_on_disk(sqlite_store, monkeypatch):
+    sources = {doc.source for doc in search._index().payloads}
+    assert "terminology" not in sources and "acronyms" not in sources and "design_rules" in sources
+
+    text = await search.search_foundry_knowledge("poly on diffusion edge", 3)
+    assert "**1. PODE — Poly on Diffusion Edge** (terminology" in text
+    assert '`explain_foundry_term` {"term": "PODE"}' in text
+    assert "`acronym_decoder` {\"acronym\": \"OPC\"}" in await search.search_foundry_knowledge("OPC", 3)
+
+    def full_scan():
+        raise AssertionError("preload decoded a store-backed catalog")
+
+    monkeypatch.setattr(extract, "_matcher", full_scan)
+    workers.preload()
+
+
+def test_candidates_scale_to_a_large_catalog(tmp_path):
+    terms = {
+        f"T{i}": {"full_name": f"Term {i} Layer {i % 97} Rule", "description": "d", "related_terms": [f"alias{i}"]}
+        for i in range(5000)
+    }
+    base = SqliteStore(store.build_store(tmp_path / "big.db", {"FOUNDRY_TERMINOLOGY": terms})).base(
+        "FOUNDRY_TERMINOLOGY"
+    )
+    aliases, hints = base.candidates("Term 4321 Layer 53 Rul")
+    assert len(aliases) + len(hints) <= store.CANDIDATES
+    assert FuzzyIndex(aliases, hints).resolve("Term 4321 Layer 53 Rul")[0] == "T4321"
+    # Exact alias hits skip the full-text query.
+    assert base.candidates("term 17 layer 17 rule") == ([("Term 17 Layer 17 Rule", "T17")], [])
+    assert FuzzyIndex(*base.candidates("alias432")).search("alias432")[0].key == "T432"
+
+
+def test_store_from_knowledge_dir_and_env_selection(tmp_path, monkeypatch, capsys):
+    glossary = {"ZQFILL": {"full_name": "Zebra Quilt Fill", "description": "External glossary term."}}
+    (tmp_path / "kb").mkdir()
+    (tmp_path / "kb" / "FOUNDRY_TERMINOLOGY.json").write_text(json.dumps(glossary), encoding="utf-8")
+    store.main([str(tmp_path / "kb.db"), str(tmp_path / "kb")])
+    assert "FOUNDRY_TERMINOLOGY 1" in capsys.readouterr().out
+
+    before = knowledge.knowledge_version()
+    monkeypatch.setenv("MCP_KNOWLEDGE_STORE", f"sqlite:{tmp_path / 'kb.db'}")
+    _use(None)
+    monkeypatch.setattr(knowledge, "_STORE_CHECKED", False)
+    try:
+        assert list(knowledge.get_knowledge("FOUNDRY_TERMINOLOGY")) == ["ZQFILL"]
+        assert terminology._lookup("zebra quilt fil")[0] == "ZQFILL"
+        assert knowledge.knowledge_version() != before
+    finally:
+        _use(None)
+    assert knowledge.knowledge_version() == before
+
+
+@pytest.mark.parametrize("setting", ["bogus", "sqlite:{tmp}/missing.db"])
+def test_unusable_store_setting_is_reported_on_stderr(tmp_path, monkeypatch, capsys, setting):
+    monkeypatch.setenv("MCP_KNOWLEDGE_STORE", setting.format(tmp=tmp_path))
+    monkeypatch.setattr(knowledge, "_STORE_CHECKED", False)
+    monkeypatch.setattr(knowledge, "_STORE", None)
+    assert knowledge._store() is None
+    out, err = capsys.readouterr()
+    # stdout is the JSON-RPC channel of the stdio transport.
+    assert out == "" and "knowledge store" in err
+
+
+def test_bad_store_is_rejected(tmp_path):
+    with pytest.raises(StoreError):
+        SqliteStore(tmp_path / "missing.db")
+    path = tmp_path / "bad.db"
+    path.write_bytes(b"not a database" * 100)
+    with pytest.raises(StoreError):
+        SqliteStore(path)
@@ -0,0 +1,100 @@
+import json
+
+import httpx
+import pytest
+from mcp import ClientSession
+from mcp.client.streamable_http import streamablehttp_client
+
+from src.server import app
+
+SSE_ACCEPT = {"Accept": "application/json, text/event-stream"}
+
+
+def _client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+def _sse_messages(body: str):
+    return [json.loads(line[len("data: "):]) for line in body.splitlines() if line.startswith("data: ")]
+
+
+@pytest.mark.asyncio
+async def test_mcp_post_returns_json_without_session():
+    async with _client() as client:
+        resp = await client.post(
+            "/mcp",
+            json={"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {"protocolVersion": "2025-03-26"}},
+            headers={"Accept": "application/json"},
+        )
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/json")
+    assert "mcp-session-id" not in resp.headers
+    assert resp.json()["result"]["protocolVersion"] == "2025-03-26"
+
+
+@pytest.mark.asyncio
+async def test_mcp_streams_batch_as_sse_events():
+    batch = [
+        {"jsonrpc": "2.0", "id": i, "method": "tools/call", "params": {"name": "acronym_decoder", "arguments": {"acronym": a}}}
+        for i, a in enumerate(["DRC", "LVS", "OPC"])
+    ]
+    async with _client() as client:
+        resp = await client.post("/mcp", json=batch, headers=SSE_ACCEPT)
+    assert resp.headers["content-type"].startswith("text/event-stream")
+    messages = _sse_messages(resp.text)
+    assert sorted(m["id"] for m in messages) == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_mcp_notifications_are_accepted_and_get_is_not_allowed():
+    async with _client() as client:
+        resp = await client.post("/mcp", json={"jsonrpc": "2.0", "method": "notifications/initialized"}, headers=SSE_ACCEPT)
+        assert resp.status_code == 202
+        assert resp.content == b""
+        assert (await client.get("/mcp")).status_code == 405
+
+
+@pytest.mark.asyncio
+async def test_mcp_internal_errors_become_jsonrpc_errors(monkeypatch):
+    from api import mcp_handler
+
+    async def broken(payload):
+        raise RuntimeError("session manager down")
+
+    async def broken_stream(payload):
+        yield {"jsonrpc": "2.0", "id": 0, "result": {}}
+        raise RuntimeError("stream broke")
+
+    monkeypatch.setattr(mcp_handler, "dispatch_payload_async", broken)
+    monkeypatch.setattr(mcp_handler, "iter_payload_async", broken_stream)
+    request = {"jsonrpc": "2.0", "id": 7, "method": "tools/list"}
+    async with _client() as client:
+        plain = await client.post("/mcp", json=request, headers={"Accept": "application/json"})
+        streamed = await client.post("/mcp", json=[request], headers=SSE_ACCEPT)
+    assert plain.status_code == 500
+    assert plain.json() == {"jsonrpc": "2.0", "id": 7, "error": {"code": -32603, "message": "session manager down"}}
+    messages = _sse_messages(streamed.text)
+    assert messages[0]["id"] == 0 and messages[-1]["error"] == {"code": -32603, "message": "stream broke"}
+
+
+@pytest.mark.asyncio
+async def test_mcp_endpoint_works_with_official_streamable_http_client():
+    def factory(headers=None, timeout=None, auth=None):
+        return httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test", headers=headers, timeout=timeout, auth=auth
+        )
+
+    async with streamablehttp_client("http://test/mcp", httpx_client_factory=factory) as (read, write, _):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            tools = await session.list_tools()
+            assert "design_rule_qa" in {tool.name for tool in tools.tools}
+            result = await session.call_tool("acronym_decoder", {"acronym": "DRC"})
+            assert "Design Rule Check" in result.content[0].text
+
+
+@pytest.mark.asyncio
+async def test_legacy_sse_message_endpoint_answers_unknown_session():
+    async with _client() as client:
+        resp = await client.post("/messages/?session_id=" + "0" * 32, json={"jsonrpc": "2.0", "id": 1, "method": "ping"})
+    assert resp.status_code == 404
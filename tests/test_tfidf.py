@@ -0,0 +1,40 @@
+from src.search.tfidf import TfidfMatrix
+
+
+def test_rank_orders_rows_by_cosine_similarity():
+    matrix = TfidfMatrix(["metal spacing rule", "via enclosure", "metal density fill", "게이트 산화막"])
+    ranked = matrix.rank("metal fill")
+    assert [offset for offset, _ in ranked][:2] == [2, 0]
+    assert ranked[-1][1] == 0.0
+
+    # Scores restricted to a row range are offsets within that range.
+    assert matrix.rank("산화막", slice(2, 4))[0][0] == 1
+
+
+def test_unknown_query_scores_zero_in_stable_order():
+    matrix = TfidfMatrix(["a b", "c d"])
+    assert matrix.rank("zzz") == [(0, 0.0), (1, 0.0)]
+
+
+def test_matrix_is_stored_sparse_and_matches_dense_cosine():
+    import math
+
+    import numpy as np
+
+    texts = ["metal spacing rule metal", "via enclosure", "metal density fill", "", "via via spacing"]
+    matrix = TfidfMatrix(texts)
+    # One stored value per distinct (fact, term) pair, never n_docs x vocab.
+    assert len(matrix.values) == len(matrix.row_idx) == 10 and len(matrix.col_ptr) == len(matrix.vocab) + 1
+
+    def vector(text):
+        vec = np.zeros(len(matrix.vocab))
+        for token in text.split():
+            if token in matrix.vocab:
+                vec[matrix.vocab[token]] = 1.0 + math.log(text.split().count(token))
+        vec *= matrix.idf
+        return vec / (np.linalg.norm(vec) or 1.0)
+
+    dense = np.array([vector(text) for text in texts])
+    query = "metal via spacing"
+    assert np.allclose(matrix.scores(query), dense @ vector(query), atol=1e-6)
+    assert np.allclose(matrix.scores(query, slice(1, 4)), (dense @ vector(query))[1:4], atol=1e-6)
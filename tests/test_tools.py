@@ -12,6 +12,7 @@ from src.tools import (
     drc_debug,
     timing_debug,
     acronym,
+    search,
 )
 
 
@@ -33,6 +34,29 @@ async def test_design_rule_qa_supported_node_category():
     assert "min" in resp.lower()
 
 
+@pytest.mark.asyncio
+async def test_design_rule_qa_ranks_facts_by_question():
+    resp = await design_rules.design_rule_qa("5nm", "antenna", "안테나 다이오드 활용")
+    assert resp.index("안테나 다이오드") < resp.index("partial ratio")
+
+    resp = await design_rules.design_rule_qa("5nm", "metal", "안테나 다이오드", include_related=True)
+    assert "Related (other categories)" in resp
+    assert "[antenna]" in resp
+
+
+@pytest.mark.asyncio
+async def test_design_rule_qa_extrapolates_from_bracketing_nodes():
+    resp = await design_rules.design_rule_qa("7nm", "metal", "min spacing?")
+    assert "EXTRAPOLATED" in resp
+    assert "### Design Rule: 5nm / metal" in resp
+    assert "### Design Rule: 28nm / metal" in resp
+
+    # Below the smallest registered node only the nearest one applies.
+    resp = await design_rules.design_rule_qa("N3", "antenna", "?")
+    assert "### Design Rule: 5nm / antenna" in resp
+    assert "28nm" not in resp
+
+
 @pytest.mark.asyncio
 async def test_design_rule_qa_unsupported_node():
     resp = await design_rules.design_rule_qa(
@@ -104,6 +128,50 @@ async def test_communication_template_waiver():
     assert "Proj" in resp
 
 
+@pytest.mark.asyncio
+async def test_communication_template_renders_like_str_format():
+    context = {"project_name": "Proj", "rule_id": 7, "sender": "PD"}
+    for name, text in communication.get_knowledge("TEMPLATES").items():
+        expected = text.format(**{**communication._DEFAULTS, **context})
+        assert await communication.foundry_communication_template(name, context) == expected
+
+
+@pytest.mark.asyncio
+async def test_communication_template_batch_from_csv():
+    rows = "rule_id,location,issue_description,rule_name\n" + "".join(
+        f'M1.S.{i},"u_top/blk{i} (10,20)",dummy fill,x\n' for i in range(3)
+    )
+    resp = await communication.foundry_communication_template_batch(
+        "DRC Waiver Request",
+        contexts_csv=rows + "M1.S.0,\"u_top/blk0 (10,20)\",dummy fill,x\nM2.W.1,,,\n",
+        defaults={"project_name": "Alpha", "process": "N5", "sender": "PD"},
+    )
+    assert "- 항목: 4개 (중복 1개 제외)" in resp
+    assert resp.count("Subject: [Waiver] Alpha - N5 DRC Waiver Request") == 4
+    assert "- Location / Instance: u_top/blk2 (10,20)" in resp
+    # Reported once for the whole batch, with counts.
+    assert resp.count("rule_name") == 1 and "`rule_name` 3건" in resp
+    assert "`issue_description` 1건, `location` 1건" in resp
+
+
+@pytest.mark.asyncio
+async def test_communication_template_batch_pages_and_input_errors():
+    contexts = [{"rule_id": f"M{i % 9}.S.{i}", "location": f"({i},{i})"} for i in range(120)]
+    pages = [await communication.foundry_communication_template_batch("drc_waiver_request", contexts)]
+    while 'cursor: "' in pages[-1]:
+        assert len(pages[-1].encode("utf-8")) < 24 * 1024
+        cursor = pages[-1].rsplit('cursor: "', 1)[1].split('"', 1)[0]
+        pages.append(await communication.foundry_communication_template_batch("drc_waiver_request", contexts, cursor=cursor))
+    assert len(pages) > 1
+    assert sum(page.count("Subject: [Waiver]") for page in pages) == 120
+
+    batch = communication.foundry_communication_template_batch
+    assert (await batch("drc_waiver_request")).startswith("입력 오류")
+    assert (await batch("drc_waiver_request", [{"a": 1}], contexts_csv="a\n1")).startswith("입력 오류")
+    assert (await batch("drc_waiver_request", ["M1.S.1"])).startswith("입력 오류")
+    assert "지원하지 않는" in await batch("memo", [{}])
+
+
 @pytest.mark.asyncio
 async def test_communication_template_invalid_type():
     resp = await communication.foundry_communication_template("unknown", {})
@@ -141,6 +209,22 @@ def test_acronym_decoder():
     assert "Design Rule Check" in result
 
 
+@pytest.mark.asyncio
+async def test_search_foundry_knowledge_points_to_next_tool():
+    resp = await search.search_foundry_knowledge("metal spacing 간격", top_k=3)
+    assert "Foundry Knowledge Search" in resp
+    assert '`drc_error_guide` {"error_type": "spacing"}' in resp
+
+    resp = await search.search_foundry_knowledge("hold violation")
+    assert "timing_violation_debug" in resp
+
+
+@pytest.mark.asyncio
+async def test_search_foundry_knowledge_no_hits():
+    resp = await search.search_foundry_knowledge("zzqqxx")
+    assert "찾지 못했습니다" in resp
+
+
 MAX_BYTES = 24_576
 
 
@@ -167,9 +251,82 @@ async def test_tool_responses_size_and_markdown():
         drc_debug.drc_error_guide("width", "M1", ""),
         timing_debug.timing_violation_debug("hold", "minor", ""),
         acronym.acronym_decoder("PDK", "foundry"),
+        await search.search_foundry_knowledge("clock skew", top_k=20),
     ]
 
     for resp in responses:
         _basic_markdown_check(resp)
 
 
+
+
+def test_acronym_decoder_batch_dedupes_and_matches_single_calls():
+    resp = acronym.acronym_decoder_batch(["DRC", "drc", " LVS ", "XYZQ", "OPC", "DRC"], context="design")
+    assert "- 항목: 4개 (중복 2개 제외)" in resp
+    assert "- 미등록: 1개" in resp
+    assert resp.count("### Acronym Decoder: DRC") == 1
+    assert acronym.acronym_decoder("OPC", context="design") in resp
+    assert "등록되지 않은 약어입니다: `XYZQ`" in resp
+    assert "cursor" not in resp
+
+
+def test_acronym_decoder_batch_pages_with_cursor():
+    inputs = list(acronym.get_knowledge("SEMICONDUCTOR_ACRONYMS")) + [f"QZ{i}" for i in range(150)]
+    pages = [acronym.acronym_decoder_batch(inputs)]
+    while 'cursor: "' in pages[-1]:
+        assert len(pages[-1].encode("utf-8")) < 24 * 1024
+        cursor = pages[-1].rsplit('cursor: "', 1)[1].split('"', 1)[0]
+        pages.append(acronym.acronym_decoder_batch(inputs, cursor=cursor))
+    assert len(pages) > 1
+    combined = "\n".join(pages)
+    assert combined.count("### Acronym Decoder: DRC") == 1
+    assert all(f"`QZ{i}`" in combined for i in range(150))
+    assert "cursor가 요청 목록과 일치하지 않습니다" in acronym.acronym_decoder_batch(["DRC"], cursor=cursor)
+
+
+@pytest.mark.asyncio
+async def test_explain_foundry_term_batch():
+    resp = await terminology.explain_foundry_term_batch(["PODE", "pode", "metal fill"], context="N5 block")
+    assert "(중복 1개 제외)" in resp
+    assert "### " in resp and "(PODE)" in resp
+    assert "- Given context: N5 block" in resp
+    assert await terminology.explain_foundry_term_batch([]) == "입력 오류: terms는 비어 있지 않은 목록이어야 합니다."
+
+
+def test_drc_and_timing_batches_resolve_aliases_once():
+    drc = drc_debug.drc_error_guide_batch(["spacing", "space", "width", "bogus"], layer="M1")
+    assert drc.count("### DRC Error Guide:") == 2
+    assert "지원하지 않는 유형: `bogus`" in drc
+    assert drc_debug.drc_error_guide("width", layer="M1") in drc
+    timing = timing_debug.timing_violation_debug_batch(["maxtran", "slew", "hold"], severity="high")
+    assert timing.count("### Timing Violation Debug:") == 2
+    assert "(severity: critical)" in timing
+    assert timing_debug.timing_violation_debug_batch(["nope"]).startswith("지원하지 않는 timing violation 유형입니다")
+
+
+def test_extract_foundry_terms_groups_by_category():
+    from src.tools import extract
+
+    text = "We ate lunch. DRC를 돌린 뒤 LVS 확인, Design Rule Check 재실행; metal fill 추가 후 OPC 검토. ATE slot 예약."
+    resp = extract.extract_foundry_terms(text, context="design")
+    assert "- 항목: 5개" in resp
+    design = resp.index("## design (3회)")
+    assert design < resp.index("### Acronym Decoder: DRC") < resp.index("## foundry")
+    assert "- Occurrences: 2" in resp  # DRC plus its full name
+    assert "## test (1회)" in resp  # ATE, but not "ate"
+    assert "(Metal Fill)" in resp
+    assert acronym.acronym_decoder("OPC", context="design") in resp
+    assert extract.extract_foundry_terms("nothing relevant").startswith("문서(16자)에서 등록된 약어/용어를 찾지 못했습니다")
+
+
+def test_extract_foundry_terms_scans_large_documents_quickly():
+    import time
+
+    from src.tools import extract
+
+    text = ("STA 결과 WNS/TNS 확인 후 CTS 재수행, metal fill 밀도 점검. " * 20000)[: 1024 * 1024]
+    extract._matcher()
+    start = time.perf_counter()
+    resp = extract.extract_foundry_terms(text)
+    assert time.perf_counter() - start < 2.0
+    assert "- Occurrences: 20000" in resp
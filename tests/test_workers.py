@@ -0,0 +1,77 @@
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+
+from src import workers
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_worker_count_parsing():
+    assert workers.worker_count(None) == 1
+    assert workers.worker_count("4") == 4
+    assert workers.worker_count("0") == 1
+    assert workers.worker_count("many") == 1
+    assert workers.worker_count("auto") == workers.available_cpus() <= (os.cpu_count() or 1)
+
+
+def test_auto_workers_respect_affinity_and_cgroup_quota(tmp_path, monkeypatch):
+    cpu_max = tmp_path / "cpu.max"
+    monkeypatch.setattr(workers, "CGROUP_CPU_MAX", str(cpu_max))
+    monkeypatch.setattr(workers, "CGROUP_V1_QUOTA", (str(tmp_path / "quota"), str(tmp_path / "period")))
+    monkeypatch.setattr(os, "sched_getaffinity", lambda pid: set(range(64)), raising=False)
+    assert workers.worker_count("auto") == 64
+    cpu_max.write_text("max 100000\n")
+    assert workers.worker_count("auto") == 64
+    cpu_max.write_text("150000 100000\n")
+    assert workers.worker_count("auto") == 2
+    cpu_max.unlink()
+    (tmp_path / "quota").write_text("50000\n")
+    (tmp_path / "period").write_text("100000\n")
+    assert workers.worker_count("auto") == 1
+    monkeypatch.setattr(os, "sched_getaffinity", lambda pid: {0, 1, 2}, raising=False)
+    (tmp_path / "quota").write_text("-1\n")
+    assert workers.worker_count("auto") == 3
+
+
+def test_preload_builds_every_index():
+    workers.preload()
+    for target in workers.PRELOAD_TARGETS:
+        module, func = target.split(":")
+        assert getattr(sys.modules[module], func).cache_info().currsize == 1
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="pre-fork mode needs os.fork")
+def test_prefork_workers_share_one_socket():
+    port = _free_port()
+    env = {**os.environ, "MCP_WORKERS": "2", "FASTMCP_HOST": "127.0.0.1", "FASTMCP_PORT": str(port)}
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "src.server"], cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        deadline = time.monotonic() + 30
+        while True:
+            try:
+                assert httpx.get(f"http://127.0.0.1:{port}/health").json() == {"status": "ok"}
+                break
+            except httpx.TransportError:
+                assert time.monotonic() < deadline, "workers did not start"
+                time.sleep(0.2)
+        children = subprocess.run(["ps", "-o", "pid=", "--ppid", str(proc.pid)], capture_output=True, text=True)
+        assert len(children.stdout.split()) == 2
+    finally:
+        proc.send_signal(signal.SIGTERM)
+        assert proc.wait(timeout=15) == 0